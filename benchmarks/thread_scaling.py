@@ -0,0 +1,73 @@
+"""Stress benchmark for comparisons running concurrently in multiple threads.
+
+On a free-threaded build of CPython, e.g. 3.13t, the throughput is expected to scale with the number of threads up to
+the number of cores. With the GIL enabled, it stays roughly constant.
+
+    python benchmarks/thread_scaling.py --pairs 20000 --repeats 64
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+
+import compyre
+
+
+def make_value(num_pairs: int) -> dict:
+    """Create a nested value with roughly `num_pairs` leaves of builtin types."""
+    return {
+        f"group{i}": [i, float(i), str(i), {"flag": bool(i % 2), "items": [i, i + 1]}]
+        for i in range(num_pairs // 6)
+    }
+
+
+def run(num_threads: int, *, repeats: int, actual: dict, expected: dict) -> float:
+    """Run `repeats` comparisons distributed over `num_threads` threads and return the elapsed time."""
+
+    def compare(_: int) -> None:
+        compyre.assert_equal(actual, expected)
+
+    with ThreadPoolExecutor(num_threads) as executor:
+        start = time.perf_counter()
+        list(executor.map(compare, range(repeats)))
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pairs", type=int, default=20_000)
+    parser.add_argument("--repeats", type=int, default=64)
+    parser.add_argument("--max-threads", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(
+        f"Python {sys.version.split()[0]}, GIL {'enabled' if is_gil_enabled else 'disabled'}"
+    )
+
+    actual = make_value(args.pairs)
+    expected = deepcopy(actual)
+    # warm up the lazily initialized global state
+    run(1, repeats=1, actual=actual, expected=expected)
+
+    num_threads = 1
+    baseline = None
+    while num_threads <= args.max_threads:
+        elapsed = run(
+            num_threads, repeats=args.repeats, actual=actual, expected=expected
+        )
+        throughput = args.repeats / elapsed
+        baseline = baseline or throughput
+        print(
+            f"{num_threads:>3} thread(s): {throughput:8.2f} comparisons/s, "
+            f"speedup {throughput / baseline:5.2f}x"
+        )
+        num_threads *= 2
+
+
+if __name__ == "__main__":
+    main()
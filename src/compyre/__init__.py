@@ -1,5 +1,7 @@
-from . import alias, api, builtin
+from . import alias, api, builtin, cache, hooks, snapshot
 from ._default import (
+    aassert_equal,
+    ais_equal,
     assert_equal,
     default_equal_fns,
     default_unpack_fns,
@@ -18,6 +20,8 @@ except ModuleNotFoundError:  # pragma: no cover
 
 __all__ = [
     "__version__",
+    "aassert_equal",
+    "ais_equal",
     "api",
     "assert_equal",
     "default_equal_fns",
@@ -1,5 +1,6 @@
 import functools
 import importlib.metadata
+import threading
 from typing import Any, Callable
 
 import packaging.requirements
@@ -12,9 +13,20 @@ packages_distributions = functools.cache(importlib.metadata.packages_distributio
 class _Requirement:
     def __init__(self, requirement_string: str) -> None:
         self._requirement = packaging.requirements.Requirement(requirement_string)
+        self._is_available: bool | None = None
+        self._lock = threading.Lock()
 
-    @functools.cached_property
+    @property
     def is_available(self) -> bool:
+        # functools.cached_property does not lock and thus might import concurrently
+        if self._is_available is None:
+            with self._lock:
+                if self._is_available is None:
+                    self._is_available = self._check()
+
+        return self._is_available
+
+    def _check(self) -> bool:
         try:
             distribution = importlib.metadata.distribution(self._requirement.name)
         except importlib.metadata.PackageNotFoundError:
@@ -0,0 +1,92 @@
+import contextlib
+import contextvars
+import sys
+import time
+from collections.abc import Iterator
+
+__all__ = ["Budget", "activate", "current"]
+
+# checking the memory requires a system call and thus is only performed on every n-th check
+_MEMORY_CHECK_INTERVAL = 128
+
+
+class Budget:
+    def __init__(self, *, timeout: float | None, max_memory: int | None) -> None:
+        self.timeout = timeout
+        self.max_memory = max_memory
+        self.reason: str | None = None
+
+        self._deadline = time.monotonic() + timeout if timeout is not None else None
+        self._memory_start = _peak_memory() if max_memory is not None else 0
+        self._checks = 0
+
+    def exceeded(self) -> bool:
+        if self.reason is not None:
+            return True
+
+        if self._deadline is not None and time.monotonic() > self._deadline:
+            self.reason = f"time limit of {self.timeout} seconds exceeded"
+        elif self.max_memory is not None:
+            self._checks += 1
+            if (
+                self._checks % _MEMORY_CHECK_INTERVAL == 0
+                and _peak_memory() - self._memory_start > self.max_memory
+            ):
+                self.reason = f"memory limit of {self.max_memory} bytes exceeded"
+
+        return self.reason is not None
+
+
+_current: contextvars.ContextVar[Budget | None] = contextvars.ContextVar(
+    "budget", default=None
+)
+
+
+def current() -> Budget | None:
+    return _current.get()
+
+
+@contextlib.contextmanager
+def activate(budget: Budget | None) -> Iterator[None]:
+    token = _current.set(budget)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+def _peak_memory() -> int:
+    # Since the peak memory never decreases, it is an upper bound for the memory used since the budget was created.
+    # However, memory allocated below a previous peak, e.g. of an earlier comparison, is not noticed at all.
+    if sys.platform == "win32":  # pragma: no cover
+        import ctypes
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        ctypes.windll.psapi.GetProcessMemoryInfo(
+            ctypes.windll.kernel32.GetCurrentProcess(),
+            ctypes.byref(counters),
+            counters.cb,
+        )
+        return int(counters.PeakWorkingSetSize)
+    else:  # pragma: no cover
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is reported in bytes on macOS, but in kilobytes elsewhere
+        return peak if sys.platform == "darwin" else peak * 1024
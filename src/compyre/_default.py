@@ -1,3 +1,4 @@
+import threading
 from collections.abc import Mapping
 from typing import Any, Callable
 
@@ -6,12 +7,17 @@ from ._availability import is_available
 from .alias import Alias
 
 __all__ = [
+    "aassert_equal",
+    "ais_equal",
     "assert_equal",
     "default_equal_fns",
     "default_unpack_fns",
     "is_equal",
 ]
 
+# guards the lazy initialization of the default fns, which otherwise might run concurrently without the GIL
+_LOCK = threading.Lock()
+
 _DEFAULT_UNPACK_FNS: list[Callable[..., api.UnpackFnResult]] | None = None
 
 
@@ -22,25 +28,39 @@ def default_unpack_fns() -> list[Callable[..., api.UnpackFnResult]]:
         The following unpacking functions in order if their requirements are met
 
             - [compyre.builtin.unpack_fns.pydantic_model][]
+            - [compyre.builtin.unpack_fns.pyarrow_table][]
+            - [compyre.builtin.unpack_fns.zarr_group][]
+            - [compyre.builtin.unpack_fns.zarr_array][]
+            - [compyre.builtin.unpack_fns.xarray_dataset][]
             - [compyre.builtin.unpack_fns.dataclasses_dataclass][]
             - [compyre.builtin.unpack_fns.collections_ordered_dict][]
             - [compyre.builtin.unpack_fns.collections_mapping][]
             - [compyre.builtin.unpack_fns.collections_sequence][]
+            - [compyre.builtin.unpack_fns.collections_iterator][]
+            - [compyre.builtin.unpack_fns.collections_async_iterable][]
 
     """
     global _DEFAULT_UNPACK_FNS
     if _DEFAULT_UNPACK_FNS is None:
-        _DEFAULT_UNPACK_FNS = [
-            fn
-            for fn in [
-                builtin.unpack_fns.pydantic_model,
-                builtin.unpack_fns.dataclasses_dataclass,
-                builtin.unpack_fns.collections_ordered_dict,
-                builtin.unpack_fns.collections_mapping,
-                builtin.unpack_fns.collections_sequence,
-            ]
-            if is_available(fn)
-        ]
+        with _LOCK:
+            if _DEFAULT_UNPACK_FNS is None:
+                _DEFAULT_UNPACK_FNS = [
+                    fn
+                    for fn in [
+                        builtin.unpack_fns.pydantic_model,
+                        builtin.unpack_fns.pyarrow_table,
+                        builtin.unpack_fns.zarr_group,
+                        builtin.unpack_fns.zarr_array,
+                        builtin.unpack_fns.xarray_dataset,
+                        builtin.unpack_fns.dataclasses_dataclass,
+                        builtin.unpack_fns.collections_ordered_dict,
+                        builtin.unpack_fns.collections_mapping,
+                        builtin.unpack_fns.collections_sequence,
+                        builtin.unpack_fns.collections_iterator,
+                        builtin.unpack_fns.collections_async_iterable,
+                    ]
+                    if is_available(fn)
+                ]
 
     return _DEFAULT_UNPACK_FNS.copy()
 
@@ -54,28 +74,48 @@ def default_equal_fns() -> list[Callable[..., api.EqualFnResult]]:
     Returns:
         The following unpacking functions in order if their requirements are met
 
+            - [compyre.builtin.equal_fns.dask_array][]
+            - [compyre.builtin.equal_fns.h5py_dataset][]
             - [compyre.builtin.equal_fns.numpy_ndarray][]
             - [compyre.builtin.equal_fns.pandas_dataframe][]
             - [compyre.builtin.equal_fns.pandas_series][]
+            - [compyre.builtin.equal_fns.polars_dataframe][]
+            - [compyre.builtin.equal_fns.pyarrow_array][]
+            - [compyre.builtin.equal_fns.scipy_sparse][]
             - [compyre.builtin.equal_fns.torch_tensor][]
+            - [compyre.builtin.equal_fns.xarray_dataarray][]
+            - [compyre.builtin.equal_fns.builtins_bytes][]
+            - [compyre.builtin.equal_fns.builtins_range][]
+            - [compyre.builtin.equal_fns.builtins_str][]
             - [compyre.builtin.equal_fns.builtins_number][]
             - [compyre.builtin.equal_fns.builtins_object][]
 
     """
     global _DEFAULT_EQUAL_FNS
     if _DEFAULT_EQUAL_FNS is None:
-        _DEFAULT_EQUAL_FNS = [
-            fn
-            for fn in [
-                builtin.equal_fns.numpy_ndarray,
-                builtin.equal_fns.pandas_dataframe,
-                builtin.equal_fns.pandas_series,
-                builtin.equal_fns.torch_tensor,
-                builtin.equal_fns.builtins_number,
-                builtin.equal_fns.builtins_object,
-            ]
-            if is_available(fn)
-        ]
+        with _LOCK:
+            if _DEFAULT_EQUAL_FNS is None:
+                _DEFAULT_EQUAL_FNS = [
+                    fn
+                    for fn in [
+                        builtin.equal_fns.dask_array,
+                        builtin.equal_fns.h5py_dataset,
+                        builtin.equal_fns.numpy_ndarray,
+                        builtin.equal_fns.pandas_dataframe,
+                        builtin.equal_fns.pandas_series,
+                        builtin.equal_fns.polars_dataframe,
+                        builtin.equal_fns.pyarrow_array,
+                        builtin.equal_fns.scipy_sparse,
+                        builtin.equal_fns.torch_tensor,
+                        builtin.equal_fns.xarray_dataarray,
+                        builtin.equal_fns.builtins_bytes,
+                        builtin.equal_fns.builtins_range,
+                        builtin.equal_fns.builtins_str,
+                        builtin.equal_fns.builtins_number,
+                        builtin.equal_fns.builtins_object,
+                    ]
+                    if is_available(fn)
+                ]
 
     return _DEFAULT_EQUAL_FNS.copy()
 
@@ -134,3 +174,59 @@ def assert_equal(
         aliases=aliases,
         **kwargs,
     )
+
+
+async def ais_equal(
+    actual: Any,
+    expected: Any,
+    aliases: Mapping[Alias, Any] | None = None,
+    **kwargs: Any,
+) -> bool:
+    """Asynchronous boolean equality check of the inputs.
+
+    !!! info
+
+        This function is a thin wrapper around [compyre.api.ais_equal][] using [compyre.default_unpack_fns][] and
+        [compyre.default_equal_fns][]. See [compyre.api.ais_equal][] for a description of the remaining arguments.
+
+    Returns:
+        Whether the inputs are equal.
+
+    """
+    return await api.ais_equal(
+        actual,
+        expected,
+        unpack_fns=default_unpack_fns(),
+        equal_fns=default_equal_fns(),
+        aliases=aliases,
+        **kwargs,
+    )
+
+
+async def aassert_equal(
+    actual: Any,
+    expected: Any,
+    aliases: Mapping[Alias, Any] | None = None,
+    **kwargs: Any,
+) -> None:
+    """Asynchronous equality assertion of the inputs.
+
+    !!! info
+
+        This function is a thin wrapper around [compyre.api.aassert_equal][] using [compyre.default_unpack_fns][] and
+        [compyre.default_equal_fns][]. See [compyre.api.aassert_equal][] for a description of the remaining arguments.
+
+    Raises:
+        AssertionError: If any input pair is not equal.
+
+    """
+    __tracebackhide__ = True
+
+    return await api.aassert_equal(
+        actual,
+        expected,
+        unpack_fns=default_unpack_fns(),
+        equal_fns=default_equal_fns(),
+        aliases=aliases,
+        **kwargs,
+    )
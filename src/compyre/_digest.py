@@ -0,0 +1,96 @@
+import hashlib
+import sys
+from collections.abc import Mapping
+from typing import Any
+
+__all__ = ["digest", "is_scalar"]
+
+_SCALAR_TYPES = (type(None), bool, int, float, complex, str, bytes)
+
+Memo = dict[int, tuple[Any, bytes | None]]
+
+
+def digest(value: Any, memo: Memo | None = None) -> bytes | None:
+    """Compute a content digest of a value.
+
+    Args:
+        value: Value to compute the digest for.
+        memo: Optional memo for the digests of non-scalar values. Since the memo holds a reference to each value, it
+            should only be kept alive as long as the values are.
+
+    Returns:
+        The digest or [None][] if the value or any value nested in it is not supported.
+
+    """
+    if isinstance(value, _SCALAR_TYPES):
+        return _hash(type(value), repr(value).encode())
+
+    if memo is None:
+        return _digest(value, {})
+
+    entry = memo.get(id(value))
+    if entry is not None and entry[0] is value:
+        return entry[1]
+
+    d = _digest(value, memo)
+    memo[id(value)] = (value, d)
+    return d
+
+
+def is_scalar(value: Any) -> bool:
+    return isinstance(value, _SCALAR_TYPES)
+
+
+def _hash(cls: type, *parts: bytes) -> bytes:
+    h = hashlib.blake2b(f"{cls.__module__}.{cls.__qualname__}".encode(), digest_size=16)
+    for part in parts:
+        h.update(part)
+    return h.digest()
+
+
+def _digest(value: Any, memo: Memo) -> bytes | None:
+    # Checking sys.modules instead of importing avoids the import overhead if the value can't be an array anyway
+    if (np := sys.modules.get("numpy")) is not None and isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            return None
+
+        # subclasses like numpy.memmap only differ in storage and thus share the digest
+        return _hash(
+            np.ndarray,
+            value.dtype.str.encode(),
+            repr(value.shape).encode(),
+            np.ascontiguousarray(value).reshape(-1).view(np.uint8),
+        )
+
+    if (torch := sys.modules.get("torch")) is not None and isinstance(
+        value, torch.Tensor
+    ):
+        try:
+            data = value.detach().cpu().contiguous().numpy()
+        except Exception:
+            return None
+
+        return _hash(
+            type(value),
+            str(value.dtype).encode(),
+            repr(tuple(value.shape)).encode(),
+            data.reshape(-1).view("uint8"),
+        )
+
+    if isinstance(value, Mapping):
+        parts = []
+        for k, v in value.items():
+            if (dk := digest(k, memo)) is None or (dv := digest(v, memo)) is None:
+                return None
+            parts.extend([dk, dv])
+        return _hash(type(value), *parts)
+
+    if isinstance(value, (list, tuple)):
+        parts = []
+        for v in value:
+            if (dv := digest(v, memo)) is None:
+                return None
+            parts.append(dv)
+        return _hash(type(value), *parts)
+
+    return None
@@ -0,0 +1,138 @@
+import functools
+import threading
+import types
+import weakref
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, TypeVar
+
+from compyre.cache import CacheInfo
+
+__all__ = ["FnCache", "fn_cache"]
+
+T = TypeVar("T")
+
+
+class FnCache(Generic[T]):
+    """Bounded cache for results computed from the signature of a function.
+
+    In contrast to [functools.cache][], functions are never kept alive by the cache. Plain Python functions are keyed by
+    their code object, annotations, and the parameters that have defaults and thus all closures created from the same
+    definition share an entry. Other callables, e.g. [functools.partial][]s, are keyed by identity and evicted when they
+    are garbage collected.
+    Callables that neither apply to the former nor support weak references are not cached.
+    """
+
+    def __init__(self, compute: Callable[[Callable], T], *, maxsize: int) -> None:
+        self._compute = compute
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, T] = OrderedDict()
+        self._refs: dict[int, weakref.ref] = {}
+        # weakref callbacks can run at any time, e.g. while the lock is held, and thus only record the collected keys
+        self._collected: list[tuple[int, weakref.ref]] = []
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+        functools.update_wrapper(self, compute)
+
+    def __call__(self, fn: Callable) -> T:
+        with self._lock:
+            self._purge()
+            key = self._key(fn)
+            if key is not None and (result := self._data.get(key)) is not None:
+                self._hits += 1
+                self._data.move_to_end(key)
+                return result
+
+            self._misses += 1
+
+        # the result is computed without holding the lock, since it might be computed concurrently for the same key
+        result = self._compute(fn)
+        if key is not None:
+            with self._lock:
+                self._store(key, fn, result)
+        return result
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            self._purge()
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self.maxsize,
+                currsize=len(self._data),
+            )
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._refs.clear()
+            self._collected.clear()
+            self._hits = self._misses = 0
+
+    def _key(self, fn: Callable) -> Hashable | None:
+        # the parsed signature of a function is determined by its code object, annotations, and the parameters that
+        # have defaults, unless it is overridden
+        if (
+            type(fn) is types.FunctionType
+            and not hasattr(fn, "__wrapped__")
+            and not hasattr(fn, "__signature__")
+        ):
+            try:
+                annotations = tuple(fn.__annotations__.items())
+                hash(annotations)
+            except TypeError:
+                pass
+            else:
+                # only the last positional parameters can have defaults and thus their number suffices
+                return (
+                    fn.__code__,
+                    annotations,
+                    len(fn.__defaults__ or ()),
+                    frozenset(fn.__kwdefaults__ or ()),
+                )
+
+        key = id(fn)
+        ref = self._refs.get(key)
+        if ref is not None:
+            if ref() is fn:
+                return key
+
+            # stale entry of a garbage collected callable with the same id
+            self._remove(key, ref)
+
+        try:
+            weakref.ref(fn)
+        except TypeError:
+            return None
+
+        return key
+
+    def _store(self, key: Hashable, fn: Callable, result: T) -> None:
+        if isinstance(key, int):
+            self._refs[key] = weakref.ref(fn, functools.partial(self._collect, key))
+
+        self._data[key] = result
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            evicted, _ = self._data.popitem(last=False)
+            self._refs.pop(evicted, None)  # type: ignore[call-overload]
+
+    def _collect(self, key: int, ref: weakref.ref) -> None:
+        self._collected.append((key, ref))
+
+    def _purge(self) -> None:
+        while self._collected:
+            self._remove(*self._collected.pop())
+
+    def _remove(self, key: int, ref: weakref.ref) -> None:
+        # only remove the entry if it still belongs to the collected callable rather than to a new one with the same id
+        if self._refs.get(key) is ref:
+            del self._refs[key]
+            self._data.pop(key, None)
+
+
+def fn_cache(*, maxsize: int) -> Callable[[Callable[[Callable], T]], FnCache[T]]:
+    def decorator(compute: Callable[[Callable], T]) -> FnCache[T]:
+        return FnCache(compute, maxsize=maxsize)
+
+    return decorator
@@ -1,27 +1,49 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import dataclasses
 import functools
+import heapq
 import inspect
+import itertools
 import typing
 from collections import deque
-from collections.abc import Mapping, Sequence
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
 from textwrap import indent
-from typing import Any, Callable, Deque, TypeVar
+from typing import Any, Awaitable, Callable, Deque, Hashable, TypeVar
 
+from compyre import _budget, _digest
+from compyre._fn_cache import fn_cache
 from compyre.alias import Alias
+from compyre.cache import CompareCache
+from compyre.hooks import Hooks
 
 __all__ = [
+    "BudgetExceededError",
     "CompareError",
     "EqualFnResult",
     "Pair",
     "UnpackFnResult",
+    "aassert_equal",
+    "acompare",
+    "ais_equal",
     "assert_equal",
     "compare",
+    "estimate_cost",
     "is_equal",
 ]
 
 T = TypeVar("T")
+U = TypeVar("U")
+E = TypeVar("E")
 
 
 @dataclasses.dataclass
@@ -40,12 +62,18 @@ class Pair:
     expected: Any
 
 
-UnpackFnResult = Sequence[Pair] | None | Exception
+UnpackFnResult = (
+    Iterable[Pair | Exception] | AsyncIterable[Pair | Exception] | None | Exception
+)
 """Return type of an unpacking function.
 
 - [None][] indicates that the function cannot handle the input [compyre.api.Pair][].
 - Any [Exception][] indicates that the function can generally handle the input [compyre.api.Pair][], but something is
   wrong.
+- An iterable is consumed lazily, i.e. the next item is only requested after the previous
+  [compyre.api.Pair][] was processed completely. Any [Exception][] it yields is treated as if it was returned for the
+  input [compyre.api.Pair][].
+- A [collections.abc.AsyncIterable][] is only supported by [compyre.api.acompare][].
 """
 EqualFnResult = bool | None | Exception
 """Return type of an equality function.
@@ -71,6 +99,12 @@ class CompyreError(Exception):
     pass
 
 
+class BudgetExceededError(CompyreError):
+    """Exception for pairs that were not compared completely, because the budget of the comparison was exceeded."""
+
+    pass
+
+
 def compare(
     actual: Any,
     expected: Any,
@@ -78,11 +112,18 @@ def compare(
     unpack_fns: Sequence[Callable[..., UnpackFnResult]],
     equal_fns: Sequence[Callable[..., EqualFnResult]],
     aliases: Mapping[Alias, Any] | None = None,
+    adaptive: bool = False,
+    cache: CompareCache | None = None,
+    cost: Callable[[Pair], float] | None = None,
+    max_errors: int | None = None,
+    timeout: float | None = None,
+    max_memory: int | None = None,
+    hooks: Hooks | None = None,
     **kwargs: Any,
 ) -> list[CompareError]:
     """Low-level comparison of the inputs.
 
-    The `unpack_fns` and `equal_fns` are applied depth-first to the inputs.
+    The `unpack_fns` and `equal_fns` are applied depth-first to the inputs, unless `cost` is passed.
 
     Args:
         actual: Actual input.
@@ -91,6 +132,21 @@ def compare(
         equal_fns: Equality functions to be used on the inputs. See note below for acceptable signatures. If a falsy
                    value is returned, it will be replaced by an [AssertionError][] with a default message.
         aliases: Aliases and values to be passed to the `unpack_fns` and `equal_fns`.
+        adaptive: If set, the `unpack_fns` and `equal_fns` that returned [None][] for a combination of types of
+                  [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] are skipped for all subsequent
+                  pairs with the same combination of types. See note below for details.
+        cache: Cache of previous comparison results. If passed, subtrees of the inputs that are unchanged since a
+               previous comparison are skipped and their previous result is reused. See
+               [compyre.cache.CompareCache][] for details.
+        cost: Cost estimation function, e.g. [compyre.api.estimate_cost][]. If passed, the pair with the lowest
+              estimated cost among all pairs that were unpacked so far is processed next, rather than going
+              depth-first. See note below for details.
+        max_errors: Maximum number of errors. If reached, the comparison is stopped early and the remaining pairs
+                    are not processed.
+        timeout: Time limit in seconds. See note below for details.
+        max_memory: Memory limit in bytes, i.e. the maximum increase of the peak memory usage of the process during the
+                    comparison. See note below for details.
+        hooks: Hooks to be notified about the progress of the comparison. See [compyre.hooks.Hooks][] for details.
         **kwargs: Keyword arguments to be passed to the `unpack_fns` and `equal_fns`.
 
     !!! note
@@ -98,18 +154,55 @@ def compare(
         The `unpack_fns` and `equal_fns` have to be callable with a single [compyre.api.Pair][] as positional argument
         as well as optionally keyword arguments that will be set by the `aliases` and `kwargs`.
 
+    !!! note
+
+        With `adaptive` set, the `unpack_fns` and `equal_fns` are never reordered. Only the leading functions that
+        returned [None][] for a combination of types are bypassed afterwards and thus their precedence is preserved.
+        This is only correct if a function decides whether it can handle a pair solely based on the types of its
+        values. Functions that also depend on the values, e.g. on the suffix of a path, have to be marked with
+        [compyre.utils.value_dependent][] to never be bypassed for the affected types. All builtin functions are either
+        decided by type or marked accordingly.
+
+    !!! note
+
+        With `cost` passed, cheap pairs, e.g. scalar values, are compared before expensive ones, e.g. large arrays,
+        regardless of their position in the inputs. Combined with `max_errors`, this detects mismatches as early as
+        possible. The returned errors are still ordered as if the inputs were processed depth-first. Since all pairs
+        unpacked from a pair are scheduled at once, unpacked iterables are consumed eagerly.
+
+    !!! note
+
+        The `timeout` and `max_memory` are checked cooperatively between pairs as well as by long-running
+        `unpack_fns` and `equal_fns` through [compyre.utils.budget_exceeded][], e.g. between chunks of large arrays.
+        If either is exceeded, the comparison is stopped and a partial result is returned. In it, every pair that was
+        not compared completely is included with a [compyre.api.BudgetExceededError][].
+
+        Since only the peak memory usage of the process is available on all platforms, `max_memory` limits how far
+        the comparison raises it above the peak before the comparison started. Memory that is allocated by the
+        comparison while staying below an earlier, higher peak is thus not counted.
+
     Returns:
         List of all exceptions *returned and not raised* by the `unpack_fns` and `equal_fns` with the index of the
             corresponding [compyre.api.Pair][]. If all `unpack_fns` and `equal_fns` return `None`, i.e. cannot handle
             it, a [compyre.api.CompyreError][] is included.
 
     Raises:
+        ValueError: If `max_errors`, `timeout`, or `max_memory` is not positive.
+        ValueError: If both `cost` and `cache` are passed.
         TypeError: If the `unpack_fns` and `equal_fns` cannot be called as described above.
         TypeError: If any parameter of the `unpack_fns` and `equal_fns` has no default, but no value was passed through
                    `aliases` or `kwargs`.
         TypeError: If any value passed to `aliases` or `kwargs` is unused by the `unpack_fns` and `equal_fns`.
 
     """
+    for name, limit in [
+        ("max_errors", max_errors),
+        ("timeout", timeout),
+        ("max_memory", max_memory),
+    ]:
+        if limit is not None and limit <= 0:
+            raise ValueError(f"{name} has to be positive, but got {limit}")
+
     parametrized_unpack_fns, parametrized_equal_fns = _parametrize_fns(
         unpack_fns=unpack_fns,
         equal_fns=equal_fns,
@@ -117,56 +210,450 @@ def compare(
         aliases=aliases if aliases is not None else {},
     )
 
-    pairs: Deque[Pair] = deque([Pair(index=(), actual=actual, expected=expected)])
+    unpack = _dispatcher(parametrized_unpack_fns, adaptive=adaptive)
+    equal = _dispatcher(parametrized_equal_fns, adaptive=adaptive)
+
+    if cost is not None and cache is not None:
+        raise ValueError("cost and cache cannot be used together")
+
+    budget = (
+        _budget.Budget(timeout=timeout, max_memory=max_memory)
+        if timeout is not None or max_memory is not None
+        else None
+    )
+
+    if hooks is not None:
+        unpack, equal = _hook_fns(hooks, unpack=unpack, equal=equal)
+
+    root = Pair(index=(), actual=actual, expected=expected)
+    with _budget.activate(budget):
+        if cost is not None:
+            errors = _compare_by_cost(
+                root,
+                unpack=unpack,
+                equal=equal,
+                cost=cost,
+                max_errors=max_errors,
+                budget=budget,
+            )
+        else:
+            if cache is not None:
+                cache._bind(
+                    (
+                        tuple(unpack_fns),
+                        tuple(equal_fns),
+                        _config_digests(aliases or {}),
+                        _config_digests(kwargs),
+                    )
+                )
+
+            errors = _compare_depth_first(
+                root,
+                unpack=unpack,
+                equal=equal,
+                cache=cache,
+                max_errors=max_errors,
+                budget=budget,
+                hooks=hooks,
+            )
+
+    if hooks is not None:
+        hooks.on_finish(errors)
+
+    return errors
+
+
+def _compare_depth_first(
+    root: Pair,
+    *,
+    unpack: Callable[[Pair], UnpackFnResult],
+    equal: Callable[[Pair], EqualFnResult],
+    cache: CompareCache | None,
+    max_errors: int | None,
+    budget: _budget.Budget | None,
+    hooks: Hooks | None,
+) -> list[CompareError]:
+    memo: _digest.Memo = {}
+    # Each entry holds a pair, the remaining items unpacked from it, and its cache key as well as the number of errors
+    # before it was entered. Since only the iterators are stored, the memory is proportional to the depth rather than
+    # the width of the inputs.
+    stack: list[tuple[Pair, Iterator[Pair | Exception], Hashable | None, int]] = [
+        (root, iter((root,)), None, 0)
+    ]
     errors: list[CompareError] = []
-    while pairs:
-        pair = pairs.popleft()
+    while stack:
+        if max_errors is not None and len(errors) >= max_errors:
+            break
+        elif budget is not None and budget.exceeded():
+            # Starting with the innermost, every pair with items left is reported as incomplete. This requests the next
+            # item, but the comparison is stopped anyway.
+            errors.extend(
+                CompareError(pair=parent, exception=_budget_error(budget))
+                for parent, items, _, _ in reversed(stack)
+                if next(items, None) is not None
+            )
+            return errors
+
+        parent, items, parent_key, parent_start = stack[-1]
+        item = next(items, None)
+        if item is None:
+            stack.pop()
+            if parent_key is not None:
+                typing.cast(CompareCache, cache)._store(
+                    parent_key, _cache_entry(errors[parent_start:])
+                )
+            continue
+        elif isinstance(item, Exception):
+            errors.append(CompareError(pair=parent, exception=item))
+            continue
+
+        pair = item
+        key: Hashable | None = None
+        start = 0
+        if cache is not None and (key := _cache_key(pair, memo)) is not None:
+            if (cached := cache._lookup(key)) is not None:
+                for index, exception in cached:
+                    error = CompareError(
+                        pair=_cached_pair(pair, index), exception=exception
+                    )
+                    errors.append(error)
+                    if hooks is not None:
+                        hooks.on_error(error)
+                continue
+            start = len(errors)
+
+        result = _visit(pair, unpack=unpack, equal=equal)
+        if isinstance(result, Exception):
+            errors.append(CompareError(pair=pair, exception=result))
+        elif result is not None:
+            stack.append((pair, iter(result), key, start))
+            continue
+
+        # an incomplete result must not be reused
+        if key is not None and not isinstance(result, BudgetExceededError):
+            typing.cast(CompareCache, cache)._store(key, _cache_entry(errors[start:]))
+
+    return errors[:max_errors]
+
+
+def _budget_error(budget: _budget.Budget) -> BudgetExceededError:
+    return BudgetExceededError(
+        f"{budget.reason}, the comparison of this pair is incomplete"
+    )
+
+
+def _visit(
+    pair: Pair,
+    *,
+    unpack: Callable[[Pair], UnpackFnResult],
+    equal: Callable[[Pair], EqualFnResult],
+) -> Iterable[Pair | Exception] | Exception | None:
+    # returns the items unpacked from the pair, the exception for it, or None if it is equal
+    unpack_result = unpack(pair)
+    if unpack_result is None:
+        equal_result = equal(pair)
+        if equal_result is True:
+            return None
+        elif inspect.isawaitable(equal_result):
+            equal_result = _async_error(equal_result)
+
+        return _equal_exception(pair, equal_result)
+    elif isinstance(unpack_result, AsyncIterable) or inspect.isawaitable(unpack_result):
+        return _async_error(unpack_result)
+
+    return unpack_result
+
+
+def _hook_fns(
+    hooks: Hooks,
+    *,
+    unpack: Callable[[Pair], UnpackFnResult],
+    equal: Callable[[Pair], EqualFnResult],
+) -> tuple[Callable[[Pair], UnpackFnResult], Callable[[Pair], EqualFnResult]]:
+    # Instead of checking for hooks throughout the traversal, the dispatchers are wrapped to emit the events. Thus, the
+    # traversal without hooks is not affected at all.
+    def hooked_unpack(pair: Pair) -> UnpackFnResult:
+        hooks.on_pair(pair)
+
+        result = unpack(pair)
+        if isinstance(result, AsyncIterable) or inspect.isawaitable(result):
+            result = _async_error(result)
+
+        if isinstance(result, Exception):
+            hooks.on_error(CompareError(pair=pair, exception=result))
+        elif result is not None:
+            hooks.on_enter(pair)
+            return hooked_items(pair, result)
+
+        return result
+
+    def hooked_items(
+        pair: Pair, items: Iterable[Pair | Exception]
+    ) -> Iterator[Pair | Exception]:
+        for item in items:
+            if isinstance(item, Exception):
+                hooks.on_error(CompareError(pair=pair, exception=item))
+            yield item
+
+        hooks.on_exit(pair)
+
+    def hooked_equal(pair: Pair) -> EqualFnResult:
+        result = equal(pair)
+        hooks.on_compared(
+            pair, max(_value_nbytes(pair.actual), _value_nbytes(pair.expected))
+        )
+
+        if inspect.isawaitable(result):
+            result = _async_error(result)
+
+        if (exception := _equal_exception(pair, result)) is None:
+            return True
+
+        hooks.on_error(CompareError(pair=pair, exception=exception))
+        return exception
+
+    return hooked_unpack, hooked_equal
+
+
+def _value_nbytes(value: Any) -> int:
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    elif isinstance(value, (bytes, bytearray)):
+        return len(value)
+
+    return 0
+
+
+def _compare_by_cost(
+    root: Pair,
+    *,
+    unpack: Callable[[Pair], UnpackFnResult],
+    equal: Callable[[Pair], EqualFnResult],
+    cost: Callable[[Pair], float],
+    max_errors: int | None,
+    budget: _budget.Budget | None,
+) -> list[CompareError]:
+    # Each pair is tracked with its position in the depth-first traversal, i.e. the indices of the items it was unpacked
+    # from, to be able to restore the order of the errors. The counter breaks ties between pairs of equal cost and
+    # avoids comparing the pairs themselves.
+    counter = itertools.count()
+    heap: list[tuple[float, int, tuple[int, ...], Pair]] = [
+        (0.0, next(counter), (), root)
+    ]
+    errors: list[tuple[tuple[int, ...], CompareError]] = []
+    while heap and (max_errors is None or len(errors) < max_errors):
+        if budget is not None and budget.exceeded():
+            errors.extend(
+                (position, CompareError(pair=pair, exception=_budget_error(budget)))
+                for _, _, position, pair in heap
+            )
+            break
+
+        _, _, position, pair = heapq.heappop(heap)
+
+        result = _visit(pair, unpack=unpack, equal=equal)
+        if isinstance(result, Exception):
+            errors.append((position, CompareError(pair=pair, exception=result)))
+        elif result is not None:
+            for i, item in enumerate(result):
+                if isinstance(item, Exception):
+                    errors.append(
+                        ((*position, i), CompareError(pair=pair, exception=item))
+                    )
+                else:
+                    heapq.heappush(
+                        heap, (cost(item), next(counter), (*position, i), item)
+                    )
+
+    errors = sorted(errors[:max_errors], key=lambda e: e[0])
+    return [e for _, e in errors]
+
+
+def estimate_cost(pair: Pair) -> float:
+    """Estimate the cost of comparing a pair.
 
-        unpack_result: UnpackFnResult = None
-        for ufn in parametrized_unpack_fns:
-            unpack_result = ufn(pair)
-            if unpack_result is not None:
+    The cost of a value is its `nbytes` attribute if it has one, e.g. for [numpy.ndarray][]s and [torch.Tensor][]s,
+    its length if it is sized, and `1` otherwise. The cost of the pair is the maximum of the costs of its values.
+
+    Args:
+        pair: Pair to estimate the cost for.
+
+    Returns:
+        Estimated cost of the pair.
+
+    """
+    return max(_value_cost(pair.actual), _value_cost(pair.expected))
+
+
+def _value_cost(value: Any) -> float:
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return float(nbytes)
+
+    try:
+        return float(len(value))
+    except Exception:
+        return 1.0
+
+
+def _cache_key(pair: Pair, memo: _digest.Memo) -> Hashable | None:
+    if _digest.is_scalar(pair.actual) and _digest.is_scalar(pair.expected):
+        return None
+
+    if (actual := _digest.digest(pair.actual, memo)) is None or (
+        expected := _digest.digest(pair.expected, memo)
+    ) is None:
+        return None
+
+    return pair.index, actual, expected
+
+
+def _config_digests(values: Mapping[Any, Any]) -> dict[Any, Any]:
+    # Values like arrays cannot be compared with == and would be kept alive by the cache. Thus, they are replaced by
+    # their digest if possible.
+    return {
+        name: value if (d := _digest.digest(value)) is None else d
+        for name, value in values.items()
+    }
+
+
+def _cache_entry(errors: list[CompareError]) -> tuple[tuple[Any, Exception], ...]:
+    # The pairs of the errors are not stored, since they would keep the compared values of every cached subtree alive.
+    return tuple((error.pair.index, error.exception) for error in errors)
+
+
+def _cached_pair(pair: Pair, index: tuple[str | int, ...]) -> Pair:
+    # Since the subtree is unchanged, the values of its errors are looked up in the current inputs. If an index cannot
+    # be resolved, e.g. because it was created by a custom unpacking function, the closest resolvable values are used.
+    actual, expected = pair.actual, pair.expected
+    for key in index[len(pair.index) :]:
+        try:
+            actual, expected = actual[key], expected[key]
+        except Exception:
+            break
+
+    return Pair(index=index, actual=actual, expected=expected)
+
+
+def _equal_exception(pair: Pair, equal_result: EqualFnResult) -> Exception | None:
+    if equal_result is None:
+        return CompyreError(
+            f"unable to compare {pair.actual!r} of type {type(pair.actual)} "
+            f"and {pair.expected!r} of type {type(pair.expected)}"
+        )
+    elif isinstance(equal_result, Exception):
+        return equal_result
+    elif not equal_result:
+        return AssertionError(f"{pair.actual!r} is not equal to {pair.expected!r}")
+
+    return None
+
+
+def _async_error(result: Any) -> CompyreError:
+    # avoid a RuntimeWarning about a coroutine that was never awaited
+    if inspect.iscoroutine(result):
+        result.close()
+
+    return CompyreError(
+        f"{type(result).__name__} returned by a function can only be handled by "
+        f"compyre.api.acompare, but not by compyre.api.compare"
+    )
+
+
+def _dispatcher(
+    fns: Sequence[Callable[[Pair], T]], *, adaptive: bool
+) -> Callable[[Pair], T | None]:
+    if not adaptive:
+
+        def dispatch(pair: Pair) -> T | None:
+            for fn in fns:
+                result = fn(pair)
+                if result is not None:
+                    return result
+
+            return None
+
+        return dispatch
+
+    # maps the types of a pair to the functions that have not returned None for them so far
+    candidates: dict[tuple[type, type], Sequence[Callable[[Pair], T]]] = {}
+
+    def adaptive_dispatch(pair: Pair) -> T | None:
+        key = (type(pair.actual), type(pair.expected))
+        key_fns = candidates.get(key, fns)
+
+        result: T | None = None
+        for i, fn in enumerate(key_fns):
+            result = fn(pair)
+            if result is not None:
                 break
+        else:
+            i = len(key_fns)
 
-        if unpack_result is not None:
-            if isinstance(unpack_result, Exception):
-                errors.append(CompareError(pair=pair, exception=unpack_result))
-            else:
-                for p in reversed(unpack_result):
-                    pairs.appendleft(p)
-            continue
+        if i:
+            candidates[key] = _remaining_fns(key_fns, i, key)
+
+        return result
+
+    return adaptive_dispatch
+
+
+def _remaining_fns(
+    fns: Sequence[Callable[[Pair], T]], i: int, key: tuple[type, type]
+) -> Sequence[Callable[[Pair], T]]:
+    # the leading functions returned None and are bypassed, unless they depend on the values for the types
+    kept = [fn for fn in fns[:i] if _value_dependent(fn, key)]
+    if len(kept) == i:
+        return fns
+
+    return [*kept, *fns[i:]]
 
-        equal_result: EqualFnResult = None
-        for efn in parametrized_equal_fns:
-            equal_result = efn(pair)
-            if equal_result is not None:
+
+def _value_dependent(fn: Callable, key: tuple[type, type]) -> bool:
+    # the functions are parametrized with functools.partial, which does not forward attributes
+    if isinstance(fn, functools.partial):
+        fn = fn.func
+
+    types = getattr(fn, "__value_dependent__", None)
+    return types is not None and any(issubclass(t, types) for t in key)
+
+
+def _adispatcher(
+    fns: Sequence[Callable[[Pair], T | Awaitable[T]]], *, adaptive: bool
+) -> Callable[[Pair], Awaitable[T | None]]:
+    # same as _dispatcher, but awaits the results of async functions
+    candidates: dict[tuple[type, type], Sequence[Callable[[Pair], Any]]] = {}
+
+    async def dispatch(pair: Pair) -> T | None:
+        key = (type(pair.actual), type(pair.expected))
+        key_fns = candidates.get(key, fns) if adaptive else fns
+
+        result: Any = None
+        for i, fn in enumerate(key_fns):
+            result = fn(pair)
+            if inspect.isawaitable(result):
+                result = await result
+            if result is not None:
                 break
+        else:
+            i = len(key_fns)
 
-        if equal_result is None:
-            equal_result = CompyreError(
-                f"unable to compare {pair.actual!r} of type {type(pair.actual)} "
-                f"and {pair.expected!r} of type {type(pair.expected)}"
-            )
-        elif not equal_result:
-            equal_result = AssertionError(
-                f"{pair.actual!r} is not equal to {pair.expected!r}"
-            )
+        if adaptive and i:
+            candidates[key] = _remaining_fns(key_fns, i, key)
 
-        if isinstance(equal_result, Exception):
-            errors.append(CompareError(pair, exception=equal_result))
+        return typing.cast(T | None, result)
 
-    return errors
+    return dispatch
 
 
 def _parametrize_fns(
     *,
-    unpack_fns: Sequence[Callable[..., UnpackFnResult]],
-    equal_fns: Sequence[Callable[..., EqualFnResult]],
+    unpack_fns: Sequence[Callable[..., U]],
+    equal_fns: Sequence[Callable[..., E]],
     kwargs: Mapping[str, Any],
     aliases: Mapping[Alias, Any],
-) -> tuple[
-    list[Callable[[Pair], UnpackFnResult]], list[Callable[[Pair], EqualFnResult]]
-]:
+) -> tuple[list[Callable[[Pair], U]], list[Callable[[Pair], E]]]:
     bound: set[str | Alias] = set()
 
     def parametrize(fns: Sequence[Callable[..., T]]) -> list[Callable[[Pair], T]]:
@@ -223,7 +710,7 @@ def _bind_kwargs(
     return functools.partial(fn, **bind_kwargs), bound
 
 
-@functools.cache
+@fn_cache(maxsize=1024)
 def _parse_fn(fn: Callable) -> tuple[set[str], dict[Alias, str], set[str]]:
     params = list(
         inspect.signature(fn, follow_wrapped=True, eval_str=True).parameters.values()
@@ -333,7 +820,7 @@ def assert_equal(
     """
     __tracebackhide__ = True
 
-    equal_errors = _extract_equal_errors(
+    _raise_equal_errors(
         compare(
             actual,
             expected,
@@ -343,11 +830,219 @@ def assert_equal(
             **kwargs,
         )
     )
-    if not equal_errors:
-        return None
 
-    raise AssertionError(
-        f"comparison resulted in {len(equal_errors)} error(s):\n\n{_format_compare_errors(equal_errors)}"
+
+async def acompare(
+    actual: Any,
+    expected: Any,
+    *,
+    unpack_fns: Sequence[Callable[..., UnpackFnResult | Awaitable[UnpackFnResult]]],
+    equal_fns: Sequence[Callable[..., EqualFnResult | Awaitable[EqualFnResult]]],
+    aliases: Mapping[Alias, Any] | None = None,
+    adaptive: bool = False,
+    max_concurrency: int | None = None,
+    **kwargs: Any,
+) -> list[CompareError]:
+    """Asynchronous low-level comparison of the inputs.
+
+    Compared to [compyre.api.compare][], this function additionally
+
+    - awaits [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] if they are awaitable before they are
+      passed to the `unpack_fns` and `equal_fns`,
+    - supports `unpack_fns` and `equal_fns` declared as `async def`,
+    - supports `unpack_fns` returning a [collections.abc.AsyncIterable][], which is consumed incrementally, and
+    - processes all pairs that are unpacked from the same pair concurrently.
+
+    The order of the returned errors is the same as for [compyre.api.compare][].
+
+    Args:
+        actual: Actual input.
+        expected: Expected input.
+        unpack_fns: Unpacking functions to be used on the inputs.
+        equal_fns: Equality functions to be used on the inputs.
+        aliases: Aliases and values to be passed to the `unpack_fns` and `equal_fns`.
+        adaptive: See [compyre.api.compare][] for details.
+        max_concurrency: Maximum number of pairs that are processed concurrently by the `unpack_fns` and `equal_fns`
+                         as well as the maximum number of pending pairs unpacked from the same pair. If omitted, the
+                         concurrency is unlimited.
+        **kwargs: Keyword arguments to be passed to the `unpack_fns` and `equal_fns`.
+
+    !!! info
+
+        See [compyre.api.compare][] for a description of the acceptable signatures of the `unpack_fns` and
+        `equal_fns`.
+
+    Returns:
+        List of all exceptions *returned and not raised* by the `unpack_fns` and `equal_fns` with the index of the
+            corresponding [compyre.api.Pair][]. If all `unpack_fns` and `equal_fns` return `None`, i.e. cannot handle
+            it, a [compyre.api.CompyreError][] is included.
+
+    Raises:
+        ValueError: If `max_concurrency` is not positive.
+        Exception: Any exception raised by [compyre.api.compare][] for invalid `unpack_fns` and `equal_fns`.
+
+    """
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError(
+            f"max_concurrency has to be positive, but got {max_concurrency}"
+        )
+
+    parametrized_unpack_fns, parametrized_equal_fns = _parametrize_fns(
+        unpack_fns=unpack_fns,
+        equal_fns=equal_fns,
+        kwargs=kwargs,
+        aliases=aliases if aliases is not None else {},
+    )
+    unpack = _adispatcher(parametrized_unpack_fns, adaptive=adaptive)
+    equal = _adispatcher(parametrized_equal_fns, adaptive=adaptive)
+
+    slots: contextlib.AbstractAsyncContextManager = (
+        asyncio.Semaphore(max_concurrency)
+        if max_concurrency is not None
+        else contextlib.nullcontext()
+    )
+
+    async def visit(pair: Pair) -> list[CompareError]:
+        async with slots:
+            pair = await _aresolve(pair)
+
+            unpack_result = await unpack(pair)
+            if unpack_result is None:
+                exception = _equal_exception(pair, await equal(pair))
+                return [] if exception is None else [CompareError(pair, exception)]
+
+        if isinstance(unpack_result, Exception):
+            return [CompareError(pair=pair, exception=unpack_result)]
+
+        return await visit_unpacked(pair, unpack_result)
+
+    async def visit_unpacked(
+        pair: Pair,
+        unpacked: Iterable[Pair | Exception] | AsyncIterable[Pair | Exception],
+    ) -> list[CompareError]:
+        errors: list[CompareError] = []
+        pending: Deque[asyncio.Task[list[CompareError]] | list[CompareError]] = deque()
+
+        async def collect(n: int) -> None:
+            while len(pending) > n:
+                p = pending.popleft()
+                errors.extend(p if isinstance(p, list) else await p)
+
+        try:
+            async for item in _aiterate(unpacked):
+                if isinstance(item, Exception):
+                    pending.append([CompareError(pair=pair, exception=item)])
+                else:
+                    pending.append(asyncio.create_task(visit(item)))
+
+                if max_concurrency is not None:
+                    await collect(max_concurrency)
+
+            await collect(0)
+        except BaseException:
+            for p in pending:
+                if not isinstance(p, list):
+                    p.cancel()
+            raise
+
+        return errors
+
+    return await visit(Pair(index=(), actual=actual, expected=expected))
+
+
+async def _aresolve(pair: Pair) -> Pair:
+    if not (inspect.isawaitable(pair.actual) or inspect.isawaitable(pair.expected)):
+        return pair
+
+    async def resolve(value: Any) -> Any:
+        while inspect.isawaitable(value):
+            value = await value
+        return value
+
+    actual, expected = await asyncio.gather(
+        resolve(pair.actual), resolve(pair.expected)
+    )
+    return Pair(index=pair.index, actual=actual, expected=expected)
+
+
+async def _aiterate(
+    items: Iterable[T] | AsyncIterable[T],
+) -> AsyncIterator[T]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def ais_equal(
+    actual: Any,
+    expected: Any,
+    *,
+    unpack_fns: Sequence[Callable[..., UnpackFnResult | Awaitable[UnpackFnResult]]],
+    equal_fns: Sequence[Callable[..., EqualFnResult | Awaitable[EqualFnResult]]],
+    aliases: Mapping[Alias, Any] | None = None,
+    **kwargs: Any,
+) -> bool:
+    """Asynchronous boolean equality check of the inputs.
+
+    !!! info
+
+        See [compyre.api.acompare][] for a description of the arguments.
+
+    Returns:
+        Whether the inputs are equal.
+
+    Raises:
+        CompyreError: If any input pair cannot be handled.
+        Exception: Any exception raised by [compyre.api.acompare][].
+
+    """
+    return not _extract_equal_errors(
+        await acompare(
+            actual,
+            expected,
+            unpack_fns=unpack_fns,
+            equal_fns=equal_fns,
+            aliases=aliases,
+            **kwargs,
+        )
+    )
+
+
+async def aassert_equal(
+    actual: Any,
+    expected: Any,
+    *,
+    unpack_fns: Sequence[Callable[..., UnpackFnResult | Awaitable[UnpackFnResult]]],
+    equal_fns: Sequence[Callable[..., EqualFnResult | Awaitable[EqualFnResult]]],
+    aliases: Mapping[Alias, Any] | None = None,
+    **kwargs: Any,
+) -> None:
+    """Asynchronous equality assertion of the inputs.
+
+    !!! info
+
+        See [compyre.api.acompare][] for a description of the arguments.
+
+    Raises:
+        CompyreError: If any input pair cannot be handled.
+        AssertionError: If any input pair is not equal.
+        Exception: Any exception raised by [compyre.api.acompare][].
+
+    """
+    __tracebackhide__ = True
+
+    _raise_equal_errors(
+        await acompare(
+            actual,
+            expected,
+            unpack_fns=unpack_fns,
+            equal_fns=equal_fns,
+            aliases=aliases,
+            **kwargs,
+        )
     )
 
 
@@ -365,6 +1060,18 @@ def _extract_equal_errors(errors: list[CompareError]) -> list[CompareError]:
     return equal_errors
 
 
+def _raise_equal_errors(errors: list[CompareError]) -> None:
+    __tracebackhide__ = True
+
+    equal_errors = _extract_equal_errors(errors)
+    if not equal_errors:
+        return None
+
+    raise AssertionError(
+        f"comparison resulted in {len(equal_errors)} error(s):\n\n{_format_compare_errors(equal_errors)}"
+    )
+
+
 def _format_compare_errors(errors: list[CompareError]) -> str:
     parts = []
     for e in errors:
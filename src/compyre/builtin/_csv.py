@@ -0,0 +1,408 @@
+from __future__ import annotations
+
+import contextlib
+import csv
+import itertools
+import math
+import os
+import re
+from collections.abc import Callable, Generator, Iterable, Iterator, Sequence
+from typing import Annotated, Any
+
+from compyre import alias, api, utils
+from compyre._availability import available_if, is_available
+
+from ._stdlib import _length_mismatch
+
+__all__ = ["csv_file"]
+
+_DELIMITERS = {".csv": ",", ".tsv": "\t"}
+
+_INT_RE = re.compile(r"[+-]?\d+\Z")
+
+# Column types map column names to the type of their values. Text columns are always mapped to str, while numeric
+# columns are mapped to a backend-specific type.
+_ColumnTypes = dict[str, Any]
+
+# Chunks are the number of rows and the values of each column.
+_Chunk = tuple[int, dict[str, Any]]
+
+
+@utils.value_dependent(os.PathLike)
+def csv_file(
+    p: api.Pair,
+    /,
+    *,
+    rel_tol: Annotated[float, alias.RELATIVE_TOLERANCE] = 1e-9,
+    abs_tol: Annotated[float, alias.ABSOLUTE_TOLERANCE] = 0.0,
+    chunk_size: int = 1 << 16,
+) -> api.UnpackFnResult:
+    """Unpack CSV files into their mismatching cells while reading them in chunks.
+
+    Both files are read in lockstep, `chunk_size` rows at a time. The types of the columns are inferred once from the
+    first chunk of each file: columns that are numeric in both files are parsed as numbers, while all other columns
+    are compared as text. Within each chunk, the columns are compared at once, numeric ones with the same tolerances as
+    [compyre.builtin.equal_fns.builtins_number][], and only the mismatching cells are returned. Thus, memory usage is
+    bounded by the chunk size and the messages for the mismatching cells are produced by the `equal_fns`.
+
+    The files are read with [pandas.read_csv][] and compared with [numpy][] if [pandas][] is available and with the
+    [csv][] module otherwise. Files with a `.csv` suffix are delimited by commas and files with a `.tsv` suffix by tabs.
+    The first row of each file is its header.
+
+    !!! info
+
+        Empty cells are missing values, which are equal to each other. In numeric columns, they are represented by
+        `NaN`, also in integer columns, whose values are otherwise kept exact rather than converted to floating point
+        numbers. A non-empty cell in a later chunk that does not match the type inferred for its column is reported as
+        parse error.
+
+    !!! warning
+
+        Since only paths to CSV files are unpacked, this function must be placed before
+        [compyre.builtin.unpack_fns.pathlib_path][] to unpack the CSV files in directories.
+
+    Args:
+        p: Pair to be unpacked.
+        rel_tol: Relative tolerance for numeric columns. See [math.isclose][] for details. Can also be set through
+            [compyre.alias.RELATIVE_TOLERANCE][].
+        abs_tol: Absolute tolerance for numeric columns. See [math.isclose][] for details. Can also be set through
+            [compyre.alias.ABSOLUTE_TOLERANCE][].
+        chunk_size: Number of rows that are read and compared at a time.
+
+    Returns:
+        (None): If [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] are not [os.PathLike][] objects
+            with a `.csv` or `.tsv` suffix.
+        (collections.abc.Iterator[api.Pair]): The [`actual`][compyre.api.Pair] and [`expected`][compyre.api.Pair] values
+            of each pair are the values of a mismatching cell, while the [`index`][compyre.api.Pair] is `p.index`
+            extended by its zero-based row and its column name. If the columns of the files mismatch or one file has
+            fewer rows than the other, a [ValueError][] is yielded last.
+
+    """
+    if not utils.both_isinstance(p, os.PathLike):
+        return None
+
+    delimiters = [
+        _DELIMITERS.get(os.path.splitext(path)[1].lower())
+        for path in (p.actual, p.expected)
+    ]
+    if None in delimiters:
+        return None
+
+    return _csv_pairs(
+        p,
+        [d for d in delimiters if d is not None],
+        rel_tol=rel_tol,
+        abs_tol=abs_tol,
+        chunk_size=chunk_size,
+    )
+
+
+def _csv_pairs(
+    p: api.Pair,
+    delimiters: list[str],
+    *,
+    rel_tol: float,
+    abs_tol: float,
+    chunk_size: int,
+) -> Iterator[api.Pair | Exception]:
+    infer: Callable[..., _ColumnTypes]
+    read: Callable[..., Generator[_Chunk, None, None]]
+    mismatches: Callable[..., Iterable[tuple[int, Any, Any]]]
+    if is_available(_pandas_column_types):
+        infer, read = _pandas_column_types, _pandas_chunks
+        mismatches = _array_mismatches
+    else:
+        infer, read = _stdlib_column_types, _stdlib_chunks
+        mismatches = _list_mismatches
+
+    paths = (p.actual, p.expected)
+    try:
+        actual_types, expected_types = (
+            infer(path, delimiter=delimiter, chunk_size=chunk_size)
+            for path, delimiter in zip(paths, delimiters)
+        )
+    except (OSError, ValueError) as error:
+        yield error
+        return
+
+    if actual_types.keys() != expected_types.keys():
+        extra = actual_types.keys() - expected_types.keys()
+        missing = expected_types.keys() - actual_types.keys()
+        yield ValueError(
+            f"CSV columns mismatch:\n\n"
+            f"extra: {', '.join(repr(k) for k in sorted(extra))}\n"
+            f"missing: {', '.join(repr(k) for k in sorted(missing))}\n"
+        )
+        return
+
+    columns = list(actual_types)
+    numeric = {
+        name
+        for name in columns
+        if actual_types[name] is not str and expected_types[name] is not str
+    }
+
+    with contextlib.ExitStack() as stack:
+        actual_chunks, expected_chunks = (
+            stack.enter_context(
+                contextlib.closing(
+                    read(
+                        path,
+                        {
+                            name: types[name] if name in numeric else str
+                            for name in columns
+                        },
+                        delimiter=delimiter,
+                        chunk_size=chunk_size,
+                    )
+                )
+            )
+            for path, types, delimiter in zip(
+                paths, (actual_types, expected_types), delimiters
+            )
+        )
+
+        offset = 0
+        while True:
+            if (error := utils.budget_exceeded()) is not None:
+                yield error
+                return
+
+            try:
+                actual_rows, actual_columns = next(actual_chunks, (0, {}))
+                expected_rows, expected_columns = next(expected_chunks, (0, {}))
+            except (OSError, ValueError) as error:
+                yield error
+                return
+
+            rows = min(actual_rows, expected_rows)
+            if rows > 0:
+                # mismatches are reported row by row although they are found column by column
+                cells = sorted(
+                    [
+                        (i, j, a, e)
+                        for j, name in enumerate(columns)
+                        for i, a, e in mismatches(
+                            actual_columns[name][:rows],
+                            expected_columns[name][:rows],
+                            numeric=name in numeric,
+                            rel_tol=rel_tol,
+                            abs_tol=abs_tol,
+                        )
+                    ],
+                    key=lambda cell: cell[:2],
+                )
+                for i, j, a, e in cells:
+                    yield api.Pair(
+                        index=(*p.index, offset + i, columns[j]), actual=a, expected=e
+                    )
+
+            offset += rows
+            if actual_rows != expected_rows:
+                yield _length_mismatch(
+                    "CSV file", offset, actual_exhausted=actual_rows < expected_rows
+                )
+                return
+            elif rows == 0:
+                return
+
+
+@available_if("pandas")
+def _pandas_column_types(
+    path: os.PathLike, *, delimiter: str, chunk_size: int
+) -> _ColumnTypes:
+    import pandas as pd
+
+    # the types are inferred from the raw values the same as for the csv module
+    frame = pd.read_csv(
+        path, sep=delimiter, nrows=chunk_size, dtype=str, keep_default_na=False
+    )
+    return {
+        str(name): _PANDAS_TYPES[_infer_type(frame[name].tolist())]
+        for name in frame.columns
+    }
+
+
+# integers are read as nullable, so that missing values do not turn them into inexact floats
+_PANDAS_TYPES = {int: "Int64", float: "float64", str: str}
+# pandas only parses NaN values as missing values, while float accepts them as numbers
+_PANDAS_NA_VALUES = {
+    "Int64": [""],
+    "float64": ["", "nan", "NaN", "NAN", "-nan", "-NaN"],
+}
+
+
+def _pandas_chunks(
+    path: os.PathLike, types: _ColumnTypes, *, delimiter: str, chunk_size: int
+) -> Generator[_Chunk, None, None]:
+    import pandas as pd
+
+    with pd.read_csv(
+        path,
+        sep=delimiter,
+        dtype=types,
+        keep_default_na=False,
+        na_values={
+            name: _PANDAS_NA_VALUES[type]
+            for name, type in types.items()
+            if type is not str
+        },
+        chunksize=chunk_size,
+    ) as reader:
+        for frame in reader:
+            yield (
+                len(frame),
+                {
+                    name: frame[name].to_numpy(dtype=object, na_value=math.nan)
+                    if frame[name].hasnans and types[name] == "Int64"
+                    else frame[name].to_numpy()
+                    for name in frame.columns
+                },
+            )
+
+
+def _array_mismatches(
+    actual: Any, expected: Any, *, numeric: bool, rel_tol: float, abs_tol: float
+) -> Iterable[tuple[int, Any, Any]]:
+    import numpy as np
+
+    # exact comparisons are cheap and rule out most cells, so the tolerances are only checked for the remaining ones
+    indices = np.flatnonzero(actual != expected)
+    if numeric and indices.size > 0 and actual.dtype.kind == expected.dtype.kind == "f":
+        a = actual[indices]
+        e = expected[indices]
+        with np.errstate(invalid="ignore"):
+            close = np.abs(a - e) <= np.maximum(
+                rel_tol * np.maximum(np.abs(a), np.abs(e)), abs_tol
+            )
+        # infinite values are only close to themselves, which were already ruled out by the exact comparison
+        close &= np.isfinite(a) & np.isfinite(e)
+        close |= np.isnan(a) & np.isnan(e)
+        indices = indices[~close]
+    elif numeric and indices.size > 0:
+        # integers are compared exactly rather than as float64, which is inexact above 2**53
+        indices = indices[
+            [
+                not _numbers_close(a, e, rel_tol=rel_tol, abs_tol=abs_tol)
+                for a, e in zip(actual[indices].tolist(), expected[indices].tolist())
+            ]
+        ]
+
+    return zip(indices.tolist(), actual[indices].tolist(), expected[indices].tolist())
+
+
+def _stdlib_column_types(
+    path: os.PathLike, *, delimiter: str, chunk_size: int
+) -> _ColumnTypes:
+    with open(path, newline="", encoding="utf-8") as file:
+        header, rows = _stdlib_rows(file, delimiter=delimiter)
+        values = list(zip(*itertools.islice(rows, chunk_size)))
+
+    if not values:
+        return dict.fromkeys(header, str)
+
+    return {name: _infer_type(column) for name, column in zip(header, values)}
+
+
+def _infer_type(values: Sequence[str]) -> type:
+    # empty cells are missing values regardless of the type of the column
+    present = [value for value in values if value]
+    if present and all(_INT_RE.match(value) for value in present):
+        return int
+
+    for value in present:
+        # Python accepts digit separators, which are not numbers in CSV files
+        if "_" in value:
+            return str
+
+        try:
+            float(value)
+        except ValueError:
+            return str
+
+    return float
+
+
+def _stdlib_chunks(
+    path: os.PathLike, types: _ColumnTypes, *, delimiter: str, chunk_size: int
+) -> Generator[_Chunk, None, None]:
+    with open(path, newline="", encoding="utf-8") as file:
+        header, rows = _stdlib_rows(file, delimiter=delimiter)
+        parsers = [_PARSERS[types[name]] for name in header]
+        while chunk := list(itertools.islice(rows, chunk_size)):
+            yield (
+                len(chunk),
+                {
+                    name: [parse(value) for value in column]
+                    for name, parse, column in zip(header, parsers, zip(*chunk))
+                },
+            )
+
+
+def _parse_int(value: str) -> int | float:
+    return int(value) if value else math.nan
+
+
+def _parse_float(value: str) -> float:
+    if "_" in value:
+        raise ValueError(f"could not convert string to float: {value!r}")
+    return float(value) if value else math.nan
+
+
+_PARSERS: dict[type, Callable[[str], Any]] = {
+    int: _parse_int,
+    float: _parse_float,
+    str: str,
+}
+
+
+def _stdlib_rows(
+    file: Iterable[str], *, delimiter: str
+) -> tuple[list[str], Iterator[list[str]]]:
+    reader = csv.reader(file, delimiter=delimiter)
+    header = next(reader, None)
+    if not header:
+        raise ValueError("No columns to parse from file")
+    elif len(set(header)) != len(header):
+        raise ValueError(f"Duplicate column names in header: {header}")
+
+    def rows() -> Iterator[list[str]]:
+        for row in reader:
+            if len(row) != len(header):
+                raise ValueError(
+                    f"Expected {len(header)} fields in line {reader.line_num}, saw {len(row)}"
+                )
+            yield row
+
+    return header, rows()
+
+
+def _list_mismatches(
+    actual: Sequence[Any],
+    expected: Sequence[Any],
+    *,
+    numeric: bool,
+    rel_tol: float,
+    abs_tol: float,
+) -> Iterable[tuple[int, Any, Any]]:
+    for i, (a, e) in enumerate(zip(actual, expected)):
+        if a == e or (
+            numeric and _numbers_close(a, e, rel_tol=rel_tol, abs_tol=abs_tol)
+        ):
+            continue
+
+        yield i, a, e
+
+
+def _numbers_close(
+    actual: float, expected: float, *, rel_tol: float, abs_tol: float
+) -> bool:
+    if math.isnan(actual) or math.isnan(expected):
+        return math.isnan(actual) and math.isnan(expected)
+    elif isinstance(actual, int) and isinstance(expected, int):
+        # math.isclose converts integers to float, which is inexact above 2**53
+        return abs(actual - expected) <= max(
+            rel_tol * max(abs(actual), abs(expected)), abs_tol
+        )
+
+    return math.isclose(actual, expected, rel_tol=rel_tol, abs_tol=abs_tol)
@@ -0,0 +1,96 @@
+import itertools
+from typing import Annotated
+
+from compyre import alias, api, utils
+from compyre._availability import available_if
+
+from ._numpy import _block_mismatches, _block_mismatches_result, _is_numeric
+
+
+@available_if("dask[array]")
+def dask_array(
+    p: api.Pair,
+    /,
+    *,
+    rtol: Annotated[float, alias.RELATIVE_TOLERANCE] = 1e-7,
+    atol: Annotated[float, alias.ABSOLUTE_TOLERANCE] = 0.0,
+    equal_nan: Annotated[bool, alias.NAN_EQUALITY] = True,
+) -> api.EqualFnResult:
+    """Check equality for [dask](https://www.dask.org) arrays block by block.
+
+    If only one input is a dask array, the other [numpy.ndarray][] is split into the same blocks. If the chunks of the
+    inputs differ, the expected array is rechunked to the chunks of the actual array. Afterwards, each pair of blocks
+    is reduced to its number of mismatches, its maximum absolute difference among them, and its first mismatch. These
+    reductions are computed with the threaded scheduler, so that the blocks are compared in parallel and only a few
+    blocks have to be held in memory at a time. Numeric values are compared with [numpy.isclose][], while all other
+    values are compared exactly.
+
+    !!! warning
+
+        Dask arrays are awaitable. Thus, [compyre.api.acompare][] awaits them before they are passed to this function,
+        which requires the `distributed` package and loads them into memory. Use [compyre.api.compare][] instead.
+
+    Args:
+        p: Pair to be compared.
+        rtol: Relative tolerance. See [numpy.isclose][] for details. Can also be set through
+              [compyre.alias.RELATIVE_TOLERANCE][].
+        atol: Absolute tolerance. See [numpy.isclose][] for details. Can also be set through
+              [compyre.alias.ABSOLUTE_TOLERANCE][].
+        equal_nan: Whether two `NaN` values are considered equal. Can also be set through
+              [compyre.alias.NAN_EQUALITY][].
+
+    Returns:
+       (None): If neither [`p.actual`][compyre.api.Pair] nor [`p.expected`][compyre.api.Pair] is a dask array or the
+            other is not a [numpy.ndarray][].
+       (True): If the inputs have the same shape and all values are close.
+       (AssertionError): If the shapes of the inputs mismatch or any values are not close.
+
+    Raises:
+        RuntimeError: If [dask](https://www.dask.org) is not available.
+
+    """
+    import dask
+    import dask.array as da
+    import numpy as np
+
+    if not (
+        utils.either_isinstance(p, da.Array)
+        and utils.both_isinstance(p, (da.Array, np.ndarray))
+    ):
+        return None
+
+    if p.actual.shape != p.expected.shape:
+        return AssertionError(
+            f"Dask array shapes mismatch: {p.actual.shape} != {p.expected.shape}"
+        )
+
+    # in-memory arrays are split into the same blocks as the dask array without copying them
+    actual, expected = (
+        value
+        if isinstance(value, da.Array)
+        else da.from_array(value, chunks=other.chunks)  # type: ignore[no-untyped-call]
+        for value, other in [(p.actual, p.expected), (p.expected, p.actual)]
+    )
+    if actual.chunks != expected.chunks:
+        expected = expected.rechunk(actual.chunks)
+
+    numeric = _is_numeric(actual, expected)
+    blocks = [
+        dask.delayed(_block_mismatches)(
+            a, e, numeric=numeric, rtol=rtol, atol=atol, equal_nan=equal_nan
+        )
+        for a, e in zip(actual.to_delayed().flat, expected.to_delayed().flat)
+    ]
+    results = dask.compute(*blocks, scheduler="threads")  # type: ignore[no-untyped-call]
+
+    # blocks are flattened in C order, which matches the order of the product of their offsets
+    offsets = itertools.product(
+        *[itertools.accumulate(chunks[:-1], initial=0) for chunks in actual.chunks]
+    )
+    return _block_mismatches_result(
+        "Dask arrays",
+        list(zip(offsets, results)),
+        unit="blocks",
+        size=actual.size,
+        numeric=numeric,
+    )
@@ -0,0 +1,167 @@
+import functools
+from collections.abc import Callable, Iterator
+from typing import Annotated, Any
+
+from compyre import alias, api, utils
+from compyre._availability import available_if
+
+from ._numpy import (
+    _CHUNK_SIZE,
+    _Block,
+    _block_mismatches,
+    _block_mismatches_result,
+    _BlockMismatches,
+    _blocks,
+    _compare_blocks,
+    _is_numeric,
+)
+
+
+@available_if("h5py")
+def h5py_dataset(
+    p: api.Pair,
+    /,
+    *,
+    rtol: Annotated[float, alias.RELATIVE_TOLERANCE] = 1e-7,
+    atol: Annotated[float, alias.ABSOLUTE_TOLERANCE] = 0.0,
+    equal_nan: Annotated[bool, alias.NAN_EQUALITY] = True,
+    workers: int | None = None,
+) -> api.EqualFnResult:
+    """Check equality for [h5py](https://www.h5py.org) `Dataset`s chunk by chunk.
+
+    The inputs are compared for each chunk of the actual dataset. Datasets with contiguous storage are compared in
+    slices along the first axis instead. If both datasets are chunked the same and have the same data type, filters,
+    and fill value, the raw bytes of the chunks are compared first. Identical bytes prove that the chunks are equal
+    without decompressing them, unless they might encode `NaN` or `NaT` values while `equal_nan=False`. Only the
+    remaining chunks are read and compared by a thread pool with [numpy.isclose][] for numeric values and exactly
+    otherwise. Since HDF5 does not support concurrent reads, the next chunks are read while the previous ones are
+    compared.
+
+    !!! info
+
+        HDF5 files and groups are [collections.abc.Mapping][]s and thus are already unpacked by
+        [compyre.builtin.unpack_fns.collections_mapping][].
+
+    Args:
+        p: Pair to be compared.
+        rtol: Relative tolerance. See [numpy.isclose][] for details. Can also be set through
+              [compyre.alias.RELATIVE_TOLERANCE][].
+        atol: Absolute tolerance. See [numpy.isclose][] for details. Can also be set through
+              [compyre.alias.ABSOLUTE_TOLERANCE][].
+        equal_nan: Whether two `NaN` values are considered equal. Can also be set through
+              [compyre.alias.NAN_EQUALITY][].
+        workers: Maximum number of threads comparing chunks concurrently. Defaults to the default of
+            [concurrent.futures.ThreadPoolExecutor][].
+
+    Returns:
+       (None): If [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] are not `Dataset`s.
+       (True): If the inputs have the same shape and all values are close.
+       (AssertionError): If the shapes of the inputs mismatch or any values are not close.
+       (compyre.api.BudgetExceededError): If the budget of the comparison is exceeded.
+
+    Raises:
+        RuntimeError: If [h5py](https://www.h5py.org) is not available.
+
+    """
+    import h5py
+
+    if not utils.both_isinstance(p, h5py.Dataset):
+        return None
+
+    actual, expected = p.actual, p.expected
+    if actual.shape != expected.shape:
+        return AssertionError(
+            f"HDF5 dataset shapes mismatch: {actual.shape} != {expected.shape}"
+        )
+
+    chunks = actual.chunks
+    if chunks is None:
+        # slices are taken along the first axis to read contiguous regions of the storage
+        chunks = tuple(actual.shape)
+        if actual.ndim > 0 and actual.nbytes > _CHUNK_SIZE:
+            chunks = (_CHUNK_SIZE * chunks[0] // actual.nbytes or 1, *chunks[1:])
+
+    # identical bytes do not prove equality if they might encode NaN or NaT values that are not considered equal
+    raw = (
+        actual.chunks is not None
+        and (equal_nan or actual.dtype.kind not in "fcmM")
+        and _encoding(actual) == _encoding(expected)
+    )
+    numeric = _is_numeric(actual, expected)
+    results = _compare_blocks(
+        _tasks(
+            actual,
+            expected,
+            _blocks(actual.shape, chunks),
+            raw=raw,
+            numeric=numeric,
+            rtol=rtol,
+            atol=atol,
+            equal_nan=equal_nan,
+        ),
+        workers=workers,
+    )
+    if isinstance(results, Exception):
+        return results
+
+    return _block_mismatches_result(
+        "HDF5 datasets", results, unit="chunks", size=actual.size, numeric=numeric
+    )
+
+
+def _tasks(
+    actual: Any,
+    expected: Any,
+    blocks: list[_Block],
+    *,
+    raw: bool,
+    numeric: bool,
+    rtol: float,
+    atol: float,
+    equal_nan: bool,
+) -> Iterator[tuple[tuple[int, ...], Callable[[], _BlockMismatches]]]:
+    import numpy as np
+
+    # HDF5 serializes all reads through a global lock, which might also be held by the caller while iterating over a
+    # group. Thus, the chunks are read here and only compared in the background.
+    for offset, selection in blocks:
+        if raw and _raw_chunk(actual, offset) == _raw_chunk(expected, offset):
+            yield offset, _no_mismatches
+            continue
+
+        yield (
+            offset,
+            functools.partial(
+                _block_mismatches,
+                np.asarray(actual[selection]),
+                np.asarray(expected[selection]),
+                numeric=numeric,
+                rtol=rtol,
+                atol=atol,
+                equal_nan=equal_nan,
+            ),
+        )
+
+
+def _no_mismatches() -> _BlockMismatches:
+    return 0, 0.0, None
+
+
+def _encoding(dataset: Any) -> tuple[Any, ...]:
+    # everything that determines the raw bytes of the chunks for given values
+    plist = dataset.id.get_create_plist()
+    return (
+        dataset.dtype,
+        dataset.chunks,
+        dataset.fillvalue,
+        [plist.get_filter(i) for i in range(plist.get_nfilters())],
+    )
+
+
+def _raw_chunk(dataset: Any, offset: tuple[int, ...]) -> tuple[int, bytes] | None:
+    # chunks that were never written are not allocated
+    if dataset.id.get_chunk_info_by_coord(offset).byte_offset is None:
+        return None
+
+    filter_mask, chunk = dataset.id.read_direct_chunk(offset)
+    return filter_mask, chunk
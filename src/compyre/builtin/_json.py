@@ -0,0 +1,600 @@
+from __future__ import annotations
+
+import contextlib
+import itertools
+import json
+import json.scanner
+import math
+import os
+import re
+import typing
+import weakref
+from collections.abc import Iterable, Iterator
+from json.decoder import scanstring  # type: ignore[attr-defined]
+from typing import IO, Any
+
+from compyre import api, utils
+from compyre._availability import available_if, is_available
+
+from ._stdlib import _length_mismatch, collections_mapping
+
+__all__ = ["json_file"]
+
+_JSON_LINES_SUFFIXES = frozenset({".jsonl", ".ndjson"})
+_SUFFIXES = frozenset({".json", *_JSON_LINES_SUFFIXES})
+
+
+@utils.value_dependent(os.PathLike)
+def json_file(p: api.Pair, /) -> api.UnpackFnResult:
+    """Unpack JSON and [JSON Lines](https://jsonlines.org/) files incrementally while parsing them.
+
+    Both files are parsed in lockstep. Object members and array items are returned as soon as they are parsed and
+    nested objects and arrays are returned as placeholders that are in turn unpacked by this function. Thus, only the
+    path from the root to the current value is held in memory rather than the whole documents. Numbers, strings,
+    booleans, and `null` are returned as Python values and thus compared by the `equal_fns`, e.g.
+    [compyre.builtin.equal_fns.builtins_number][] with its tolerances.
+
+    JSON files are parsed with [ijson](https://github.com/ICRAR/ijson) if it is available and with an incremental
+    parser based on the [json][] module otherwise. Files with a `.jsonl` or `.ndjson` suffix are treated as JSON Lines
+    and unpacked into one pair per document, which are parsed with [json.loads][] one line at a time.
+
+    !!! info
+
+        Object members are compared in lockstep as long as the keys of both objects appear in the same order. From the
+        first key that differs, the remaining members of both objects are parsed completely and compared with the
+        semantics of [compyre.builtin.unpack_fns.collections_mapping][]. The same applies to JSON Lines documents.
+        Thus, this function should be used together with [compyre.default_unpack_fns][].
+
+    !!! info
+
+        In contrast to [compyre.builtin.unpack_fns.collections_mapping][] and
+        [compyre.builtin.unpack_fns.collections_sequence][], mismatching keys and lengths are only reported once they
+        are parsed and thus after the members and items parsed before were compared. If the pairs are not processed
+        depth-first, e.g. with the `cost` parameter of [compyre.api.compare][] or by [compyre.api.acompare][], the
+        nested values that are parsed before they are unpacked are held in memory until then.
+
+    !!! warning
+
+        [ijson](https://github.com/ICRAR/ijson) does not support the non-standard `NaN` and `Infinity` values that
+        the [json][] module writes by default as well as integers that do not fit into 64 bits.
+
+    Args:
+        p: Pair to be unpacked.
+
+    Returns:
+        (None): If [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] are neither both
+            [os.PathLike][] objects with a `.json`, `.jsonl`, or `.ndjson` suffix nor values of files parsed by this
+            function.
+        (collections.abc.Iterator[api.Pair]): The [`actual`][compyre.api.Pair] and [`expected`][compyre.api.Pair]
+            values of each pair are the corresponding members, items, or JSON Lines documents of the inputs, while the
+            [`index`][compyre.api.Pair] is `p.index` extended by the corresponding key or index. If the root values
+            of the files are not both objects or arrays, a single pair with the root values and `p.index` is returned.
+            Errors while opening or parsing the files as well as mismatching keys and lengths are yielded as
+            exceptions.
+        (ValueError): If one of the inputs is an object or array and the other is not of the same kind.
+
+    """
+    if utils.both_isinstance(p, _Container):
+        if p.actual.kind != p.expected.kind:
+            return _kind_mismatch(p.actual, p.expected)
+
+        return _catch(_container_pairs(p.index, p.actual, p.expected))
+    elif utils.either_isinstance(p, _Container):
+        return _kind_mismatch(p.actual, p.expected)
+    elif utils.both_isinstance(p, os.PathLike) and all(
+        os.path.splitext(path)[1].lower() in _SUFFIXES
+        for path in (p.actual, p.expected)
+    ):
+        return _file_pairs(p)
+
+    return None
+
+
+_KINDS = {
+    type(None): "null",
+    bool: "boolean",
+    int: "number",
+    float: "number",
+    str: "string",
+}
+
+
+def _kind_mismatch(actual: Any, expected: Any) -> ValueError:
+    def kind(value: Any) -> str:
+        return value.kind if isinstance(value, _Container) else _KINDS[type(value)]
+
+    return ValueError(f"JSON value kinds mismatch: {kind(actual)} != {kind(expected)}")
+
+
+class _StreamError(Exception):
+    def __init__(self, error: Exception | None) -> None:
+        super().__init__(error)
+        self.error = error
+
+
+class _Stream:
+    def __init__(self, events: Iterator[tuple[str, Any]], *, depth: int = 0) -> None:
+        self._events = events
+        self.depth = depth
+        self._failed = False
+        # depths and references of the containers created by this stream that are not parsed completely
+        self._open: list[tuple[int, weakref.ref[_Container]]] = []
+
+    def next(self) -> tuple[str, Any]:
+        # a parse error is only reported once by the innermost value that is unpacked while it occurs
+        if self._failed:
+            raise _StreamError(None)
+
+        try:
+            event, value = next(self._events)
+        except _StreamError:
+            self._failed = True
+            raise
+        except Exception as error:
+            self._failed = True
+            raise _StreamError(error) from error
+
+        if event in {"start_map", "start_array"}:
+            self.depth += 1
+        elif event in {"end_map", "end_array"}:
+            if self._open and self._open[-1][0] == self.depth:
+                self._open.pop()
+            self.depth -= 1
+
+        return event, value
+
+    def value(self, event: str, value: Any) -> Any:
+        if event == "start_map":
+            container = _Container(self, "object")
+        elif event == "start_array":
+            container = _Container(self, "array")
+        else:
+            return value
+
+        self._open.append((self.depth, weakref.ref(container)))
+        return container
+
+    def skip(self, depth: int) -> None:
+        # Skips the remainders of the values deeper than the given depth, e.g. of nested values that were not unpacked
+        # due to a mismatch. If the pairs are not processed depth-first, e.g. with cost or by compyre.api.acompare,
+        # containers that are skipped might still be unpacked later. Thus, the skipped events are kept for the
+        # containers that are still referenced and replayed once they are unpacked.
+        pending = {
+            d: c for d, ref in self._open if d > depth and (c := ref()) is not None
+        }
+        if not pending:
+            while self.depth > depth:
+                self.next()
+            return
+
+        start = self.depth
+        events: list[tuple[str, Any]] = []
+        try:
+            while self.depth > depth:
+                events.append(self.next())
+                if (container := pending.pop(self.depth + 1, None)) is not None:
+                    container.replay(_Stream(iter(events.copy()), depth=start))
+        except _StreamError:
+            # the error is already reported by the value that is unpacked
+            for container in pending.values():
+                container.replay(
+                    _Stream(itertools.chain(events, _reported_error()), depth=start)
+                )
+            raise
+
+    def release(self) -> None:
+        # keeps the remainders of the values that are still referenced before the underlying file is closed
+        if any(ref() is not None for _, ref in self._open):
+            with contextlib.suppress(_StreamError):
+                self.skip(0)
+
+    def build(self, event: str, value: Any) -> Any:
+        # builds the value starting with the given event completely
+        if event == "start_map":
+            obj = {}
+            while (member := self.next())[0] != "end_map":
+                obj[member[1]] = self.build(*self.next())
+            return obj
+        elif event == "start_array":
+            array = []
+            while (item := self.next())[0] != "end_array":
+                array.append(self.build(*item))
+            return array
+
+        return value
+
+
+class _Container:
+    """Placeholder for a JSON object or array that is parsed while it is unpacked."""
+
+    def __init__(self, stream: _Stream, kind: str) -> None:
+        self._stream = stream
+        self._depth = stream.depth
+        self.kind = kind
+
+    def next(self) -> tuple[str, Any]:
+        # skips the remainder of nested values that were not unpacked completely
+        if self._stream.depth > self._depth:
+            self._stream.skip(self._depth)
+        return self._stream.next()
+
+    def replay(self, stream: _Stream) -> None:
+        self._stream = stream
+
+    def value(self, event: str, value: Any) -> Any:
+        return self._stream.value(event, value)
+
+    def build(self, event: str, value: Any) -> Any:
+        return self._stream.build(event, value)
+
+
+def _reported_error() -> Iterator[tuple[str, Any]]:
+    raise _StreamError(None)
+    yield
+
+
+def _catch(items: Iterator[api.Pair | Exception]) -> Iterator[api.Pair | Exception]:
+    try:
+        yield from items
+    except _StreamError as error:
+        if error.error is not None:
+            yield error.error
+
+
+def _container_pairs(
+    index: tuple[str | int, ...], actual: _Container, expected: _Container
+) -> Iterator[api.Pair | Exception]:
+    if actual.kind == "object":
+        yield from _object_pairs(index, actual, expected)
+    else:
+        yield from _array_pairs(index, actual, expected)
+
+
+def _object_pairs(
+    index: tuple[str | int, ...], actual: _Container, expected: _Container
+) -> Iterator[api.Pair | Exception]:
+    while True:
+        actual_event, actual_key = actual.next()
+        expected_event, expected_key = expected.next()
+        if actual_event == expected_event == "end_map":
+            return
+        elif actual_event != expected_event or actual_key != expected_key:
+            break
+
+        yield api.Pair(
+            index=(*index, actual_key),
+            actual=actual.value(*actual.next()),
+            expected=expected.value(*expected.next()),
+        )
+
+    # the keys diverge and thus the remaining members of both objects are parsed to compare them as mappings
+    result = collections_mapping(
+        api.Pair(
+            index=index,
+            actual=_remaining_members(actual, actual_event, actual_key),
+            expected=_remaining_members(expected, expected_event, expected_key),
+        )
+    )
+    if isinstance(result, Exception):
+        yield result
+    else:
+        yield from typing.cast(Iterable[api.Pair], result)
+
+
+def _remaining_members(container: _Container, event: str, key: Any) -> dict[str, Any]:
+    members = {}
+    while event == "map_key":
+        members[key] = container.build(*container.next())
+        event, key = container.next()
+    return members
+
+
+def _array_pairs(
+    index: tuple[str | int, ...], actual: _Container, expected: _Container
+) -> Iterator[api.Pair | Exception]:
+    for i in itertools.count():
+        actual_event, actual_value = actual.next()
+        expected_event, expected_value = expected.next()
+        if actual_event == expected_event == "end_array":
+            return
+        elif actual_event == "end_array" or expected_event == "end_array":
+            remaining = expected if actual_event == "end_array" else actual
+            n = i + 1 + _count_items(remaining)
+            la, le = (i, n) if actual_event == "end_array" else (n, i)
+            yield ValueError(f"sequence length mismatches: {la} != {le}")
+            return
+
+        yield api.Pair(
+            index=(*index, i),
+            actual=actual.value(actual_event, actual_value),
+            expected=expected.value(expected_event, expected_value),
+        )
+
+
+def _count_items(container: _Container) -> int:
+    n = 0
+    while container.next()[0] != "end_array":
+        n += 1
+    return n
+
+
+def _file_pairs(p: api.Pair) -> Iterator[api.Pair | Exception]:
+    json_lines = all(
+        os.path.splitext(path)[1].lower() in _JSON_LINES_SUFFIXES
+        for path in (p.actual, p.expected)
+    )
+    with contextlib.ExitStack() as stack:
+        try:
+            files = [
+                stack.enter_context(_open(path, json_lines=json_lines))
+                for path in (p.actual, p.expected)
+            ]
+        except OSError as error:
+            yield error
+            return
+
+        if json_lines:
+            yield from _json_lines_pairs(p.index, *files)
+        else:
+            yield from _catch(_document_pairs(p.index, *files))
+
+
+def _open(path: os.PathLike, *, json_lines: bool) -> IO:
+    # ijson decodes the input itself and is considerably faster on binary files
+    if not json_lines and is_available(_ijson_events):
+        return open(path, "rb")
+
+    return open(path, encoding="utf-8")
+
+
+def _document_pairs(
+    index: tuple[str | int, ...], actual_file: IO, expected_file: IO
+) -> Iterator[api.Pair | Exception]:
+    actual_stream, expected_stream = streams = [
+        _Stream(
+            _ijson_events(file) if is_available(_ijson_events) else _stdlib_events(file)
+        )
+        for file in (actual_file, expected_file)
+    ]
+
+    try:
+        yield from _root_pairs(index, actual_stream, expected_stream)
+
+        # parse the remainders of the documents to detect errors, e.g. trailing data
+        for stream in streams:
+            stream.skip(0)
+            # the final event is only emitted if there is no trailing data
+            stream.next()
+    except _StreamError:
+        # the files are closed after a parse error, while values parsed from the other file might still be unpacked
+        for stream in streams:
+            stream.release()
+        raise
+
+
+def _root_pairs(
+    index: tuple[str | int, ...], actual_stream: _Stream, expected_stream: _Stream
+) -> Iterator[api.Pair | Exception]:
+    # the root values are only referenced here, so that they are not kept for replaying once they are skipped
+    actual = actual_stream.value(*actual_stream.next())
+    expected = expected_stream.value(*expected_stream.next())
+    if isinstance(actual, _Container) and isinstance(expected, _Container):
+        if actual.kind == expected.kind:
+            yield from _container_pairs(index, actual, expected)
+        else:
+            yield _kind_mismatch(actual, expected)
+    elif isinstance(actual, _Container) or isinstance(expected, _Container):
+        yield _kind_mismatch(actual, expected)
+    else:
+        yield api.Pair(index=index, actual=actual, expected=expected)
+
+
+def _json_lines_pairs(
+    index: tuple[str | int, ...], actual_file: IO, expected_file: IO
+) -> Iterator[api.Pair | Exception]:
+    exhausted = object()
+    try:
+        for i, (actual, expected) in enumerate(
+            itertools.zip_longest(
+                _json_lines(actual_file, "actual"),
+                _json_lines(expected_file, "expected"),
+                fillvalue=exhausted,
+            )
+        ):
+            if actual is exhausted or expected is exhausted:
+                yield _length_mismatch(
+                    "JSON Lines", i, actual_exhausted=actual is exhausted
+                )
+                return
+
+            yield api.Pair(index=(*index, i), actual=actual, expected=expected)
+    except ValueError as error:
+        yield error
+
+
+def _json_lines(file: IO, name: str) -> Iterator[Any]:
+    for number, line in enumerate(file, 1):
+        if not line.strip():
+            continue
+
+        try:
+            yield json.loads(line)
+        except ValueError as error:
+            raise ValueError(
+                f"line {number} of {name} is invalid JSON: {error}"
+            ) from None
+
+
+@available_if("ijson")
+def _ijson_events(file: IO) -> Iterator[tuple[str, Any]]:
+    import ijson
+
+    yield from ijson.basic_parse(file, use_float=True)
+    yield "end", None
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_CONSTANTS = {
+    "null": None,
+    "true": True,
+    "false": False,
+    "NaN": math.nan,
+    "Infinity": math.inf,
+    "-Infinity": -math.inf,
+}
+_CONSTANT_EVENTS = {type(None): "null", bool: "boolean", float: "number"}
+_MAX_CONSTANT_LENGTH = max(map(len, _CONSTANTS))
+_CHUNK_SIZE = 1 << 16
+# everything up to the closing quote of a string, an invalid control character, or a trailing backslash
+_STRING_BODY = re.compile(r'(?:[^"\\\x00-\x1f]+|\\[\s\S])*')
+
+
+class _Reader:
+    def __init__(self, file: IO) -> None:
+        self._file = file
+        self._buffer = ""
+        self._pos = 0
+        # offset of the buffer in the file
+        self._offset = 0
+
+    def _fill(self) -> bool:
+        chunk = self._file.read(_CHUNK_SIZE)
+        if not chunk:
+            return False
+
+        self._offset += self._pos
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def error(self, msg: str) -> ValueError:
+        return ValueError(f"{msg}: char {self._offset + self._pos}")
+
+    def peek(self) -> str:
+        # skips whitespace and returns the next character or an empty string at the end of the file
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()  # type: ignore[union-attr]
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            elif not self._fill():
+                return ""
+
+    def advance(self) -> None:
+        self._pos += 1
+
+    def string(self) -> str:
+        end = _STRING_BODY.match(self._buffer, self._pos + 1).end()  # type: ignore[union-attr]
+        if end == len(self._buffer) or self._buffer[end] == "\\":
+            # Long strings continue in the next chunks, which are only joined once the end of the string is found rather
+            # than each time one of them is read. Thus, only the data of each new chunk is searched.
+            chunks = [self._buffer[self._pos :]]
+            # a trailing backslash escapes the first character of the next chunk
+            skip = int(end < len(self._buffer))
+            while chunk := self._file.read(_CHUNK_SIZE):
+                chunks.append(chunk)
+                end = _STRING_BODY.match(chunk, skip).end()  # type: ignore[union-attr]
+                if end < len(chunk) and chunk[end] != "\\":
+                    break
+                skip = int(end < len(chunk))
+
+            self._offset += self._pos
+            self._buffer = "".join(chunks)
+            self._pos = 0
+
+        # invalid strings are reported as soon as the invalid character is read rather than at the end of the file
+        value: str
+        try:
+            value, self._pos = scanstring(self._buffer, self._pos + 1)
+        except json.JSONDecodeError as error:
+            self._pos = error.pos
+            raise self.error(error.msg) from None
+        return value
+
+    def scalar(self) -> tuple[str, Any]:
+        # numbers and constants at the end of the buffer might be continued in the next chunk
+        while len(self._buffer) - self._pos < _MAX_CONSTANT_LENGTH and self._fill():
+            pass
+        # the next chunk might also continue an incomplete fraction or exponent, e.g. "1." or "1e+", which are not matched
+        while (
+            (match := json.scanner.NUMBER_RE.match(self._buffer, self._pos))
+            and len(self._buffer) - match.end() < 3
+            and self._fill()
+        ):
+            pass
+
+        if match is not None:
+            integer, fraction, exponent = match.groups()
+            self._pos = match.end()
+            if fraction or exponent:
+                return "number", float(integer + (fraction or "") + (exponent or ""))
+            return "number", int(integer)
+
+        for name, value in _CONSTANTS.items():
+            if self._buffer.startswith(name, self._pos):
+                self._pos += len(name)
+                return _CONSTANT_EVENTS[type(value)], value
+
+        raise self.error("Expecting value")
+
+
+def _stdlib_events(file: IO) -> Iterator[tuple[str, Any]]:
+    reader = _Reader(file)
+    # each item is True for objects and False for arrays
+    containers: list[bool] = []
+    expect = "value"
+    while True:
+        char = reader.peek()
+        if expect in {"value", "first_value"}:
+            if char == "]" and expect == "first_value":
+                reader.advance()
+                containers.pop()
+                yield "end_array", None
+            elif char == "{":
+                reader.advance()
+                containers.append(True)
+                yield "start_map", None
+                expect = "first_key"
+                continue
+            elif char == "[":
+                reader.advance()
+                containers.append(False)
+                yield "start_array", None
+                expect = "first_value"
+                continue
+            elif char == '"':
+                yield "string", reader.string()
+            else:
+                yield reader.scalar()
+            expect = "separator" if containers else "end"
+        elif expect in {"key", "first_key"}:
+            if char == "}" and expect == "first_key":
+                reader.advance()
+                containers.pop()
+                yield "end_map", None
+                expect = "separator" if containers else "end"
+            elif char == '"':
+                key = reader.string()
+                if reader.peek() != ":":
+                    raise reader.error("Expecting ':' delimiter")
+                reader.advance()
+                yield "map_key", key
+                expect = "value"
+            else:
+                raise reader.error("Expecting property name enclosed in double quotes")
+        elif expect == "separator":
+            is_object = containers[-1]
+            if char == ",":
+                reader.advance()
+                expect = "key" if is_object else "value"
+            elif char == ("}" if is_object else "]"):
+                reader.advance()
+                containers.pop()
+                yield ("end_map" if is_object else "end_array"), None
+                expect = "separator" if containers else "end"
+            else:
+                raise reader.error("Expecting ',' delimiter")
+        else:
+            if char:
+                raise reader.error("Extra data")
+            yield "end", None
+            return
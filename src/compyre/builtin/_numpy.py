@@ -1,8 +1,22 @@
-from typing import Annotated
+from __future__ import annotations
 
-from compyre import alias, api, utils
+import collections
+import concurrent.futures
+import itertools
+import os
+from collections.abc import Callable, Iterable, Sequence
+from typing import Annotated, Any, Literal
+
+from compyre import _budget, alias, api, utils
 from compyre._availability import available_if
 
+_CHUNK_SIZE = 1 << 24
+
+# number of mismatches, maximum absolute difference among them, and the index and values of the first mismatch
+_BlockMismatches = tuple[int, float, tuple[tuple[int, ...], Any, Any] | None]
+# index of the first element of a block and the slices to select it
+_Block = tuple[tuple[int, ...], tuple[slice, ...]]
+
 
 @available_if("numpy")
 def numpy_ndarray(
@@ -16,6 +30,10 @@ def numpy_ndarray(
 ) -> api.EqualFnResult:
     """Check equality for [numpy.ndarray][]s using [numpy.testing.assert_allclose][].
 
+    If a `timeout` or `max_memory` is set for the comparison, large numeric arrays of the same shape are instead compared
+    in chunks with [numpy.isclose][] and the budget is checked between them. The error message is then built from the
+    chunks as well.
+
     Args:
         p: Pair to be compared.
         rtol: Relative tolerance. See [numpy.testing.assert_allclose][] for details. Can also be set through
@@ -29,7 +47,9 @@ def numpy_ndarray(
     Returns:
        (None): If [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] are not [numpy.ndarray][]s.
        (True): If [numpy.testing.assert_allclose][] returns without error for the input pair.
-       (AssertionError): Any [AssertionError][] raised by [numpy.testing.assert_allclose][] for the input pair.
+       (AssertionError): Any [AssertionError][] raised by [numpy.testing.assert_allclose][] for the input pair, or
+           one describing the mismatches if the inputs are compared in chunks.
+       (compyre.api.BudgetExceededError): If the budget of the comparison is exceeded.
 
     Raises:
         RuntimeError: If [numpy][] is not available.
@@ -40,6 +60,18 @@ def numpy_ndarray(
     if not utils.both_isinstance(p, np.ndarray):
         return None
 
+    if _budget.current() is not None:
+        result = _isclose_chunked(
+            p.actual,
+            p.expected,
+            rtol=rtol,
+            atol=atol,
+            equal_nan=equal_nan,
+            verbose=verbose,
+        )
+        if result is not None:
+            return result
+
     try:
         np.testing.assert_allclose(
             p.actual,
@@ -52,3 +84,186 @@ def numpy_ndarray(
         return True
     except AssertionError as result:
         return result
+
+
+def _isclose_chunked(
+    actual: Any,
+    expected: Any,
+    *,
+    rtol: float,
+    atol: float,
+    equal_nan: bool,
+    verbose: bool,
+) -> Literal[True] | AssertionError | api.BudgetExceededError | None:
+    # Returns None if the inputs cannot be compared in chunks and the caller falls back to
+    # numpy.testing.assert_allclose. Otherwise, the error message is also built from the chunks to avoid temporaries
+    # of the full size of the inputs.
+    if (
+        actual.shape != expected.shape
+        or actual.ndim == 0
+        or actual.nbytes <= _CHUNK_SIZE
+        or not _is_numeric(actual, expected)
+    ):
+        return None
+
+    # chunks are taken along the first axis to avoid copies of non-contiguous arrays
+    step = max(_CHUNK_SIZE * len(actual) // actual.nbytes, 1)
+    results = []
+    for lo in range(0, len(actual), step):
+        if (error := utils.budget_exceeded()) is not None:
+            return error
+
+        results.append(
+            (
+                (lo, *(0,) * (actual.ndim - 1)),
+                _block_mismatches(
+                    actual[lo : lo + step],
+                    expected[lo : lo + step],
+                    numeric=True,
+                    rtol=rtol,
+                    atol=atol,
+                    equal_nan=equal_nan,
+                ),
+            )
+        )
+
+    return _block_mismatches_result(
+        "Arrays",
+        results,
+        unit="chunks",
+        size=actual.size,
+        numeric=True,
+        verbose=verbose,
+    )
+
+
+def _is_numeric(*values: Any) -> bool:
+    import numpy as np
+
+    return all(
+        np.issubdtype(v.dtype, np.number) or np.issubdtype(v.dtype, np.bool_)
+        for v in values
+    )
+
+
+def _blocks(shape: tuple[int, ...], chunks: tuple[int, ...]) -> list[_Block]:
+    # the blocks at the upper edges of the regular grid might be smaller than the chunks
+    chunks = tuple(max(c, 1) for c in chunks)
+    return [
+        (
+            tuple(i * c for i, c in zip(coords, chunks)),
+            tuple(
+                slice(i * c, min((i + 1) * c, s))
+                for i, c, s in zip(coords, chunks, shape)
+            ),
+        )
+        for coords in itertools.product(
+            *[range(-(-s // c)) for s, c in zip(shape, chunks)]
+        )
+    ]
+
+
+def _compare_blocks(
+    tasks: Iterable[tuple[tuple[int, ...], Callable[[], _BlockMismatches]]],
+    *,
+    workers: int | None,
+) -> list[tuple[tuple[int, ...], _BlockMismatches]] | api.BudgetExceededError:
+    # The tasks are created by the caller while the previous ones are running in the background. The number of pending
+    # tasks is limited, since they might hold the data of their blocks.
+    limit = 2 * (workers or os.cpu_count() or 1)
+    executor = concurrent.futures.ThreadPoolExecutor(workers)
+    try:
+        pending: collections.deque[
+            tuple[tuple[int, ...], concurrent.futures.Future[_BlockMismatches]]
+        ] = collections.deque()
+        results = []
+        for offset, task in tasks:
+            if (error := utils.budget_exceeded()) is not None:
+                return error
+
+            pending.append((offset, executor.submit(task)))
+            if len(pending) >= limit:
+                offset, future = pending.popleft()
+                results.append((offset, future.result()))
+
+        results.extend((offset, future.result()) for offset, future in pending)
+        return results
+    finally:
+        # pending comparisons are not needed anymore if the comparison is stopped early
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _block_mismatches(
+    actual: Any,
+    expected: Any,
+    *,
+    numeric: bool,
+    rtol: float,
+    atol: float,
+    equal_nan: bool,
+) -> _BlockMismatches:
+    import numpy as np
+
+    if numeric:
+        mismatch = ~np.isclose(
+            actual, expected, rtol=rtol, atol=atol, equal_nan=equal_nan
+        )
+    else:
+        mismatch = np.asarray(actual != expected)
+        if equal_nan and actual.dtype.kind in "mM" and expected.dtype.kind in "mM":
+            # NaT values are never equal to each other, similar to NaN values
+            mismatch &= ~(np.isnat(actual) & np.isnat(expected))
+
+    n = int(np.count_nonzero(mismatch))
+    if n == 0:
+        return 0, 0.0, None
+
+    diff = 0.0
+    if numeric:
+        # values are promoted first to avoid overflows of unsigned integers and subtractions of booleans
+        dtype = np.result_type(actual, expected, np.float64)
+        # NaN values are ignored unless all differences are NaN
+        diff = float(
+            np.fmax.reduce(
+                np.abs(
+                    actual[mismatch].astype(dtype) - expected[mismatch].astype(dtype)
+                )
+            )
+        )
+    index = tuple(int(i) for i in np.unravel_index(np.argmax(mismatch), mismatch.shape))
+    return n, diff, (index, actual.item(index), expected.item(index))
+
+
+def _block_mismatches_result(
+    name: str,
+    results: Sequence[tuple[tuple[int, ...], _BlockMismatches]],
+    *,
+    unit: str,
+    size: int,
+    numeric: bool,
+    verbose: bool = True,
+) -> Literal[True] | AssertionError:
+    import numpy as np
+
+    mismatches = sum(n for _, (n, _, _) in results)
+    if mismatches == 0:
+        return True
+
+    parts = [
+        f"{name} are not {'close' if numeric else 'equal'}!\n",
+        f"Mismatched elements: {mismatches} / {size}",
+        f"Mismatched {unit}: {sum(n > 0 for _, (n, _, _) in results)} / {len(results)}",
+    ]
+    if numeric:
+        diff = np.fmax.reduce([diff for _, (n, diff, _) in results if n > 0])
+        parts.append(f"Max absolute difference among violations: {diff}")
+
+    if verbose:
+        # only blocks with mismatches have a first mismatch
+        offset, (_, _, (index, a, e)) = next(  # type: ignore[misc]
+            result for result in results if result[1][0] > 0
+        )
+        index = tuple(o + i for o, i in zip(offset, index))
+        parts.append(f"\nMismatch at index {index}: {a!r} != {e!r}")
+
+    return AssertionError("\n".join(parts))
@@ -0,0 +1,53 @@
+from compyre import api, utils
+from compyre._availability import available_if
+
+
+@utils.value_dependent()
+@available_if("optree")
+def optree_pytree(
+    p: api.Pair, /, *, none_is_leaf: bool = True, namespace: str = ""
+) -> api.UnpackFnResult:
+    """Unpack nested containers in one shot using [optree](https://github.com/metaopt/optree).
+
+    Both inputs are flattened into their leaves and tree structures in native code. If the tree structures are equal,
+    the leaves are returned directly, skipping the unpacking of all intermediate containers.
+
+    !!! info
+
+        If the tree structures differ, [None][] is returned. Thus, subsequent unpacking functions, e.g.
+        [compyre.builtin.unpack_fns.collections_mapping][], can locate the mismatch. Dictionaries with the same keys in
+        a different order have equal tree structures, while [collections.OrderedDict][]s do not.
+
+    Args:
+        p: Pair to be unpacked.
+        none_is_leaf: Whether [None][] is treated as leaf rather than as empty container.
+        namespace: Namespace of custom node types registered with [optree](https://github.com/metaopt/optree).
+
+    Returns:
+       (None): If [`p.actual`][compyre.api.Pair] is a leaf or the inputs have different tree structures.
+       (collections.abc.Iterator[api.Pair]): The [`actual`][compyre.api.Pair] and [`expected`][compyre.api.Pair]
+            values of each pair are the corresponding leaves of the inputs, while the [`index`][compyre.api.Pair]
+            is `p.index` extended by the path of the leaf.
+
+    Raises:
+        RuntimeError: If [optree](https://github.com/metaopt/optree) is not available.
+
+    """
+    import optree
+
+    paths, actual_leaves, actual_spec = optree.tree_flatten_with_path(
+        p.actual, none_is_leaf=none_is_leaf, namespace=namespace
+    )
+    if actual_spec.is_leaf():
+        return None
+
+    expected_leaves, expected_spec = optree.tree_flatten(
+        p.expected, none_is_leaf=none_is_leaf, namespace=namespace
+    )
+    if expected_spec != actual_spec:
+        return None
+
+    return (
+        api.Pair(index=(*p.index, *path), actual=a, expected=e)
+        for path, a, e in zip(paths, actual_leaves, expected_leaves)
+    )
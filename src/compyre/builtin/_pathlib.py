@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import concurrent.futures
+import mmap
+import os
+import pathlib
+from collections.abc import Iterator
+from typing import Any
+
+from compyre import api, utils
+from compyre._availability import available_if, is_available
+
+from ._json import _JSON_LINES_SUFFIXES, _Container, json_file
+
+__all__ = ["pathlib_path"]
+
+_CHUNK_SIZE = 1 << 20
+
+
+class _DifferentFile(os.PathLike):
+    """Path of a file returned by a directory comparison, whose contents are already known to differ."""
+
+    def __init__(self, path: pathlib.Path) -> None:
+        self.path = path
+
+    def __fspath__(self) -> str:
+        return os.fspath(self.path)
+
+    def __repr__(self) -> str:
+        return repr(self.path)
+
+
+def pathlib_path(
+    p: api.Pair, /, *, shallow: bool = False, workers: int | None = None
+) -> api.UnpackFnResult:
+    """Unpack directories into their files and files into their contents.
+
+    For directories, the relative paths of all files in both trees are compared first. Afterwards, the contents of all
+    files are compared bytewise in chunks by a thread pool. Only the files that differ are returned, so that their
+    contents can be compared by the format-aware functions:
+
+    - `.json`, `.jsonl`, and `.ndjson` files are unpacked by [compyre.builtin.unpack_fns.json_file][].
+    - `.npy` files are loaded as memory-mapped [numpy.ndarray][]s if [numpy](https://numpy.org) is available.
+    - All other files are memory-mapped and returned as [memoryview][]s, e.g. to be compared by
+      [compyre.builtin.equal_fns.builtins_bytes][].
+
+    !!! info
+
+        Files with different sizes are never read for the bytewise comparison. With `shallow` set, files with the same
+        size and modification time are considered equal without reading them, similar to [filecmp.cmp][]. Empty
+        directories and symbolic links to directories are ignored.
+
+    Args:
+        p: Pair to be unpacked.
+        shallow: Whether files with the same size and modification time are considered equal without reading them.
+        workers: Maximum number of threads comparing files concurrently. Defaults to the default of
+            [concurrent.futures.ThreadPoolExecutor][].
+
+    Returns:
+        (None): If [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] are neither
+            [os.PathLike][] objects nor values of JSON files.
+        (collections.abc.Iterator[api.Pair]): For directories, the [`actual`][compyre.api.Pair] and
+            [`expected`][compyre.api.Pair] values of each pair are the corresponding differing files, while the
+            [`index`][compyre.api.Pair] is `p.index` extended by their relative path. For files, the contents as
+            described above with `p.index`, unless the files are bytewise equal.
+        (ValueError): If the relative paths of the files in the directories mismatch or one input is a directory
+            while the other is a file.
+        (FileNotFoundError): If either input does not exist.
+
+    """
+    if utils.either_isinstance(p, _Container):
+        # values of JSON files, which are unpacked while they are parsed
+        return json_file(p)
+    elif utils.both_isinstance(p, _DifferentFile):
+        # files of directories are not compared bytewise again
+        return _content_pairs(
+            api.Pair(index=p.index, actual=p.actual.path, expected=p.expected.path)
+        )
+    elif not utils.both_isinstance(p, os.PathLike):
+        return None
+
+    kinds = []
+    for path in (p.actual, p.expected):
+        if os.path.isdir(path):
+            kinds.append("directory")
+        elif os.path.isfile(path):
+            kinds.append("file")
+        else:
+            return FileNotFoundError(f"{os.fspath(path)!r} does not exist")
+
+    actual_kind, expected_kind = kinds
+    if actual_kind != expected_kind:
+        return ValueError(f"path kinds mismatch: {actual_kind} != {expected_kind}")
+    elif actual_kind == "file":
+        return _file_items(p, shallow=shallow)
+
+    actual_files = _list_files(p.actual)
+    expected_files = _list_files(p.expected)
+    if actual_files.keys() != expected_files.keys():
+        extra = actual_files.keys() - expected_files.keys()
+        missing = expected_files.keys() - actual_files.keys()
+        return ValueError(
+            f"directory files mismatch:\n\n"
+            f"extra: {', '.join(repr(k) for k in sorted(extra))}\n"
+            f"missing: {', '.join(repr(k) for k in sorted(missing))}\n"
+        )
+
+    return _directory_pairs(
+        p.index,
+        [
+            (name, actual_files[name], expected_files[name])
+            for name in sorted(actual_files)
+        ],
+        shallow=shallow,
+        workers=workers,
+    )
+
+
+def _list_files(root: os.PathLike[str]) -> dict[str, pathlib.Path]:
+    files = {}
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = pathlib.Path(dirpath, filename)
+            files[path.relative_to(root).as_posix()] = path
+    return files
+
+
+def _directory_pairs(
+    index: tuple[str | int, ...],
+    files: list[tuple[str, pathlib.Path, pathlib.Path]],
+    *,
+    shallow: bool,
+    workers: int | None,
+) -> Iterator[api.Pair | Exception]:
+    executor = concurrent.futures.ThreadPoolExecutor(workers)
+    try:
+        futures = [
+            executor.submit(_same_content, actual, expected, shallow=shallow)
+            for _, actual, expected in files
+        ]
+        # the results are awaited in order, while the files are compared concurrently in the background
+        for (name, actual, expected), future in zip(files, futures):
+            if (error := utils.budget_exceeded()) is not None:
+                yield error
+                return
+
+            same = future.result()
+            if isinstance(same, Exception):
+                yield same
+            elif not same:
+                yield api.Pair(
+                    index=(*index, name),
+                    actual=_DifferentFile(actual),
+                    expected=_DifferentFile(expected),
+                )
+    finally:
+        # pending comparisons are not needed anymore if the comparison is stopped early
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _same_content(
+    actual: str | os.PathLike, expected: str | os.PathLike, *, shallow: bool
+) -> bool | OSError:
+    try:
+        actual_stat = os.stat(actual)
+        expected_stat = os.stat(expected)
+        if actual_stat.st_size != expected_stat.st_size:
+            return False
+        elif shallow and actual_stat.st_mtime_ns == expected_stat.st_mtime_ns:
+            return True
+
+        with open(actual, "rb") as actual_file, open(expected, "rb") as expected_file:
+            while True:
+                actual_chunk = actual_file.read(_CHUNK_SIZE)
+                if actual_chunk != expected_file.read(_CHUNK_SIZE):
+                    return False
+                elif not actual_chunk:
+                    return True
+    except OSError as error:
+        return error
+
+
+def _file_items(p: api.Pair, *, shallow: bool) -> api.UnpackFnResult:
+    same = _same_content(p.actual, p.expected, shallow=shallow)
+    if isinstance(same, Exception):
+        return same
+    elif same:
+        return ()
+
+    return _content_pairs(p)
+
+
+def _content_pairs(p: api.Pair) -> api.UnpackFnResult:
+    suffix = os.path.splitext(p.actual)[1].lower()
+    if suffix == os.path.splitext(p.expected)[1].lower():
+        if suffix in {".json", *_JSON_LINES_SUFFIXES}:
+            return json_file(p)
+        elif suffix == ".npy" and is_available(_load_npy):
+            try:
+                actual, expected = _load_npy(p.actual), _load_npy(p.expected)
+            except Exception as error:
+                return error
+
+            return [api.Pair(index=p.index, actual=actual, expected=expected)]
+
+    try:
+        actual, expected = _map(p.actual), _map(p.expected)
+    except OSError as error:
+        return error
+
+    return [api.Pair(index=p.index, actual=actual, expected=expected)]
+
+
+@available_if("numpy")
+def _load_npy(path: os.PathLike) -> Any:
+    import numpy as np
+
+    return np.load(path, mmap_mode="r", allow_pickle=False)
+
+
+def _map(path: os.PathLike) -> memoryview | bytes:
+    with open(path, "rb") as file:
+        # empty files cannot be memory-mapped
+        if os.fstat(file.fileno()).st_size == 0:
+            return b""
+
+        # the mapping stays valid after the file is closed
+        return memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
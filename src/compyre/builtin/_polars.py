@@ -0,0 +1,164 @@
+from typing import Annotated, Any
+
+from compyre import alias, api, utils
+from compyre._availability import available_if
+
+_MAX_REPORTED = 5
+
+
+@available_if("polars")
+def polars_dataframe(
+    p: api.Pair,
+    /,
+    *,
+    rtol: Annotated[float, alias.RELATIVE_TOLERANCE] = 1e-5,
+    atol: Annotated[float, alias.ABSOLUTE_TOLERANCE] = 1e-8,
+    equal_nan: Annotated[bool, alias.NAN_EQUALITY] = True,
+) -> api.EqualFnResult:
+    """Check equality for [polars](https://pola.rs) `DataFrame`s and `LazyFrame`s.
+
+    After the schemas are compared, all columns are compared in a single lazy query that is executed by the
+    multi-threaded engine of [polars](https://pola.rs). Numeric columns are compared with the same semantics as
+    [numpy.isclose][], while all other columns are compared exactly. Nulls are only equal to nulls. The query only
+    collects the number of mismatches per column and the first mismatching rows. Thus, `LazyFrame`s are never
+    collected in full.
+
+    Args:
+        p: Pair to be compared.
+        rtol: Relative tolerance. See [numpy.isclose][] for details. Can also be set through
+              [compyre.alias.RELATIVE_TOLERANCE][].
+        atol: Absolute tolerance. See [numpy.isclose][] for details. Can also be set through
+              [compyre.alias.ABSOLUTE_TOLERANCE][].
+        equal_nan: Whether two `NaN` values are considered equal. Can also be set through
+              [compyre.alias.NAN_EQUALITY][].
+
+    Returns:
+       (None): If [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] are not `DataFrame`s or
+            `LazyFrame`s.
+       (True): If the inputs have the same schema and height and all values are equal or close.
+       (AssertionError): If the schemas or heights of the inputs mismatch or any values are not equal or close. The
+            message contains the first mismatching rows.
+
+    Raises:
+        RuntimeError: If [polars](https://pola.rs) is not available.
+
+    """
+    import polars as pl
+
+    if not utils.both_isinstance(p, (pl.DataFrame, pl.LazyFrame)):
+        return None
+
+    actual, expected = p.actual.lazy(), p.expected.lazy()
+    schema = actual.collect_schema()
+    if schema != (expected_schema := expected.collect_schema()):
+        return AssertionError(
+            f"Polars schemas mismatch:\n\n"
+            f"actual:   {dict(schema)}\n"
+            f"expected: {dict(expected_schema)}"
+        )
+
+    # the heights are compared upfront, because inputs can only be concatenated horizontally if they match
+    actual_height, expected_height = (
+        frame.item()
+        for frame in pl.collect_all(
+            [actual.select(pl.len()), expected.select(pl.len())]
+        )
+    )
+    if actual_height != expected_height:
+        return AssertionError(
+            f"Polars heights mismatch: {actual_height} != {expected_height}"
+        )
+
+    names = schema.names()
+    if not names:
+        return True
+
+    # the columns are renamed, so that both inputs can be concatenated horizontally without name clashes
+    frame = pl.concat(
+        [
+            actual.select(
+                pl.col(name).alias(f"actual_{i}") for i, name in enumerate(names)
+            ),
+            expected.select(
+                pl.col(name).alias(f"expected_{i}") for i, name in enumerate(names)
+            ),
+        ],
+        how="horizontal",
+    ).with_columns(
+        _mismatch(
+            pl.col(f"actual_{i}"),
+            pl.col(f"expected_{i}"),
+            numeric=dtype.is_numeric(),
+            rtol=rtol,
+            atol=atol,
+            equal_nan=equal_nan,
+        ).alias(f"mismatch_{i}")
+        for i, dtype in enumerate(schema.dtypes())
+    )
+    mismatch_columns = [f"mismatch_{i}" for i in range(len(names))]
+
+    # both queries share the plan above, which is executed only once
+    counts, rows = pl.collect_all(
+        [
+            frame.select(
+                pl.any_horizontal(mismatch_columns).sum().alias("rows"),
+                *[pl.col(c).sum() for c in mismatch_columns],
+            ),
+            frame.with_row_index("row")
+            .filter(pl.any_horizontal(mismatch_columns))
+            .head(_MAX_REPORTED),
+        ]
+    )
+
+    mismatching_rows, *mismatches = counts.row(0)
+    if mismatching_rows == 0:
+        return True
+
+    numeric = any(dtype.is_numeric() for dtype in schema.dtypes())
+    parts = [
+        f"Polars frames are not {'close' if numeric else 'equal'}!\n",
+        "Mismatched elements per column:\n",
+        *(
+            f"{name}: {n} / {actual_height}"
+            for name, n in zip(names, mismatches)
+            if n > 0
+        ),
+        "",
+    ]
+    for row in rows.iter_rows(named=True):
+        cells = ", ".join(
+            f"{name}: {row[f'actual_{i}']!r} != {row[f'expected_{i}']!r}"
+            for i, name in enumerate(names)
+            if row[f"mismatch_{i}"]
+        )
+        parts.append(f"row {row['row']}: {cells}")
+    if mismatching_rows > rows.height:
+        parts.append("...")
+
+    return AssertionError("\n".join(parts))
+
+
+def _mismatch(
+    actual: Any,
+    expected: Any,
+    *,
+    numeric: bool,
+    rtol: float,
+    atol: float,
+    equal_nan: bool,
+) -> Any:
+    import polars as pl
+
+    if not numeric:
+        return actual.ne_missing(expected)
+
+    actual, expected = actual.cast(pl.Float64), expected.cast(pl.Float64)
+    # infinite values are only close to themselves and polars considers NaN values equal to each other
+    close = (
+        ((actual - expected).abs() <= atol + rtol * expected.abs())
+        & actual.is_finite()
+        & expected.is_finite()
+    ) | ((actual == expected) & actual.is_not_nan())
+    if equal_nan:
+        close = close | (actual.is_nan() & expected.is_nan())
+    return ~close.fill_null(False) & ~(actual.is_null() & expected.is_null())
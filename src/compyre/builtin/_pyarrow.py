@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Annotated, Any
+
+from compyre import alias, api, utils
+from compyre._availability import available_if
+
+_MAX_REPORTED = 5
+
+
+@available_if("pyarrow")
+def pyarrow_table(p: api.Pair, /) -> api.UnpackFnResult:
+    """Unpack [pyarrow.Table][]s and [pyarrow.RecordBatch][]es into their columns.
+
+    The schemas of the inputs, i.e. the names and types of the columns, are compared before any data is touched. The
+    columns are returned without copying them, e.g. to be compared by [compyre.builtin.equal_fns.pyarrow_array][].
+
+    Args:
+        p: Pair to be unpacked.
+
+    Returns:
+        (None): If [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] are not [pyarrow.Table][]s or
+            [pyarrow.RecordBatch][]es.
+        (list[api.Pair]): The [`actual`][compyre.api.Pair] and [`expected`][compyre.api.Pair] values of each pair are
+            the corresponding columns of the inputs, while the [`index`][compyre.api.Pair] is `p.index` extended by the
+            column name.
+        (ValueError): If the schemas or the number of rows of the inputs mismatch.
+
+    Raises:
+        RuntimeError: If [pyarrow](https://arrow.apache.org/docs/python/) is not available.
+
+    """
+    import pyarrow as pa
+
+    if not utils.both_isinstance(p, (pa.Table, pa.RecordBatch)):
+        return None
+
+    if not p.actual.schema.equals(p.expected.schema):
+        return ValueError(
+            f"Arrow schemas mismatch:\n\n"
+            f"actual:\n{p.actual.schema.to_string(show_schema_metadata=False)}\n\n"
+            f"expected:\n{p.expected.schema.to_string(show_schema_metadata=False)}"
+        )
+    elif p.actual.num_rows != p.expected.num_rows:
+        return ValueError(
+            f"Arrow number of rows mismatch: {p.actual.num_rows} != {p.expected.num_rows}"
+        )
+
+    return [
+        api.Pair(index=(*p.index, name), actual=actual, expected=expected)
+        for name, actual, expected in zip(
+            p.actual.column_names, p.actual.columns, p.expected.columns
+        )
+    ]
+
+
+@available_if("pyarrow")
+def pyarrow_array(
+    p: api.Pair,
+    /,
+    *,
+    rtol: Annotated[float, alias.RELATIVE_TOLERANCE] = 1e-7,
+    atol: Annotated[float, alias.ABSOLUTE_TOLERANCE] = 0.0,
+    equal_nan: Annotated[bool, alias.NAN_EQUALITY] = True,
+) -> api.EqualFnResult:
+    """Check equality for [pyarrow.Array][]s and [pyarrow.ChunkedArray][]s.
+
+    The inputs are compared chunk by chunk, where chunks are sliced without copying them if the chunk layouts of the
+    inputs differ. Integer and floating point values are compared with the same semantics as [numpy.isclose][]: on
+    zero-copy [numpy.ndarray][] views of the chunks if they have no nulls and with [pyarrow.compute][] otherwise. All
+    other types are compared exactly with [pyarrow.Array.equals][]. Nulls are only equal to nulls.
+
+    Args:
+        p: Pair to be compared.
+        rtol: Relative tolerance. See [numpy.isclose][] for details. Can also be set through
+              [compyre.alias.RELATIVE_TOLERANCE][].
+        atol: Absolute tolerance. See [numpy.isclose][] for details. Can also be set through
+              [compyre.alias.ABSOLUTE_TOLERANCE][].
+        equal_nan: Whether two `NaN` values are considered equal. Can also be set through
+              [compyre.alias.NAN_EQUALITY][].
+
+    Returns:
+       (None): If [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] are not [pyarrow.Array][]s or
+            [pyarrow.ChunkedArray][]s.
+       (True): If the inputs have the same type and length and all values are equal or close.
+       (AssertionError): If the types or lengths of the inputs mismatch or any values are not equal or close. The
+            message contains the row indices of the first mismatches.
+       (compyre.api.BudgetExceededError): If the budget of the comparison is exceeded.
+
+    Raises:
+        RuntimeError: If [pyarrow](https://arrow.apache.org/docs/python/) is not available.
+
+    """
+    import pyarrow as pa
+
+    if not utils.both_isinstance(p, (pa.Array, pa.ChunkedArray)):
+        return None
+
+    if p.actual.type != p.expected.type:
+        return AssertionError(
+            f"Arrow types mismatch: {p.actual.type} != {p.expected.type}"
+        )
+    elif len(p.actual) != len(p.expected):
+        return AssertionError(
+            f"Arrow lengths mismatch: {len(p.actual)} != {len(p.expected)}"
+        )
+
+    numeric = pa.types.is_integer(p.actual.type) or pa.types.is_floating(p.actual.type)
+
+    mismatches = 0
+    reported: list[str] = []
+    for offset, actual, expected in _aligned_chunks(p.actual, p.expected):
+        if (error := utils.budget_exceeded()) is not None:
+            return error
+
+        if numeric:
+            rows = _numeric_mismatches(
+                actual, expected, rtol=rtol, atol=atol, equal_nan=equal_nan
+            )
+        elif actual.equals(expected):
+            continue
+        else:
+            rows = _exact_mismatches(actual, expected)
+
+        mismatches += len(rows)
+        reported.extend(
+            f"row {offset + i}: {actual[i].as_py()!r} != {expected[i].as_py()!r}"
+            for i in rows[: _MAX_REPORTED - len(reported)]
+        )
+
+    if mismatches == 0:
+        return True
+
+    return AssertionError(
+        "\n".join(
+            [
+                f"Arrow values are not {'close' if numeric else 'equal'}!\n",
+                f"Mismatched elements: {mismatches} / {len(p.actual)}\n",
+                *reported,
+                *(["..."] if mismatches > len(reported) else []),
+            ]
+        )
+    )
+
+
+def _aligned_chunks(actual: Any, expected: Any) -> Iterator[tuple[int, Any, Any]]:
+    import pyarrow as pa
+
+    actual_chunks, expected_chunks = (
+        iter(value.chunks if isinstance(value, pa.ChunkedArray) else [value])
+        for value in (actual, expected)
+    )
+    actual_chunk = expected_chunk = None
+    offset = 0
+    while True:
+        # empty chunks are skipped, since they do not contribute any rows
+        while actual_chunk is None or len(actual_chunk) == 0:
+            actual_chunk = next(actual_chunks, None)
+            if actual_chunk is None:
+                return
+        while expected_chunk is None or len(expected_chunk) == 0:
+            expected_chunk = next(expected_chunks)
+
+        # slices are zero-copy views into the chunks
+        length = min(len(actual_chunk), len(expected_chunk))
+        yield offset, actual_chunk.slice(0, length), expected_chunk.slice(0, length)
+
+        offset += length
+        actual_chunk = actual_chunk.slice(length)
+        expected_chunk = expected_chunk.slice(length)
+
+
+def _numeric_mismatches(
+    actual: Any, expected: Any, *, rtol: float, atol: float, equal_nan: bool
+) -> list[int]:
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if actual.null_count == 0 and expected.null_count == 0:
+        close = np.isclose(
+            actual.to_numpy(zero_copy_only=True),
+            expected.to_numpy(zero_copy_only=True),
+            rtol=rtol,
+            atol=atol,
+            equal_nan=equal_nan,
+        )
+        return np.flatnonzero(~close).tolist()
+
+    # unsafe casts are needed for integers that are not exactly representable as float
+    a = pc.cast(actual, pa.float64(), safe=False)
+    e = pc.cast(expected, pa.float64(), safe=False)
+    # infinite values are only close to themselves
+    close = pc.or_(
+        pc.equal(a, e),
+        pc.and_(
+            pc.and_(pc.is_finite(a), pc.is_finite(e)),
+            pc.less_equal(
+                pc.abs(pc.subtract(a, e)), pc.add(pc.multiply(pc.abs(e), rtol), atol)
+            ),
+        ),
+    )
+    if equal_nan:
+        close = pc.or_(close, pc.and_(pc.is_nan(a), pc.is_nan(e)))
+    # the comparisons above are null if either value is null
+    close = pc.if_else(
+        pc.and_(pc.is_null(a), pc.is_null(e)), True, pc.fill_null(close, False)
+    )
+    rows: list[int] = pc.indices_nonzero(pc.invert(close)).to_pylist()
+    return rows
+
+
+def _exact_mismatches(actual: Any, expected: Any) -> list[int]:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    try:
+        equal = pc.equal(actual, expected)
+    except pa.ArrowNotImplementedError:
+        # nested types cannot be compared by pyarrow.compute
+        return [
+            i
+            for i, (a, e) in enumerate(zip(actual.to_pylist(), expected.to_pylist()))
+            if a != e
+        ]
+
+    equal = pc.if_else(
+        pc.and_(pc.is_null(actual), pc.is_null(expected)),
+        True,
+        pc.fill_null(equal, False),
+    )
+    rows: list[int] = pc.indices_nonzero(pc.invert(equal)).to_pylist()
+    return rows
@@ -16,9 +16,9 @@ def pydantic_model(p: api.Pair, /) -> api.UnpackFnResult:
     Returns:
         (None): If [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] are not
             [pydantic.BaseModel][]s.
-        (list[api.Pair]): The [`actual`][compyre.api.Pair] and [`expected`][compyre.api.Pair] values of each pair are
-            the corresponding values of the input models, while the [`index`][compyre.api.Pair] is `p.index` extended
-            by the corresponding field name.
+        (collections.abc.Iterator[api.Pair]): The [`actual`][compyre.api.Pair] and [`expected`][compyre.api.Pair]
+            values of each pair are the corresponding values of the input models, while the [`index`][compyre.api.Pair]
+            is `p.index` extended by the corresponding field name.
         (ValueError): If the fields of [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] mismatch.
         (Exception): Any [Exception][] raised by [pydantic.BaseModel.model_dump][] for the input pair.
 
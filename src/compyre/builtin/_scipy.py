@@ -0,0 +1,116 @@
+from typing import Annotated, Any
+
+from compyre import alias, api
+from compyre._availability import available_if
+
+_MAX_REPORTED = 5
+
+
+@available_if("scipy>=1.13")
+def scipy_sparse(
+    p: api.Pair,
+    /,
+    *,
+    rtol: Annotated[float, alias.RELATIVE_TOLERANCE] = 1e-7,
+    atol: Annotated[float, alias.ABSOLUTE_TOLERANCE] = 0.0,
+    equal_nan: Annotated[bool, alias.NAN_EQUALITY] = True,
+) -> api.EqualFnResult:
+    """Check equality for [scipy.sparse](https://docs.scipy.org/doc/scipy/reference/sparse.html) matrices and arrays.
+
+    Both inputs are converted to canonical coordinate format, i.e. with sorted coordinates, summed duplicates, and
+    without explicitly stored zeros. Afterwards, the stored values are compared at the union of the coordinates of both
+    inputs with [numpy.isclose][]. Thus, the inputs are never densified and can be in different sparse formats.
+
+    Args:
+        p: Pair to be compared.
+        rtol: Relative tolerance. See [numpy.isclose][] for details. Can also be set through
+              [compyre.alias.RELATIVE_TOLERANCE][].
+        atol: Absolute tolerance. See [numpy.isclose][] for details. Can also be set through
+              [compyre.alias.ABSOLUTE_TOLERANCE][].
+        equal_nan: Whether two `NaN` values are considered equal. Can also be set through
+              [compyre.alias.NAN_EQUALITY][].
+
+    Returns:
+       (None): If [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] are not sparse matrices or
+            arrays.
+       (True): If the inputs have the same shape and all values are close.
+       (AssertionError): If the shapes of the inputs mismatch or any values are not close.
+
+    Raises:
+        RuntimeError: If [scipy](https://scipy.org) is not available.
+
+    """
+    import numpy as np
+    import scipy.sparse
+
+    if not (scipy.sparse.issparse(p.actual) and scipy.sparse.issparse(p.expected)):
+        return None
+
+    if p.actual.shape != p.expected.shape:
+        return AssertionError(
+            f"Sparse shapes mismatch: {p.actual.shape} != {p.expected.shape}"
+        )
+
+    actual_positions, actual_values = _canonicalize(p.actual)
+    expected_positions, expected_values = _canonicalize(p.expected)
+
+    if np.array_equal(actual_positions, expected_positions):
+        positions = actual_positions
+    else:
+        # values that are only stored in one input are compared against the implicit zeros of the other
+        positions = np.union1d(actual_positions, expected_positions)
+        actual_values = _scatter(positions, actual_positions, actual_values)
+        expected_values = _scatter(positions, expected_positions, expected_values)
+
+    exact = any(v.dtype == np.bool_ for v in [actual_values, expected_values])
+    if exact:
+        close = actual_values == expected_values
+    else:
+        close = np.isclose(
+            actual_values, expected_values, rtol=rtol, atol=atol, equal_nan=equal_nan
+        )
+    if close.all():
+        return True
+
+    mismatches = np.flatnonzero(~close)
+    coords = np.unravel_index(positions[mismatches[:_MAX_REPORTED]], p.actual.shape)
+    parts = [
+        f"Sparse values are not close to tolerance rtol={rtol}, atol={atol}!\n",
+        f"Mismatched elements: {mismatches.size} / {int(np.prod(p.actual.shape))}",
+    ]
+    if not exact:
+        dtype = np.result_type(actual_values, expected_values, np.float64)
+        diff = np.abs(
+            actual_values[mismatches].astype(dtype)
+            - expected_values[mismatches].astype(dtype)
+        )
+        parts.append(f"Max absolute difference among violations: {diff.max()}")
+    parts.append("")
+    parts.extend(
+        f"{tuple(int(c) for c in coord)}: {actual_values[i].item()!r} != {expected_values[i].item()!r}"
+        for i, coord in zip(mismatches, zip(*coords))
+    )
+    if mismatches.size > _MAX_REPORTED:
+        parts.append("...")
+
+    return AssertionError("\n".join(parts))
+
+
+def _canonicalize(value: Any) -> tuple[Any, Any]:
+    import numpy as np
+
+    # copies are needed, since canonicalization happens in place
+    coo = value.tocoo(copy=True)
+    coo.sum_duplicates()
+    coo.eliminate_zeros()
+    # flat positions are sorted, because the coordinates are sorted lexicographically
+    positions = np.ravel_multi_index(coo.coords, coo.shape)
+    return positions, coo.data
+
+
+def _scatter(positions: Any, subset: Any, values: Any) -> Any:
+    import numpy as np
+
+    result = np.zeros(positions.shape, dtype=values.dtype)
+    result[np.searchsorted(positions, subset)] = values
+    return result
@@ -1,23 +1,42 @@
 from __future__ import annotations
 
+import array
+import asyncio
 import cmath
+import contextlib
 import dataclasses
+import difflib
+import functools
+import io
+import itertools
 import math
+import operator
+import os
+import re
 from collections import OrderedDict
-from collections.abc import Mapping, Sequence
-from typing import Annotated
+from collections.abc import AsyncIterable, AsyncIterator, Iterator, Mapping, Sequence
+from typing import Annotated, Any, Callable, TypeVar
 
 from compyre import alias, api, utils
 
 __all__ = [
+    "builtins_bytes",
     "builtins_number",
     "builtins_object",
+    "builtins_range",
+    "builtins_str",
+    "collections_async_iterable",
+    "collections_iterator",
     "collections_mapping",
     "collections_ordered_dict",
+    "collections_records",
     "collections_sequence",
     "dataclasses_dataclass",
+    "io_text_file",
 ]
 
+S = TypeVar("S", memoryview, str)
+
 
 def collections_mapping(p: api.Pair, /) -> api.UnpackFnResult:
     """Unpack [collections.abc.Mapping][]s.
@@ -28,34 +47,39 @@ def collections_mapping(p: api.Pair, /) -> api.UnpackFnResult:
     Returns:
         (None): If [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] are not
             [collections.abc.Mapping][]s.
-        (list[api.Pair]): The [`actual`][compyre.api.Pair] and [`expected`][compyre.api.Pair] values of each pair are
-            the corresponding values of the input mappings, while the [`index`][compyre.api.Pair] is `p.index` extended
-            by the corresponding key.
+        (collections.abc.Iterator[api.Pair]): The [`actual`][compyre.api.Pair] and [`expected`][compyre.api.Pair]
+            values of each pair are the corresponding values of the input mappings, while the
+            [`index`][compyre.api.Pair] is `p.index` extended by the corresponding key. The pairs are created lazily.
         (ValueError): If the keys of [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] mismatch.
 
     """
     if not utils.both_isinstance(p, Mapping):
         return None
 
-    extra = p.actual.keys() - p.expected.keys()
-    missing = p.expected.keys() - p.actual.keys()
-    if extra or missing:
+    # comparing the key views does not allocate new sets in contrast to computing the differences
+    if p.actual.keys() != p.expected.keys():
+        extra = p.actual.keys() - p.expected.keys()
+        missing = p.expected.keys() - p.actual.keys()
         return ValueError(
             f"mapping keys mismatch:\n\n"
             f"extra: {', '.join(repr(k) for k in sorted(extra))}\n"
             f"missing: {', '.join(repr(k) for k in sorted(missing))}\n"
         )
 
-    return [
-        api.Pair(
+    return _mapping_pairs(p)
+
+
+def _mapping_pairs(p: api.Pair) -> Iterator[api.Pair]:
+    expected = p.expected
+    for k, v in p.actual.items():
+        yield api.Pair(
             index=(*p.index, k if isinstance(k, int) else str(k)),
             actual=v,
-            expected=p.expected[k],
+            expected=expected[k],
         )
-        for k, v in p.actual.items()
-    ]
 
 
+@utils.value_dependent(array.array, memoryview)
 def collections_sequence(p: api.Pair, /) -> api.UnpackFnResult:
     """Unpack [collections.abc.Sequence][]s.
 
@@ -65,22 +89,233 @@ def collections_sequence(p: api.Pair, /) -> api.UnpackFnResult:
     Returns:
         (None): If [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] are not
             [collections.abc.Sequence][]s.
-        (list[api.Pair]): The [`actual`][compyre.api.Pair] and [`expected`][compyre.api.Pair] values of each pair are
-            the corresponding items of the input sequences, while the [`index`][compyre.api.Pair] is `p.index` extended
-            by the corresponding index.
+        (collections.abc.Iterator[api.Pair]): The [`actual`][compyre.api.Pair] and [`expected`][compyre.api.Pair]
+            values of each pair are the corresponding items of the input sequences, while the
+            [`index`][compyre.api.Pair] is `p.index` extended by the corresponding index. The pairs are created lazily.
         (ValueError): If the length of [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] mismatch.
 
     """
-    if not utils.both_isinstance(p, Sequence) or utils.either_isinstance(p, str):
+    if (
+        not utils.both_isinstance(p, Sequence)
+        or utils.either_isinstance(p, str)
+        or (_is_binary(p.actual) and _is_binary(p.expected))
+        or utils.both_isinstance(p, range)
+    ):
         return None
 
     if (la := len(p.actual)) != (le := len(p.expected)):
         return ValueError(f"sequence length mismatches: {la} != {le}")
 
-    return [
-        api.Pair(index=(*p.index, i), actual=v, expected=p.expected[i])
-        for i, v in enumerate(p.actual)
-    ]
+    return (
+        api.Pair(index=(*p.index, i), actual=a, expected=e)
+        for i, (a, e) in enumerate(zip(p.actual, p.expected))
+    )
+
+
+@utils.value_dependent(Sequence)
+def collections_records(p: api.Pair, /) -> api.UnpackFnResult:
+    """Unpack [collections.abc.Sequence][]s of records that share the same schema directly into their fields.
+
+    The schema, i.e. the type and the keys of [dict][]s or the fields of
+    [`@dataclasses.dataclass`][dataclasses.dataclass]es, is taken from the first records. A field extractor specialized
+    for it is cached and used for all records. Thus, the keys are only checked once per schema rather than diffed for
+    every record, and the records are not unpacked individually.
+
+    !!! info
+
+        Records that deviate from the schema are returned as pair. Thus, subsequent unpacking functions, e.g.
+        [compyre.builtin.unpack_fns.collections_mapping][], compare them and locate the mismatch. The fields of records
+        are returned in the order of the schema. In contrast to [compyre.builtin.unpack_fns.dataclasses_dataclass][],
+        the field values of dataclasses are not converted recursively.
+
+    !!! tip
+
+        Pass `adaptive=True` to [compyre.api.compare][] and related functions to dispatch the field values directly to
+        the functions that handled the same types before. Since whether a sequence holds records depends on its values,
+        this function is never bypassed for sequences.
+
+    Args:
+        p: Pair to be unpacked.
+
+    Returns:
+        (None): If [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] are not
+            [collections.abc.Sequence][]s of the same length, whose first items are non-empty [dict][]s or
+            dataclasses of the same type.
+        (collections.abc.Iterator[api.Pair]): The [`actual`][compyre.api.Pair] and [`expected`][compyre.api.Pair]
+            values of each pair are the corresponding field values of the records, while the
+            [`index`][compyre.api.Pair] is `p.index` extended by the index of the record and the key or field name.
+            For records deviating from the schema, the values are the records themselves and the
+            [`index`][compyre.api.Pair] is only extended by the index of the record. The pairs are created lazily.
+
+    """
+    if (
+        not utils.both_isinstance(p, Sequence)
+        or utils.either_isinstance(p, (str, range))
+        or (_is_binary(p.actual) and _is_binary(p.expected))
+        or not p.actual
+        or len(p.actual) != len(p.expected)
+    ):
+        return None
+
+    actual, expected = p.actual[0], p.expected[0]
+    record_type = type(actual)
+    if type(expected) is not record_type:
+        return None
+    elif record_type is dict:
+        names = tuple(actual)
+        attribute = False
+    elif dataclasses.is_dataclass(record_type) and not isinstance(actual, type):
+        names = tuple(field.name for field in dataclasses.fields(actual))
+        attribute = True
+    else:
+        return None
+
+    if not names:
+        return None
+
+    return _record_pairs(
+        p, record_type=record_type, names=names, get=_record_getter(names, attribute)
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _record_getter(
+    names: tuple[Any, ...], attribute: bool
+) -> Callable[[Any], tuple[Any, ...]]:
+    getter = (operator.attrgetter if attribute else operator.itemgetter)(*names)
+    if len(names) > 1:
+        return getter
+
+    # the getters return the value rather than a tuple for a single name
+    return lambda record: (getter(record),)
+
+
+def _record_pairs(
+    p: api.Pair,
+    *,
+    record_type: type[Any],
+    names: tuple[Any, ...],
+    get: Callable[[Any], tuple[Any, ...]],
+) -> Iterator[api.Pair]:
+    keys = [k if isinstance(k, int) else str(k) for k in names]
+    # dataclasses of the same type always have the same fields, while dicts additionally need the same size, since the
+    # getter only checks that the schema keys are present
+    size = len(names) if record_type is dict else None
+    for i, (actual, expected) in enumerate(zip(p.actual, p.expected)):
+        index = (*p.index, i)
+        if not (
+            type(actual) is record_type is type(expected)
+            and (size is None or len(actual) == size == len(expected))
+        ):
+            yield api.Pair(index=index, actual=actual, expected=expected)
+            continue
+
+        try:
+            actual_values = get(actual)
+            expected_values = get(expected)
+        except (KeyError, AttributeError):
+            yield api.Pair(index=index, actual=actual, expected=expected)
+            continue
+
+        for k, a, e in zip(keys, actual_values, expected_values):
+            yield api.Pair(index=(*index, k), actual=a, expected=e)
+
+
+def collections_async_iterable(p: api.Pair, /) -> api.UnpackFnResult:
+    """Unpack [collections.abc.AsyncIterable][]s incrementally.
+
+    !!! info
+
+        The returned [collections.abc.AsyncIterable][] can only be consumed by [compyre.api.acompare][] and related
+        functions. [compyre.api.compare][] and related functions report a [compyre.api.CompyreError][] instead.
+
+    Args:
+        p: Pair to be unpacked.
+
+    Returns:
+        (None): If [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] are not
+            [collections.abc.AsyncIterable][]s.
+        (collections.abc.AsyncIterable[api.Pair]): The [`actual`][compyre.api.Pair] and
+            [`expected`][compyre.api.Pair] values of each pair are the corresponding items of the input iterables,
+            which are fetched concurrently, while the [`index`][compyre.api.Pair] is `p.index` extended by the
+            corresponding index. If one input is exhausted before the other, a [ValueError][] is yielded last.
+
+    """
+    if not utils.both_isinstance(p, AsyncIterable):
+        return None
+
+    return _async_iterable_pairs(p)
+
+
+async def _async_iterable_pairs(p: api.Pair) -> AsyncIterator[api.Pair | Exception]:
+    actual = aiter(p.actual)
+    expected = aiter(p.expected)
+    exhausted = object()
+    for i in itertools.count():
+        a, e = await asyncio.gather(
+            anext(actual, exhausted), anext(expected, exhausted)
+        )
+        if a is exhausted and e is exhausted:
+            return
+        elif a is exhausted or e is exhausted:
+            yield _length_mismatch("async iterable", i, actual_exhausted=a is exhausted)
+            return
+
+        yield api.Pair(index=(*p.index, i), actual=a, expected=e)
+
+
+def collections_iterator(p: api.Pair, /) -> api.UnpackFnResult:
+    """Unpack [collections.abc.Iterator][]s lazily without materializing them.
+
+    !!! info
+
+        Only a single item of each input is held in memory at a time. Since the inputs are consumed, they cannot be
+        used after the comparison.
+
+    Args:
+        p: Pair to be unpacked.
+
+    Returns:
+        (None): If [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] are not
+            [collections.abc.Iterator][]s.
+        (collections.abc.Iterator[api.Pair]): The [`actual`][compyre.api.Pair] and [`expected`][compyre.api.Pair] values
+            of each pair are the corresponding items of the input iterators, while the [`index`][compyre.api.Pair] is
+            `p.index` extended by the corresponding index. If one input is exhausted before the other, a
+            [ValueError][] is yielded last.
+
+    """
+    if not utils.both_isinstance(p, Iterator):
+        return None
+
+    return _iterator_pairs(p.index, p.actual, p.expected, kind="iterator")
+
+
+def _iterator_pairs(
+    index: tuple[str | int, ...],
+    actual: Iterator,
+    expected: Iterator,
+    *,
+    kind: str,
+    start: int = 0,
+) -> Iterator[api.Pair | Exception]:
+    exhausted = object()
+    for i, (a, e) in enumerate(
+        itertools.zip_longest(actual, expected, fillvalue=exhausted), start
+    ):
+        if a is exhausted or e is exhausted:
+            yield _length_mismatch(kind, i - start, actual_exhausted=a is exhausted)
+            return
+
+        yield api.Pair(index=(*index, i), actual=a, expected=e)
+
+
+def _length_mismatch(kind: str, n: int, *, actual_exhausted: bool) -> ValueError:
+    exhausted, remaining = (
+        ("actual", "expected") if actual_exhausted else ("expected", "actual")
+    )
+    return ValueError(
+        f"{kind} length mismatches: {exhausted} is exhausted after {n} item(s), but {remaining} is not"
+    )
 
 
 def collections_ordered_dict(p: api.Pair, /) -> api.UnpackFnResult:
@@ -97,9 +332,9 @@ def collections_ordered_dict(p: api.Pair, /) -> api.UnpackFnResult:
     Returns:
         (None): If [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] are not
             [collections.abc.Sequence][]s.
-        (list[api.Pair]): The [`actual`][compyre.api.Pair] and [`expected`][compyre.api.Pair] values of each pair are
-            the corresponding values of the inputs, while the [`index`][compyre.api.Pair] is `p.index` extended
-            by the corresponding key.
+        (collections.abc.Iterator[api.Pair]): The [`actual`][compyre.api.Pair] and [`expected`][compyre.api.Pair]
+            values of each pair are the corresponding values of the inputs, while the [`index`][compyre.api.Pair] is
+            `p.index` extended by the corresponding key. The pairs are created lazily.
         (ValueError): If the ordered keys of [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair]
             mismatch.
 
@@ -107,17 +342,14 @@ def collections_ordered_dict(p: api.Pair, /) -> api.UnpackFnResult:
     if not utils.both_isinstance(p, OrderedDict):
         return None
 
-    if (aks := list(p.actual.keys())) != (eks := list(p.expected.keys())):
-        return ValueError(f"ordered keys mismatch: {list(aks)} != {list(eks)}")
-
-    return [
-        api.Pair(
-            index=(*p.index, k if isinstance(k, int) else str(k)),
-            actual=v,
-            expected=p.expected[k],
+    if len(p.actual) != len(p.expected) or any(
+        ak != ek for ak, ek in zip(p.actual.keys(), p.expected.keys())
+    ):
+        return ValueError(
+            f"ordered keys mismatch: {list(p.actual.keys())} != {list(p.expected.keys())}"
         )
-        for k, v in p.actual.items()
-    ]
+
+    return _mapping_pairs(p)
 
 
 def builtins_number(
@@ -173,6 +405,281 @@ def builtins_number(
     )
 
 
+# floating point formats are excluded, since they should be compared with a tolerance rather than bitwise
+_FLOAT_FORMATS = frozenset("efd")
+
+
+def _is_binary(value: object) -> bool:
+    if isinstance(value, (bytes, bytearray)):
+        return True
+    elif isinstance(value, array.array):
+        return value.typecode not in _FLOAT_FORMATS
+    elif isinstance(value, memoryview):
+        return value.format.lstrip("@=<>!") not in _FLOAT_FORMATS
+
+    return False
+
+
+@utils.value_dependent(array.array, memoryview)
+def builtins_bytes(p: api.Pair, /, *, bytes_context: int = 16) -> api.EqualFnResult:
+    """Check equality for binary data without copying it.
+
+    Supported are [bytes][], [bytearray][], and [memoryview][]s as well as [array.array][]s with non-floating point
+    typecodes. The comparison is performed bytewise on [memoryview][]s of the inputs in chunks at C level, after
+    checking that multi-dimensional inputs have the same shape. On a mismatch, the first differing byte offset is
+    located by bisecting the first differing chunk. The budget of the comparison is checked between chunks.
+
+    Args:
+        p: Pair to be compared.
+        bytes_context: Number of bytes before and after the first mismatch to include in the error message.
+
+    Returns:
+       (None): If [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] are not binary data.
+       (True): If the inputs are bytewise equal.
+       (AssertionError): If the inputs are not equal.
+       (compyre.api.BudgetExceededError): If the budget of the comparison is exceeded.
+
+    """
+    if not (_is_binary(p.actual) and _is_binary(p.expected)):
+        return None
+
+    if type(p.actual) is bytes and type(p.expected) is bytes:
+        if p.actual == p.expected:
+            return True
+
+    actual = memoryview(p.actual)
+    expected = memoryview(p.expected)
+    if actual.format != expected.format:
+        # the values are compared with Python semantics, e.g. b"\x01" == array.array("i", [1])
+        if actual == expected:
+            return True
+
+        return AssertionError(
+            f"Buffers with formats {actual.format!r} and {expected.format!r} are not equal!"
+        )
+
+    if actual.shape != expected.shape and (actual.ndim != 1 or expected.ndim != 1):
+        # the shapes are lost when the buffers are cast to bytes
+        return AssertionError(
+            f"Buffer shapes mismatch: {actual.shape} != {expected.shape}"
+        )
+
+    actual = _as_bytes(actual)
+    expected = _as_bytes(expected)
+    n = min(len(actual), len(expected))
+    offset = _first_mismatch(actual, expected, n, equal=_bytes_equal)
+    if isinstance(offset, api.BudgetExceededError):
+        return offset
+    elif offset is None:
+        if len(actual) == len(expected):
+            return True
+        offset = n
+
+    lines = []
+    if len(actual) != len(expected):
+        lines.append(f"Buffer lengths mismatch: {len(actual)} != {len(expected)}")
+    if offset < n:
+        lines.append(f"First mismatch at byte offset {offset}:")
+    else:
+        lines.append(f"First {n} bytes are equal.")
+    lines.append("")
+
+    start = max(offset - bytes_context, 0)
+    for name, buffer in [("actual", actual), ("expected", expected)]:
+        window = buffer[start : offset + bytes_context + 1]
+        lines.append(
+            f"{name + ':':<9} {'... ' if start > 0 else ''}{window.hex(' ')}"
+            f"{' ...' if start + len(window) < len(buffer) else ''}"
+        )
+
+    return AssertionError("\n".join(lines))
+
+
+def _as_bytes(view: memoryview) -> memoryview:
+    if not view.c_contiguous:
+        view = memoryview(view.tobytes())
+    return view.cast("B")
+
+
+# comparing memoryviews is performed itemwise and thus comparing 8 bytes at once is significantly faster
+_WORD_SIZE = 8
+_CHUNK_SIZE = 1 << 20
+
+
+def _bytes_equal(actual: memoryview, expected: memoryview) -> bool:
+    n = len(actual) // _WORD_SIZE * _WORD_SIZE
+    return actual[:n].cast("Q") == expected[:n].cast("Q") and actual[n:] == expected[n:]
+
+
+def _first_mismatch(
+    actual: S, expected: S, n: int, *, equal: Callable[[S, S], bool]
+) -> int | api.BudgetExceededError | None:
+    # Only the first n items are compared. They are not sliced upfront, since that would copy str inputs completely.
+    # Thus, the first mismatching chunk is searched within them.
+    for lo in range(0, n, _CHUNK_SIZE):
+        if (error := utils.budget_exceeded()) is not None:
+            return error
+
+        hi = min(lo + _CHUNK_SIZE, n)
+        if not equal(actual[lo:hi], expected[lo:hi]):
+            break
+    else:
+        return None
+
+    # bisect the chunk while keeping the invariant that the mismatch is in [lo, hi)
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if equal(actual[lo:mid], expected[lo:mid]):
+            lo = mid
+        else:
+            hi = mid
+
+    return lo
+
+
+def builtins_str(
+    p: api.Pair, /, *, str_context: int = 32, diff_lines: int = 0
+) -> api.EqualFnResult:
+    """Check equality for [str][]s with a bounded error message.
+
+    In contrast to [compyre.builtin.equal_fns.builtins_object][], the error message never includes the full inputs. On
+    a mismatch, the first differing character is located by comparing the inputs in chunks and bisecting the first
+    differing chunk. The budget of the comparison is checked between chunks.
+
+    Args:
+        p: Pair to be compared.
+        str_context: Number of characters before and after the first mismatch to include in the error message.
+        diff_lines: Maximum number of lines of a unified diff starting shortly before the line of the first mismatch to
+            include in the error message. Only used if either input has multiple lines.
+
+    Returns:
+       (None): If [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] are not [str][]s. Subclasses
+           are not supported.
+       (True): If the inputs are equal.
+       (AssertionError): If the inputs are not equal.
+       (compyre.api.BudgetExceededError): If the budget of the comparison is exceeded.
+
+    """
+    actual = p.actual
+    expected = p.expected
+    if not (type(actual) is str and type(expected) is str):
+        return None
+    elif actual == expected:
+        return True
+
+    n = min(len(actual), len(expected))
+    offset = _first_mismatch(actual, expected, n, equal=operator.eq)
+    if isinstance(offset, api.BudgetExceededError):
+        return offset
+    elif offset is None:
+        offset = n
+
+    line_start = actual.rfind("\n", 0, offset) + 1
+    line = actual.count("\n", 0, line_start) + 1
+    column = offset - line_start + 1
+
+    lines = []
+    if len(actual) != len(expected):
+        lines.append(f"String lengths mismatch: {len(actual)} != {len(expected)}")
+    if offset < n:
+        lines.append(
+            f"First mismatch at index {offset} (line {line}, column {column}):"
+        )
+    else:
+        lines.append(f"First {n} characters are equal.")
+    lines.append("")
+
+    start = max(offset - str_context, 0)
+    for name, text in [("actual", actual), ("expected", expected)]:
+        window = text[start : offset + str_context + 1]
+        lines.append(
+            f"{name + ':':<9} {'... ' if start > 0 else ''}{window!r}"
+            f"{' ...' if start + len(window) < len(text) else ''}"
+        )
+
+    if diff_lines > 0 and ("\n" in actual or "\n" in expected):
+        lines.append("")
+        lines.extend(
+            _unified_diff(
+                actual, expected, line_start=line_start, line=line, max_lines=diff_lines
+            )
+        )
+
+    return AssertionError("\n".join(lines))
+
+
+# number of equal lines before the first mismatch included in the diff, which matches the default of difflib
+_DIFF_CONTEXT = 3
+_HUNK_HEADER = re.compile(r"^@@ -(\d+)(,\d+)? \+(\d+)(,\d+)? @@$")
+
+
+def _unified_diff(
+    actual: str, expected: str, *, line_start: int, line: int, max_lines: int
+) -> list[str]:
+    # Both inputs are equal up to the line of the first mismatch. Thus, only a window of lines starting shortly before
+    # it is diffed, which bounds the time and memory regardless of the size of the inputs.
+    for _ in range(_DIFF_CONTEXT):
+        if line_start == 0:
+            break
+        line_start = actual.rfind("\n", 0, line_start - 1) + 1
+        line -= 1
+
+    diff = difflib.unified_diff(
+        _lines(actual, line_start, max_lines),
+        _lines(expected, line_start, max_lines),
+        fromfile="actual",
+        tofile="expected",
+        lineterm="",
+    )
+
+    shift = line - 1
+    result = []
+    for diff_line in itertools.islice(diff, max_lines + 1):
+        if match := _HUNK_HEADER.match(diff_line):
+            # the line numbers in the hunk headers are relative to the window
+            a, a_len, e, e_len = match.groups()
+            diff_line = (
+                f"@@ -{int(a) + shift}{a_len or ''} +{int(e) + shift}{e_len or ''} @@"
+            )
+        result.append(diff_line)
+
+    if len(result) > max_lines:
+        result[max_lines:] = ["..."]
+    return result
+
+
+def _lines(text: str, start: int, n: int) -> list[str]:
+    lines: list[str] = []
+    while len(lines) < n and start < len(text):
+        end = text.find("\n", start)
+        if end == -1:
+            end = len(text)
+        lines.append(text[start:end])
+        start = end + 1
+    return lines
+
+
+def builtins_range(p: api.Pair, /) -> api.EqualFnResult:
+    """Check equality for [range][]s in constant time.
+
+    Args:
+        p: Pair to be compared.
+
+    Returns:
+       (None): If [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] are not [range][]s.
+       (True): If the inputs represent the same sequence of integers.
+       (AssertionError): If the inputs represent different sequences of integers.
+
+    """
+    if not utils.both_isinstance(p, range):
+        return None
+
+    if p.actual == p.expected:
+        return True
+
+    return AssertionError(f"{p.actual!r} != {p.expected!r}")
+
+
 def builtins_object(
     p: api.Pair, /, *, identity_fallback: bool = True
 ) -> api.EqualFnResult:
@@ -223,9 +730,9 @@ def dataclasses_dataclass(p: api.Pair, /) -> api.UnpackFnResult:
     Returns:
         (None): If [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] are not
             [`@dataclasses.dataclass`][dataclasses.dataclass]es.
-        (list[api.Pair]): The [`actual`][compyre.api.Pair] and [`expected`][compyre.api.Pair] values of each pair are
-            the corresponding values of the input objects, while the [`index`][compyre.api.Pair] is `p.index` extended
-            by the corresponding field name.
+        (collections.abc.Iterator[api.Pair]): The [`actual`][compyre.api.Pair] and [`expected`][compyre.api.Pair]
+            values of each pair are the corresponding values of the input objects, while the [`index`][compyre.api.Pair]
+            is `p.index` extended by the corresponding field name.
         (ValueError): If the fields of [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] mismatch.
 
     """
@@ -242,3 +749,62 @@ def dataclasses_dataclass(p: api.Pair, /) -> api.UnpackFnResult:
             expected=dataclasses.asdict(p.expected),  # type: ignore[arg-type]
         )
     )
+
+
+_TEXT_SUFFIXES = frozenset({".txt", ".text", ".log", ".md", ".rst"})
+
+
+@utils.value_dependent(os.PathLike)
+def io_text_file(p: api.Pair, /, *, encoding: str | None = None) -> api.UnpackFnResult:
+    """Unpack text files line by line without loading them into memory.
+
+    Both files are read in lockstep through buffered reads. Thus, only a single line of each file is held in memory at
+    a time and the files are only read up to the point where the comparison stops, e.g. if `max_errors` is reached.
+
+    !!! info
+
+        Only files given by path with a `.txt`, `.text`, `.log`, `.md`, or `.rst` suffix are handled, so that other
+        files can be unpacked by format-aware functions, e.g. [compyre.builtin.unpack_fns.csv_file][]. Text files with
+        other suffixes can be passed as open file objects instead.
+
+        Files given by path are opened with `newline=""` and thus line endings are preserved and compared. They are
+        closed once the comparison is finished. Open file objects are consumed, but not closed.
+
+    Args:
+        p: Pair to be unpacked.
+        encoding: Encoding to open the files given by path with. Defaults to the default encoding of [open][].
+
+    Returns:
+        (None): If [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] are neither both
+            [os.PathLike][] objects with one of the suffixes above nor both text file objects.
+        (collections.abc.Iterator[api.Pair]): The [`actual`][compyre.api.Pair] and [`expected`][compyre.api.Pair] values
+            of each pair are the corresponding lines of the input files, while the [`index`][compyre.api.Pair] is
+            `p.index` extended by the line number starting at 1. If one file is exhausted before the other, a
+            [ValueError][] is yielded last. If a file cannot be opened, the [OSError][] is yielded instead.
+
+    """
+    if utils.both_isinstance(p, io.TextIOBase):
+        return _iterator_pairs(p.index, p.actual, p.expected, kind="text file", start=1)
+    elif utils.both_isinstance(p, os.PathLike) and all(
+        os.path.splitext(path)[1].lower() in _TEXT_SUFFIXES
+        for path in (p.actual, p.expected)
+    ):
+        return _text_file_pairs(p, encoding=encoding)
+
+    return None
+
+
+def _text_file_pairs(
+    p: api.Pair, *, encoding: str | None
+) -> Iterator[api.Pair | Exception]:
+    with contextlib.ExitStack() as stack:
+        try:
+            actual, expected = (
+                stack.enter_context(open(path, encoding=encoding, newline=""))
+                for path in (p.actual, p.expected)
+            )
+        except OSError as error:
+            yield error
+            return
+
+        yield from _iterator_pairs(p.index, actual, expected, kind="text file", start=1)
@@ -1,4 +1,4 @@
-from typing import Annotated
+from typing import Annotated, Any
 
 from compyre import alias, api, utils
 from compyre._availability import available_if
@@ -51,3 +51,60 @@ def torch_tensor(
         return True
     except AssertionError as result:
         return result
+
+
+@utils.value_dependent()
+@available_if("torch")
+def torch_pytree(p: api.Pair, /) -> api.UnpackFnResult:
+    """Unpack nested containers in one shot using `torch.utils._pytree`.
+
+    Both inputs are flattened into their leaves and tree specifications. If the tree specifications are equal, the
+    leaves are returned directly, skipping the unpacking of all intermediate containers.
+
+    !!! info
+
+        If the tree specifications differ, [None][] is returned. Thus, subsequent unpacking functions, e.g.
+        [compyre.builtin.unpack_fns.collections_mapping][], can locate the mismatch. Since the specification of a
+        dictionary includes the order of its keys, dictionaries with the same keys in a different order are always
+        handled by the subsequent unpacking functions.
+
+    Args:
+        p: Pair to be unpacked.
+
+    Returns:
+       (None): If [`p.actual`][compyre.api.Pair] is a leaf or the inputs have different tree specifications.
+       (collections.abc.Iterator[api.Pair]): The [`actual`][compyre.api.Pair] and [`expected`][compyre.api.Pair]
+            values of each pair are the corresponding leaves of the inputs, while the [`index`][compyre.api.Pair]
+            is `p.index` extended by the path of the leaf.
+
+    Raises:
+        RuntimeError: If [torch][] is not available.
+
+    """
+    from torch.utils import _pytree as pytree
+
+    actual_items, actual_spec = pytree.tree_flatten_with_path(p.actual)
+    if actual_spec.is_leaf():
+        return None
+
+    expected_leaves, expected_spec = pytree.tree_flatten(p.expected)
+    if expected_spec != actual_spec:
+        return None
+
+    return (
+        api.Pair(index=(*p.index, *(_key_entry(k) for k in path)), actual=a, expected=e)
+        for (path, a), e in zip(actual_items, expected_leaves)
+    )
+
+
+def _key_entry(key: Any) -> Any:
+    from torch.utils import _pytree as pytree
+
+    if isinstance(key, pytree.MappingKey):
+        return key.key
+    elif isinstance(key, pytree.SequenceKey):
+        return key.idx
+    elif isinstance(key, pytree.GetAttrKey):
+        return key.name
+
+    return str(key)
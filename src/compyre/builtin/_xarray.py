@@ -0,0 +1,234 @@
+import typing
+from collections.abc import Mapping
+from typing import Annotated, Any
+
+from compyre import alias, api, utils
+from compyre._availability import available_if
+
+from ._dask import dask_array
+from ._numpy import (
+    _block_mismatches,
+    _block_mismatches_result,
+    _is_numeric,
+    numpy_ndarray,
+)
+
+
+@available_if("xarray")
+def xarray_dataset(p: api.Pair, /) -> api.UnpackFnResult:
+    """Unpack [xarray](https://xarray.dev) `Dataset`s into their variables.
+
+    The dimensions, the names of the coordinates and data variables, and the attributes of the inputs are compared
+    before any data is touched. The variables are returned without loading them, e.g. to be compared by
+    [compyre.builtin.equal_fns.xarray_dataarray][]. Thus, lazily loaded variables are only loaded one at a time when
+    they are compared.
+
+    Args:
+        p: Pair to be unpacked.
+
+    Returns:
+        (None): If [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] are not `Dataset`s.
+        (list[api.Pair]): The [`actual`][compyre.api.Pair] and [`expected`][compyre.api.Pair] values of each pair are
+            the corresponding `Variable`s of the coordinates and data variables of the inputs, while the
+            [`index`][compyre.api.Pair] is `p.index` extended by the variable name.
+        (ValueError): If the dimensions, the names of the coordinates or data variables, or the attributes of the inputs
+            mismatch.
+
+    Raises:
+        RuntimeError: If [xarray](https://xarray.dev) is not available.
+
+    """
+    import xarray as xr
+
+    if not utils.both_isinstance(p, xr.Dataset):
+        return None
+
+    actual, expected = p.actual, p.expected
+    if dict(actual.sizes) != dict(expected.sizes):
+        return ValueError(
+            f"Xarray dimensions mismatch: {dict(actual.sizes)} != {dict(expected.sizes)}"
+        )
+
+    for kind, actual_names, expected_names in [
+        ("coordinates", actual.coords.keys(), expected.coords.keys()),
+        ("data variables", actual.data_vars.keys(), expected.data_vars.keys()),
+    ]:
+        if actual_names != expected_names:
+            extra = actual_names - expected_names
+            missing = expected_names - actual_names
+            return ValueError(
+                f"Xarray {kind} mismatch:\n\n"
+                f"extra: {', '.join(repr(k) for k in sorted(extra))}\n"
+                f"missing: {', '.join(repr(k) for k in sorted(missing))}\n"
+            )
+
+    if names := _attrs_mismatch(actual.attrs, expected.attrs):
+        return ValueError(f"Xarray attributes mismatch: {', '.join(names)}")
+
+    return [
+        api.Pair(
+            index=(*p.index, str(name)),
+            actual=actual.variables[name],
+            expected=expected.variables[name],
+        )
+        for name in [*actual.coords, *actual.data_vars]
+    ]
+
+
+@available_if("xarray")
+def xarray_dataarray(
+    p: api.Pair,
+    /,
+    *,
+    rtol: Annotated[float, alias.RELATIVE_TOLERANCE] = 1e-7,
+    atol: Annotated[float, alias.ABSOLUTE_TOLERANCE] = 0.0,
+    equal_nan: Annotated[bool, alias.NAN_EQUALITY] = True,
+) -> api.EqualFnResult:
+    """Check equality for [xarray](https://xarray.dev) `DataArray`s and `Variable`s.
+
+    The dimensions, shapes, and attributes of the inputs as well as the coordinates of `DataArray`s are compared
+    before the data. Afterwards, data backed by [dask](https://www.dask.org) arrays is compared block by block by
+    [compyre.builtin.equal_fns.dask_array][] without loading it. All other data is loaded and compared by
+    [compyre.builtin.equal_fns.numpy_ndarray][] for numeric values and exactly otherwise.
+
+    Args:
+        p: Pair to be compared.
+        rtol: Relative tolerance. See [numpy.isclose][] for details. Can also be set through
+              [compyre.alias.RELATIVE_TOLERANCE][].
+        atol: Absolute tolerance. See [numpy.isclose][] for details. Can also be set through
+              [compyre.alias.ABSOLUTE_TOLERANCE][].
+        equal_nan: Whether two `NaN` values are considered equal. Can also be set through
+              [compyre.alias.NAN_EQUALITY][].
+
+    Returns:
+       (None): If [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] are not both `DataArray`s or
+            both `Variable`s.
+       (True): If the inputs have the same dimensions, shapes, attributes, and coordinates and all values are close.
+       (AssertionError): If the dimensions, shapes, attributes, or coordinates of the inputs mismatch or any values
+            are not close.
+
+    Raises:
+        RuntimeError: If [xarray](https://xarray.dev) is not available.
+
+    """
+    import xarray as xr
+
+    if not (
+        utils.both_isinstance(p, xr.DataArray) or utils.both_isinstance(p, xr.Variable)
+    ):
+        return None
+
+    return _compare(
+        p.index,
+        p.actual,
+        p.expected,
+        rtol=rtol,
+        atol=atol,
+        equal_nan=equal_nan,
+    )
+
+
+def _compare(
+    index: tuple[str | int, ...],
+    actual: Any,
+    expected: Any,
+    *,
+    rtol: float,
+    atol: float,
+    equal_nan: bool,
+) -> api.EqualFnResult:
+    import xarray as xr
+
+    if actual.dims != expected.dims:
+        return AssertionError(
+            f"Xarray dimensions mismatch: {actual.dims} != {expected.dims}"
+        )
+    elif actual.shape != expected.shape:
+        return AssertionError(
+            f"Xarray shapes mismatch: {actual.shape} != {expected.shape}"
+        )
+    elif names := _attrs_mismatch(actual.attrs, expected.attrs):
+        return AssertionError(f"Xarray attributes mismatch: {', '.join(names)}")
+
+    if isinstance(actual, xr.DataArray):
+        if actual.coords.keys() != expected.coords.keys():
+            return AssertionError(
+                f"Xarray coordinates mismatch: "
+                f"{sorted(map(str, actual.coords))} != {sorted(map(str, expected.coords))}"
+            )
+
+        for name in actual.coords:
+            result = _compare(
+                index,
+                actual.coords[name].variable,
+                expected.coords[name].variable,
+                rtol=rtol,
+                atol=atol,
+                equal_nan=equal_nan,
+            )
+            if result is not True:
+                return AssertionError(
+                    f"Xarray coordinate {name!r} mismatch:\n\n{str(result).strip()}"
+                )
+
+        actual, expected = actual.variable, expected.variable
+
+    # dask arrays are compared block by block, while everything else is loaded into memory
+    if actual.chunks is not None or expected.chunks is not None:
+        compare, actual, expected = dask_array, actual.data, expected.data
+    else:
+        actual, expected = actual.values, expected.values
+        if not _is_numeric(actual, expected):
+            # NaT values are handled the same as for dask arrays
+            return _block_mismatches_result(
+                "Arrays",
+                [
+                    (
+                        (0,) * actual.ndim,
+                        _block_mismatches(
+                            actual,
+                            expected,
+                            numeric=False,
+                            rtol=rtol,
+                            atol=atol,
+                            equal_nan=equal_nan,
+                        ),
+                    )
+                ],
+                unit="arrays",
+                size=actual.size,
+                numeric=False,
+            )
+
+        compare = numpy_ndarray
+
+    return typing.cast(
+        api.EqualFnResult,
+        compare(
+            api.Pair(index=index, actual=actual, expected=expected),
+            rtol=rtol,
+            atol=atol,
+            equal_nan=equal_nan,
+        ),
+    )
+
+
+def _attrs_mismatch(
+    actual: Mapping[Any, Any], expected: Mapping[Any, Any]
+) -> list[str]:
+    import numpy as np
+
+    names = []
+    for name in actual.keys() | expected.keys():
+        if name not in actual or name not in expected:
+            names.append(repr(name))
+            continue
+
+        try:
+            # attributes can be arrays, e.g. the valid range of a variable, and might be NaN, e.g. the fill value
+            equal = np.array_equal(actual[name], expected[name], equal_nan=True)
+        except TypeError:
+            equal = np.array_equal(actual[name], expected[name])
+        if not equal:
+            names.append(repr(name))
+    return sorted(names)
@@ -0,0 +1,171 @@
+import functools
+from typing import Annotated, Any
+
+from compyre import alias, api, utils
+from compyre._availability import available_if
+
+from ._numpy import (
+    _block_mismatches,
+    _block_mismatches_result,
+    _BlockMismatches,
+    _blocks,
+    _compare_blocks,
+    _is_numeric,
+)
+from ._stdlib import collections_mapping
+
+
+@available_if("zarr>=3")
+def zarr_group(p: api.Pair, /) -> api.UnpackFnResult:
+    """Unpack [zarr](https://zarr.dev) `Group`s into their members.
+
+    The groups are unpacked like [collections.abc.Mapping][]s by [compyre.builtin.unpack_fns.collections_mapping][],
+    with the names of their arrays and subgroups as sorted keys. The attributes of the groups are not compared.
+
+    Args:
+        p: Pair to be unpacked.
+
+    Returns:
+        (None): If [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] are not `Group`s.
+        (collections.abc.Iterator[api.Pair]): The [`actual`][compyre.api.Pair] and [`expected`][compyre.api.Pair]
+            values of each pair are the corresponding members of the input groups, while the
+            [`index`][compyre.api.Pair] is `p.index` extended by the member name.
+        (ValueError): If the member names of [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair]
+            mismatch.
+
+    Raises:
+        RuntimeError: If [zarr](https://zarr.dev) is not available.
+
+    """
+    import zarr
+
+    if not utils.both_isinstance(p, zarr.Group):
+        return None
+
+    return collections_mapping(
+        api.Pair(
+            index=p.index,
+            actual=dict(sorted(p.actual.members())),
+            expected=dict(sorted(p.expected.members())),
+        )
+    )
+
+
+@available_if("zarr>=3")
+def zarr_array(
+    p: api.Pair,
+    /,
+    *,
+    rtol: Annotated[float, alias.RELATIVE_TOLERANCE] = 1e-7,
+    atol: Annotated[float, alias.ABSOLUTE_TOLERANCE] = 0.0,
+    equal_nan: Annotated[bool, alias.NAN_EQUALITY] = True,
+    workers: int | None = None,
+) -> api.UnpackFnResult:
+    """Compare [zarr](https://zarr.dev) `Array`s chunk by chunk.
+
+    The inputs are compared for each stored chunk of the actual array, i.e. each shard for sharded arrays, by a thread
+    pool. If both arrays are encoded the same, i.e. they have the same data type, chunks, codecs, and fill value, the
+    raw bytes of the chunks are compared first. Identical bytes prove that the chunks are equal without decoding them,
+    unless they might encode `NaN` or `NaT` values while `equal_nan=False`. Only the remaining chunks are decoded and
+    compared with [numpy.isclose][] for numeric values and exactly otherwise.
+
+    !!! info
+
+        `Array`s are dataclasses and would otherwise be unpacked into their fields by
+        [compyre.builtin.unpack_fns.dataclasses_dataclass][]. Thus, they are compared by an unpacking function that
+        does not return any pairs, similar to [compyre.builtin.unpack_fns.pathlib_path][] for equal files.
+
+    Args:
+        p: Pair to be compared.
+        rtol: Relative tolerance. See [numpy.isclose][] for details. Can also be set through
+              [compyre.alias.RELATIVE_TOLERANCE][].
+        atol: Absolute tolerance. See [numpy.isclose][] for details. Can also be set through
+              [compyre.alias.ABSOLUTE_TOLERANCE][].
+        equal_nan: Whether two `NaN` values are considered equal. Can also be set through
+              [compyre.alias.NAN_EQUALITY][].
+        workers: Maximum number of threads comparing chunks concurrently. Defaults to the default of
+            [concurrent.futures.ThreadPoolExecutor][].
+
+    Returns:
+        (None): If [`p.actual`][compyre.api.Pair] and [`p.expected`][compyre.api.Pair] are not `Array`s.
+        (tuple[()]): If the inputs have the same shape and all values are close.
+        (AssertionError): If the shapes of the inputs mismatch or any values are not close.
+        (compyre.api.BudgetExceededError): If the budget of the comparison is exceeded.
+
+    Raises:
+        RuntimeError: If [zarr](https://zarr.dev) is not available.
+
+    """
+    import numpy as np
+    import zarr
+
+    if not utils.both_isinstance(p, zarr.Array):
+        return None
+
+    actual, expected = p.actual, p.expected
+    if actual.shape != expected.shape:
+        return AssertionError(
+            f"Zarr array shapes mismatch: {actual.shape} != {expected.shape}"
+        )
+
+    chunks = actual.shards or actual.chunks
+    # identical bytes do not prove equality if they might encode NaN or NaT values that are not considered equal
+    raw = (equal_nan or actual.dtype.kind not in "fcmM") and (
+        _encoding(actual) == _encoding(expected)
+    )
+    numeric = _is_numeric(actual, expected)
+
+    # the chunks are read and decoded in the background, since zarr does not hold a global lock like h5py
+    def compare(
+        offset: tuple[int, ...], selection: tuple[slice, ...]
+    ) -> _BlockMismatches:
+        if raw:
+            coords = tuple(o // c for o, c in zip(offset, chunks))
+            if _raw_chunk(actual, coords) == _raw_chunk(expected, coords):
+                return 0, 0.0, None
+
+        return _block_mismatches(
+            np.asarray(actual[selection]),
+            np.asarray(expected[selection]),
+            numeric=numeric,
+            rtol=rtol,
+            atol=atol,
+            equal_nan=equal_nan,
+        )
+
+    results = _compare_blocks(
+        (
+            (offset, functools.partial(compare, offset, selection))
+            for offset, selection in _blocks(actual.shape, chunks)
+        ),
+        workers=workers,
+    )
+    if isinstance(results, Exception):
+        return results
+
+    result = _block_mismatches_result(
+        "Zarr arrays", results, unit="chunks", size=actual.size, numeric=numeric
+    )
+    return () if result is True else result
+
+
+def _encoding(array: Any) -> dict[str, Any]:
+    # everything that determines the raw bytes of the chunks for given values
+    return {
+        k: v
+        for k, v in array.metadata.to_dict().items()
+        if k not in {"shape", "attributes"}
+    }
+
+
+def _raw_chunk(array: Any, coords: tuple[int, ...]) -> bytes | None:
+    from zarr.core.buffer import default_buffer_prototype
+    from zarr.core.sync import sync
+
+    # chunks that were never written or only contain the fill value are not stored
+    buffer = sync(
+        (array.store_path / array.metadata.encode_chunk_key(coords)).get(
+            prototype=default_buffer_prototype()
+        )
+    )
+    return None if buffer is None else buffer.to_bytes()
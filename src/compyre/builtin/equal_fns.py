@@ -1,13 +1,34 @@
+from ._dask import dask_array
+from ._h5py import h5py_dataset
 from ._numpy import numpy_ndarray
 from ._pandas import pandas_dataframe, pandas_series
-from ._stdlib import builtins_number, builtins_object
+from ._polars import polars_dataframe
+from ._pyarrow import pyarrow_array
+from ._scipy import scipy_sparse
+from ._stdlib import (
+    builtins_bytes,
+    builtins_number,
+    builtins_object,
+    builtins_range,
+    builtins_str,
+)
 from ._torch import torch_tensor
+from ._xarray import xarray_dataarray
 
 __all__ = [
+    "builtins_bytes",
     "builtins_number",
     "builtins_object",
+    "builtins_range",
+    "builtins_str",
+    "dask_array",
+    "h5py_dataset",
     "numpy_ndarray",
     "pandas_dataframe",
     "pandas_series",
+    "polars_dataframe",
+    "pyarrow_array",
+    "scipy_sparse",
     "torch_tensor",
+    "xarray_dataarray",
 ]
@@ -1,15 +1,40 @@
+from ._csv import csv_file
+from ._json import json_file
+from ._optree import optree_pytree
+from ._pathlib import pathlib_path
+from ._pyarrow import pyarrow_table
 from ._pydantic import pydantic_model
 from ._stdlib import (
+    collections_async_iterable,
+    collections_iterator,
     collections_mapping,
     collections_ordered_dict,
+    collections_records,
     collections_sequence,
     dataclasses_dataclass,
+    io_text_file,
 )
+from ._torch import torch_pytree
+from ._xarray import xarray_dataset
+from ._zarr import zarr_array, zarr_group
 
 __all__ = [
+    "collections_async_iterable",
+    "collections_iterator",
     "collections_mapping",
     "collections_ordered_dict",
+    "collections_records",
     "collections_sequence",
+    "csv_file",
     "dataclasses_dataclass",
+    "io_text_file",
+    "json_file",
+    "optree_pytree",
+    "pathlib_path",
+    "pyarrow_table",
     "pydantic_model",
+    "torch_pytree",
+    "xarray_dataset",
+    "zarr_array",
+    "zarr_group",
 ]
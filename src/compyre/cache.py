@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple
+
+__all__ = ["CacheInfo", "CompareCache"]
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a [compyre.cache.CompareCache][]."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class CompareCache:
+    """Cache of comparison results for incremental comparisons.
+
+    When passed to [compyre.api.compare][] or related functions through the `cache` parameter, the result of every
+    subtree of the inputs, for which a content digest can be computed for both values, is stored together with the
+    digests. On subsequent comparisons, subtrees with the same index and digests are skipped and their previous result
+    is reused. Thus, only modified subtrees are descended into.
+
+    Digests can be computed for [None][], [bool][], [int][], [float][], [complex][], [str][], [bytes][],
+    [numpy.ndarray][]s, [torch.Tensor][]s as well as [collections.abc.Mapping][]s, [list][]s, and [tuple][]s only
+    containing such values. Pairs of scalar values are never cached, since comparing them is as cheap as the lookup.
+
+    Only the indices and exceptions of the errors are stored rather than the compared values. For a reused result, the
+    values of each error are looked up by its index in the current inputs of the unchanged subtree.
+
+    !!! warning
+
+        The cache is cleared whenever it is used with different `unpack_fns`, `equal_fns`, `aliases`, or keyword
+        arguments than before, since the stored results might be invalid for them. Values of `aliases` and keyword
+        arguments are compared by their digest if it can be computed and with `==` otherwise. Thus, use one cache per
+        configuration.
+
+    Args:
+        maxsize: Maximum number of cached subtrees. If exceeded, the least recently used subtree is evicted.
+
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize has to be positive, but got {maxsize}")
+
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, tuple[tuple[Any, Exception], ...]] = (
+            OrderedDict()
+        )
+        self._config: Any = None
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def cache_info(self) -> CacheInfo:
+        """Return the statistics of the cache."""
+        return CacheInfo(
+            hits=self._hits,
+            misses=self._misses,
+            maxsize=self.maxsize,
+            currsize=len(self._data),
+        )
+
+    def clear(self) -> None:
+        """Clear the cache and its statistics."""
+        with self._lock:
+            self._data.clear()
+            self._config = None
+            self._hits = self._misses = 0
+
+    def _bind(self, config: Any) -> None:
+        with self._lock:
+            try:
+                same = bool(config == self._config)
+            except Exception:
+                same = False
+
+            if not same:
+                self._data.clear()
+                self._config = config
+
+    def _lookup(self, key: Hashable) -> tuple[tuple[Any, Exception], ...] | None:
+        with self._lock:
+            errors = self._data.get(key)
+            if errors is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._data.move_to_end(key)
+            return errors
+
+    def _store(self, key: Hashable, errors: tuple[tuple[Any, Exception], ...]) -> None:
+        with self._lock:
+            self._data[key] = errors
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
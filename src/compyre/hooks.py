@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
+
+if TYPE_CHECKING:
+    from compyre import api
+
+__all__ = ["Hooks", "Progress", "ProgressHooks", "TqdmHooks"]
+
+
+class Hooks:
+    """Base class for hooks into the traversal of [compyre.api.compare][].
+
+    Subclasses override the methods for the events they are interested in. All methods do nothing by default. If no
+    hooks are passed to [compyre.api.compare][], the traversal is not instrumented at all and thus pays no overhead.
+
+    !!! note
+
+        Pairs with a cached result, see [compyre.cache.CompareCache][], are not visited and thus only their errors are
+        reported. If `cost` is passed to [compyre.api.compare][], a subtree is exited as soon as all pairs unpacked from
+        it are scheduled rather than compared.
+
+    """
+
+    def on_pair(self, pair: api.Pair) -> None:
+        """Handle a visited pair before it is unpacked."""
+        pass
+
+    def on_enter(self, pair: api.Pair) -> None:
+        """Handle entering a pair after it was unpacked and before the first pair unpacked from it is visited."""
+        pass
+
+    def on_exit(self, pair: api.Pair) -> None:
+        """Handle exiting a pair after all pairs unpacked from it were visited."""
+        pass
+
+    def on_compared(self, pair: api.Pair, nbytes: int) -> None:
+        """Handle a pair after it was compared by the `equal_fns`.
+
+        Args:
+            pair: Compared pair.
+            nbytes: Size of the larger value in bytes for values with an `nbytes` attribute, e.g.
+                [numpy.ndarray][]s, and binary data. Otherwise `0`.
+
+        """
+        pass
+
+    def on_error(self, error: api.CompareError) -> None:
+        """Handle an error that was found."""
+        pass
+
+    def on_finish(self, errors: list[api.CompareError]) -> None:
+        """Handle the result once after the comparison is finished."""
+        pass
+
+
+class Progress(NamedTuple):
+    """Progress of a comparison reported by [compyre.hooks.ProgressHooks][]."""
+
+    pairs: int
+    nbytes: int
+    errors: int
+    elapsed: float
+    finished: bool
+
+
+class ProgressHooks(Hooks):
+    """Hooks reporting the progress of a comparison.
+
+    Args:
+        callback: Called with the current [compyre.hooks.Progress][] at most once per `interval` as well as once after
+            the comparison is finished.
+        interval: Minimum time in seconds between two calls of `callback` while the comparison is running.
+
+    """
+
+    def __init__(
+        self, callback: Callable[[Progress], Any], *, interval: float = 0.1
+    ) -> None:
+        self.callback = callback
+        self.interval = interval
+
+        self._pairs = 0
+        self._nbytes = 0
+        self._errors = 0
+        self._start: float | None = None
+        self._last = 0.0
+
+    def on_pair(self, pair: api.Pair) -> None:
+        """Count the visited pair and report the progress if the `interval` has passed."""
+        self._pairs += 1
+
+        now = time.monotonic()
+        if self._start is None:
+            self._start = self._last = now
+        elif now - self._last >= self.interval:
+            self._last = now
+            self._report(now, finished=False)
+
+    def on_compared(self, pair: api.Pair, nbytes: int) -> None:
+        """Count the compared bytes."""
+        self._nbytes += nbytes
+
+    def on_error(self, error: api.CompareError) -> None:
+        """Count the error."""
+        self._errors += 1
+
+    def on_finish(self, errors: list[api.CompareError]) -> None:
+        """Report the final progress."""
+        # errors not found while visiting a pair, e.g. for an exceeded budget, are only part of the final result
+        self._errors = len(errors)
+        self._report(time.monotonic(), finished=True)
+
+    def _report(self, now: float, *, finished: bool) -> None:
+        self.callback(
+            Progress(
+                pairs=self._pairs,
+                nbytes=self._nbytes,
+                errors=self._errors,
+                elapsed=now - (self._start if self._start is not None else now),
+                finished=finished,
+            )
+        )
+
+
+class TqdmHooks(ProgressHooks):
+    """Hooks reporting the progress of a comparison to a [tqdm](https://tqdm.github.io/)-compatible progress bar.
+
+    The number of visited pairs is reported through `bar.update(n)`, while the number of compared bytes and errors
+    are reported through `bar.set_postfix(...)`. The bar is not closed after the comparison is finished.
+
+    Args:
+        bar: Progress bar, e.g. `tqdm.tqdm(unit="pairs")`.
+        interval: See [compyre.hooks.ProgressHooks][].
+
+    """
+
+    def __init__(self, bar: Any, *, interval: float = 0.1) -> None:
+        super().__init__(self._update, interval=interval)
+        self.bar = bar
+        self._reported = 0
+
+    def _update(self, progress: Progress) -> None:
+        self.bar.update(progress.pairs - self._reported)
+        self._reported = progress.pairs
+        self.bar.set_postfix(
+            nbytes=progress.nbytes, errors=progress.errors, refresh=False
+        )
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+import tempfile
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from compyre import _digest, api
+from compyre._default import default_equal_fns, default_unpack_fns
+from compyre.alias import Alias
+
+__all__ = [
+    "assert_snapshot",
+    "compare_to_snapshot",
+    "load_snapshot",
+    "save_snapshot",
+]
+
+_VERSION = 1
+_TREE_FILE = "tree.json"
+_OBJECTS_DIR = "objects"
+
+Node = dict[str, Any]
+
+
+def save_snapshot(value: Any, path: str | os.PathLike) -> None:
+    """Save a value as snapshot to a content-addressed store.
+
+    [dict][]s with [str][] or [int][] keys, [list][]s, and [tuple][]s are stored as structure, while [None][], [bool][],
+    [int][], [float][], and [str][] values inside of them are stored inline. All other values are stored as leaves
+    in separate files named by the digest of their content. Thus, identical leaves are only stored once, even across
+    multiple snapshots in the same store. [numpy.ndarray][]s are stored as `.npy` files, all other leaves are pickled.
+
+    Args:
+        value: Value to be saved.
+        path: Directory of the snapshot. Will be created if it does not exist.
+
+    """
+    root = Path(path)
+    objects = root / _OBJECTS_DIR
+    objects.mkdir(parents=True, exist_ok=True)
+
+    tree = {"version": _VERSION, "root": _save_node(value, objects)}
+    _atomic_write(root / _TREE_FILE, lambda f: f.write(json.dumps(tree).encode()))
+
+
+def _save_node(value: Any, objects: Path) -> Node:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return {"type": "value", "value": value}
+    elif type(value) is dict and all(
+        type(k) is str or type(k) is int for k in value.keys()
+    ):
+        return {
+            "type": "dict",
+            "keys": list(value.keys()),
+            "values": [_save_node(v, objects) for v in value.values()],
+        }
+    elif type(value) in {list, tuple}:
+        return {
+            "type": type(value).__name__,
+            "items": [_save_node(v, objects) for v in value],
+        }
+
+    return _save_leaf(value, objects)
+
+
+def _save_leaf(value: Any, objects: Path) -> Node:
+    if (
+        (np := sys.modules.get("numpy")) is not None
+        and isinstance(value, np.ndarray)
+        and (d := _digest.digest(value)) is not None
+    ):
+        digest = d.hex()
+        fmt = "npy"
+        file = objects / f"{digest}.{fmt}"
+        if not file.exists():
+            _atomic_write(file, lambda f: np.save(f, value, allow_pickle=False))
+    else:
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        fmt = "pkl"
+        file = objects / f"{digest}.{fmt}"
+        if not file.exists():
+            _atomic_write(file, lambda f: f.write(data))
+
+    return {"type": "leaf", "digest": digest, "format": fmt}
+
+
+def _atomic_write(file: Path, write: Callable[[Any], Any]) -> None:
+    fd, tmp = tempfile.mkstemp(dir=file.parent, prefix=f".{file.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp, file)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def load_snapshot(path: str | os.PathLike) -> Any:
+    """Load a snapshot lazily.
+
+    Structure saved by [compyre.snapshot.save_snapshot][] is returned as read-only [collections.abc.Mapping][]s and
+    [collections.abc.Sequence][]s. Leaves are only loaded from disk when they are accessed and are not kept in memory
+    afterwards. `.npy` leaves are memory-mapped.
+
+    !!! warning
+
+        Leaves that are not [numpy.ndarray][]s are unpickled. Only load snapshots from trusted sources.
+
+    Args:
+        path: Directory of the snapshot.
+
+    Returns:
+        Lazily loaded snapshot.
+
+    Raises:
+        ValueError: If the snapshot was saved with an incompatible version.
+
+    """
+    root = Path(path)
+    tree = json.loads((root / _TREE_FILE).read_text())
+    if (version := tree.get("version")) != _VERSION:
+        raise ValueError(
+            f"snapshot version {version} is not supported, expected {_VERSION}"
+        )
+
+    return _load_node(tree["root"], root / _OBJECTS_DIR)
+
+
+def _load_node(node: Node, objects: Path) -> Any:
+    typ = node["type"]
+    if typ == "value":
+        return node["value"]
+    elif typ == "dict":
+        return _SnapshotMapping(node["keys"], node["values"], objects)
+    elif typ in {"list", "tuple"}:
+        return _SnapshotSequence(node["items"], objects)
+
+    file = objects / f"{node['digest']}.{node['format']}"
+    if node["format"] == "npy":
+        import numpy as np
+
+        return np.load(file, mmap_mode="r", allow_pickle=False)
+
+    with open(file, "rb") as f:
+        return pickle.load(f)
+
+
+class _SnapshotMapping(Mapping):
+    def __init__(self, keys: list[str | int], nodes: list[Node], objects: Path):
+        self._nodes = dict(zip(keys, nodes))
+        self._objects = objects
+
+    def __getitem__(self, key: Any) -> Any:
+        return _load_node(self._nodes[key], self._objects)
+
+    def __iter__(self) -> Iterator:
+        return iter(self._nodes)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(keys={list(self._nodes)})"
+
+
+class _SnapshotSequence(Sequence):
+    def __init__(self, nodes: list[Node], objects: Path):
+        self._nodes = nodes
+        self._objects = objects
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [_load_node(n, self._objects) for n in self._nodes[index]]
+
+        return _load_node(self._nodes[index], self._objects)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(len={len(self._nodes)})"
+
+
+def compare_to_snapshot(
+    actual: Any,
+    path: str | os.PathLike,
+    *,
+    unpack_fns: Sequence[Callable[..., api.UnpackFnResult]] | None = None,
+    equal_fns: Sequence[Callable[..., api.EqualFnResult]] | None = None,
+    aliases: Mapping[Alias, Any] | None = None,
+    **kwargs: Any,
+) -> list[api.CompareError]:
+    """Compare a value against a snapshot.
+
+    The snapshot is loaded with [compyre.snapshot.load_snapshot][] and thus each expected leaf is only loaded when it
+    is compared.
+
+    Args:
+        actual: Actual input.
+        path: Directory of the snapshot.
+        unpack_fns: Unpacking functions. Defaults to [compyre.default_unpack_fns][].
+        equal_fns: Equality functions. Defaults to [compyre.default_equal_fns][].
+        aliases: Aliases and values to be passed to the `unpack_fns` and `equal_fns`.
+        **kwargs: Keyword arguments to be passed to [compyre.api.compare][].
+
+    Returns:
+        See [compyre.api.compare][].
+
+    """
+    return api.compare(
+        actual,
+        load_snapshot(path),
+        unpack_fns=unpack_fns if unpack_fns is not None else default_unpack_fns(),
+        equal_fns=equal_fns if equal_fns is not None else default_equal_fns(),
+        aliases=aliases,
+        **kwargs,
+    )
+
+
+def assert_snapshot(
+    actual: Any,
+    path: str | os.PathLike,
+    *,
+    unpack_fns: Sequence[Callable[..., api.UnpackFnResult]] | None = None,
+    equal_fns: Sequence[Callable[..., api.EqualFnResult]] | None = None,
+    aliases: Mapping[Alias, Any] | None = None,
+    **kwargs: Any,
+) -> None:
+    """Equality assertion of a value against a snapshot.
+
+    !!! info
+
+        See [compyre.snapshot.compare_to_snapshot][] for a description of the arguments.
+
+    Raises:
+        CompyreError: If any input pair cannot be handled.
+        AssertionError: If any input pair is not equal.
+
+    """
+    __tracebackhide__ = True
+
+    api._raise_equal_errors(
+        compare_to_snapshot(
+            actual,
+            path,
+            unpack_fns=unpack_fns,
+            equal_fns=equal_fns,
+            aliases=aliases,
+            **kwargs,
+        )
+    )
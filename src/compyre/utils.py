@@ -1,6 +1,10 @@
-from compyre import api
+from typing import Callable, TypeVar
 
-__all__ = ["both_isinstance", "either_isinstance"]
+from compyre import _budget, api
+
+__all__ = ["both_isinstance", "budget_exceeded", "either_isinstance", "value_dependent"]
+
+F = TypeVar("F", bound=Callable)
 
 
 def both_isinstance(pair: api.Pair, t: type | tuple[type, ...], /) -> bool:
@@ -29,3 +33,45 @@ def either_isinstance(pair: api.Pair, t: type | tuple[type, ...], /) -> bool:
 
     """
     return isinstance(pair.actual, t) or isinstance(pair.expected, t)
+
+
+def budget_exceeded() -> api.BudgetExceededError | None:
+    """Check whether the budget of the current comparison is exceeded.
+
+    Long-running `unpack_fns` and `equal_fns` can call this function periodically, e.g. between chunks, to stop early
+    if the `timeout` or `max_memory` passed to [compyre.api.compare][] is exceeded.
+
+    Returns:
+        The exception to be returned for the current pair if the budget is exceeded and [None][] otherwise, including
+            if no budget was set.
+
+    """
+    budget = _budget.current()
+    if budget is None or not budget.exceeded():
+        return None
+
+    return api._budget_error(budget)
+
+
+def value_dependent(*types: type) -> Callable[[F], F]:
+    """Mark an unpacking or equality function that decides whether it can handle a pair based on its values.
+
+    With `adaptive` set, [compyre.api.compare][] and related functions skip functions that returned [None][] for a
+    combination of types for all subsequent pairs with the same combination. Marked functions are never skipped for
+    pairs that include an instance of `types`, e.g. a function that handles [os.PathLike][] objects depending on their
+    suffix.
+
+    Args:
+        *types: Types of values for which the function depends on the values. If omitted, the function is never
+            skipped.
+
+    Returns:
+        Decorator that marks the function and returns it unchanged.
+
+    """
+
+    def decorator(fn: F) -> F:
+        setattr(fn, "__value_dependent__", types or (object,))
+        return fn
+
+    return decorator
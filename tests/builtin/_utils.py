@@ -0,0 +1,2 @@
+def summary(errors):
+    return [(e.pair.index, type(e.exception)) for e in errors]
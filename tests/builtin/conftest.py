@@ -0,0 +1,18 @@
+import pytest
+
+from compyre.builtin import _h5py, _zarr
+
+
+@pytest.fixture
+def decoded(monkeypatch):
+    # shapes of all chunks that are decoded, because their raw bytes differ
+    shapes = []
+    block_mismatches = _zarr._block_mismatches
+
+    def spy(actual, expected, **kwargs):
+        shapes.append(actual.shape)
+        return block_mismatches(actual, expected, **kwargs)
+
+    for module in (_h5py, _zarr):
+        monkeypatch.setattr(module, "_block_mismatches", spy)
+    return shapes
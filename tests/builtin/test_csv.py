@@ -0,0 +1,212 @@
+import pathlib
+
+import pytest
+
+import compyre
+from compyre import _budget, api, builtin
+from compyre.builtin import _csv
+
+from ._utils import summary
+
+
+@pytest.fixture(params=["pandas", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(_csv, "is_available", lambda fn: False)
+    return request.param
+
+
+def write(tmp_path, actual, expected, *, suffix=".csv"):
+    paths = []
+    for name, text in [("actual", actual), ("expected", expected)]:
+        path = tmp_path / f"{name}{suffix}"
+        path.write_text(text)
+        paths.append(path)
+    return paths
+
+
+def compare(tmp_path, actual, expected, *, suffix=".csv", **kwargs):
+    return api.compare(
+        *write(tmp_path, actual, expected, suffix=suffix),
+        unpack_fns=[builtin.unpack_fns.csv_file, *compyre.default_unpack_fns()],
+        equal_fns=compyre.default_equal_fns(),
+        **kwargs,
+    )
+
+
+class TestCsvFile:
+    @pytest.mark.parametrize(
+        ("actual", "expected"),
+        [
+            ("foo.csv", "foo.csv"),
+            (pathlib.Path("actual.csv"), pathlib.Path("expected.txt")),
+        ],
+    )
+    def test_not_supported(self, actual, expected):
+        assert (
+            builtin.unpack_fns.csv_file(
+                api.Pair(index=(), actual=actual, expected=expected)
+            )
+            is None
+        )
+
+    def test_equal(self, tmp_path, backend):
+        text = "int,float,str,missing\n1,2.5,foo,\n-2,nan,NA,\n3,,,\n"
+
+        assert compare(tmp_path, text, text, chunk_size=2) == []
+
+    def test_mismatches(self, tmp_path, backend):
+        actual = "a,b,c\n1,1.5,foo\n2,2.5,bar\n3,3.5,baz\n4,,qux\n5,inf,\n"
+        expected = "c,a,b\nfoo,1,1.5\nbaz,2,2.5\nbaz,-3,3.5\nqux,4,4.5\n,5,-inf\n"
+
+        errors = compare(tmp_path, actual, expected, chunk_size=2)
+
+        assert summary(errors) == [
+            ((1, "c"), AssertionError),
+            ((2, "a"), AssertionError),
+            ((3, "b"), AssertionError),
+            ((4, "b"), AssertionError),
+        ]
+        assert "First mismatch at index" in str(errors[0].exception)
+        assert "Numbers 3 and -3 are not close" in str(errors[1].exception)
+
+    def test_tolerances(self, tmp_path, backend):
+        actual = "a,b\n1.0,100\n2.0,200\n"
+        expected = "a,b\n1.001,100\n2.0,201\n"
+
+        assert summary(compare(tmp_path, actual, expected)) == [
+            ((0, "a"), AssertionError),
+            ((1, "b"), AssertionError),
+        ]
+        assert compare(tmp_path, actual, expected, rel_tol=1e-2) == []
+        assert compare(tmp_path, actual, expected, abs_tol=1) == []
+
+    @pytest.mark.parametrize("value", ["foo", "2_0"])
+    def test_mixed_column_types(self, tmp_path, backend, value):
+        errors = compare(tmp_path, "a\n1\n20\n", f"a\n1\n{value}\n")
+
+        assert summary(errors) == [((1, "a"), AssertionError)]
+        assert "First mismatch at index" in str(errors[0].exception)
+
+    def test_missing_integers(self, tmp_path, backend):
+        actual = "a,b\n1,x\n2,y\n,z\n4,w\n"
+        expected = "a,b\n1,x\n2,y\n,z\n,w\n"
+
+        # a missing value after the first chunk does not change the type of the column
+        assert compare(tmp_path, actual, actual, chunk_size=2) == []
+        assert summary(compare(tmp_path, actual, expected, chunk_size=2)) == [
+            ((3, "a"), AssertionError)
+        ]
+
+    @pytest.mark.parametrize("missing", [False, True])
+    def test_large_integers(self, tmp_path, backend, missing):
+        rows = ",x\n" if missing else ""
+        actual, expected = write(
+            tmp_path,
+            f"a,b\n9007199254740993,x\n{rows}",
+            f"a,b\n9007199254740992,x\n{rows}",
+        )
+
+        pairs = list(
+            builtin.unpack_fns.csv_file(
+                api.Pair(index=(), actual=actual, expected=expected), rel_tol=0
+            )
+        )
+
+        # integers are not compared as float64, which cannot represent 2**53 + 1
+        assert [(p.index, p.actual, p.expected) for p in pairs] == [
+            ((0, "a"), 2**53 + 1, 2**53)
+        ]
+
+    def test_tsv(self, tmp_path, backend):
+        errors = compare(tmp_path, "a\tb\n1\t2\n", "a\tb\n1\t3\n", suffix=".tsv")
+
+        assert summary(errors) == [((0, "b"), AssertionError)]
+
+    def test_columns_mismatch(self, tmp_path, backend):
+        errors = compare(tmp_path, "a,b\n1,2\n", "a,c\n1,2\n")
+
+        assert summary(errors) == [((), ValueError)]
+        assert all(
+            s in str(errors[0].exception)
+            for s in ["CSV columns mismatch", "extra: 'b'", "missing: 'c'"]
+        )
+
+    @pytest.mark.parametrize(
+        ("actual", "expected", "msg"),
+        [
+            ("a\n1\n2\n3\n", "a\n1\n2\n", "expected is exhausted after 2 item(s)"),
+            ("a\n1\n", "a\n1\n2\n", "actual is exhausted after 1 item(s)"),
+            ("a\n1\n2\n", "a\n-1\n2\n3\n", "actual is exhausted after 2 item(s)"),
+        ],
+    )
+    def test_length_mismatch(self, tmp_path, backend, actual, expected, msg):
+        errors = compare(tmp_path, actual, expected, chunk_size=2)
+
+        assert summary(errors)[-1] == ((), ValueError)
+        assert f"CSV file length mismatches: {msg}" in str(errors[-1].exception)
+
+    def test_header_only(self, tmp_path, backend):
+        assert compare(tmp_path, "a,b\n", "a,b\n") == []
+
+    @pytest.mark.parametrize(
+        ("actual", "expected"),
+        [
+            ("", "a\n1\n"),
+            ("a,a\n1,2\n", "a,b\n1,2\n"),
+            ("a,b\n1,2\n3,4,5\n", "a,b\n1,2\n3,4\n"),
+            ("a\n1\n2\nfoo\n", "a\n1\n2\n3\n"),
+            ("a\n1.5\n2\n1_0\n", "a\n1.5\n2\n3\n"),
+            ("a\n1\n2\n\n3\n", "a\n1\n2\n3\n4\n"),
+        ],
+    )
+    def test_parse_error(self, tmp_path, backend, actual, expected):
+        errors = compare(tmp_path, actual, expected, chunk_size=2)
+
+        assert len(errors) == 1
+        assert isinstance(errors[0].exception, ValueError)
+
+    def test_missing_file(self, tmp_path, backend):
+        actual, _ = write(tmp_path, "a\n1\n", "a\n1\n")
+
+        items = list(
+            builtin.unpack_fns.csv_file(
+                api.Pair(index=(), actual=actual, expected=tmp_path / "missing.csv")
+            )
+        )
+
+        assert len(items) == 1
+        assert isinstance(items[0], FileNotFoundError)
+
+    def test_budget_exceeded(self, tmp_path, backend):
+        actual, expected = write(tmp_path, "a\n1\n", "a\n1\n")
+        budget = _budget.Budget(timeout=60, max_memory=None)
+        budget.reason = "sentinel"
+
+        with _budget.activate(budget):
+            items = list(
+                builtin.unpack_fns.csv_file(
+                    api.Pair(index=(), actual=actual, expected=expected)
+                )
+            )
+
+        assert len(items) == 1
+        assert isinstance(items[0], api.BudgetExceededError)
+
+    def test_pathlib_path(self, tmp_path, backend):
+        for name, value in [("actual", "1.0"), ("expected", "1.001")]:
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "data.csv").write_text(f"a\n{value}\n")
+
+        errors = api.compare(
+            tmp_path / "actual",
+            tmp_path / "expected",
+            unpack_fns=[
+                builtin.unpack_fns.csv_file,
+                builtin.unpack_fns.pathlib_path,
+                *compyre.default_unpack_fns(),
+            ],
+            equal_fns=compyre.default_equal_fns(),
+        )
+
+        assert summary(errors) == [(("data.csv", 0, "a"), AssertionError)]
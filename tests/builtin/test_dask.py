@@ -0,0 +1,131 @@
+import dask.array as da
+import numpy as np
+import pytest
+
+import compyre
+from compyre import alias, api, builtin
+
+
+def check(actual, expected, **kwargs):
+    return builtin.equal_fns.dask_array(
+        api.Pair(index=(), actual=actual, expected=expected), **kwargs
+    )
+
+
+class TestDaskArray:
+    @pytest.mark.parametrize(
+        ("actual", "expected"),
+        [
+            (object(), da.zeros(1)),
+            (da.zeros(1), object()),
+            (da.zeros(1), [0.0]),
+            (np.zeros(1), np.zeros(1)),
+        ],
+    )
+    def test_not_supported(self, actual, expected):
+        assert check(actual, expected) is None
+
+    def test_equal(self):
+        value = da.random.default_rng(0).random((20, 30), chunks=(7, 11))
+
+        assert check(value, value.copy()) is True
+
+    def test_default(self):
+        value = {"foo": da.arange(10.0, chunks=3), "bar": [da.zeros((2, 2))]}
+
+        compyre.assert_equal(value, value)
+
+    def test_rechunk(self):
+        value = np.arange(100.0).reshape(10, 10)
+
+        assert (
+            check(da.from_array(value, chunks=4), da.from_array(value, chunks=(5, 3)))
+            is True
+        )
+
+    @pytest.mark.parametrize("dask_first", [True, False])
+    def test_numpy(self, dask_first):
+        value = np.arange(10.0)
+        actual, expected = da.from_array(value, chunks=3), value.copy()
+        if not dask_first:
+            actual, expected = expected, actual
+
+        assert check(actual, expected) is True
+
+    def test_shape_mismatch(self):
+        result = check(da.zeros((2, 3)), np.zeros((3, 2)))
+
+        assert isinstance(result, AssertionError)
+        assert "Dask array shapes mismatch: (2, 3) != (3, 2)" in str(result)
+
+    def test_mismatches(self):
+        actual = np.arange(100.0).reshape(10, 10)
+        expected = actual.copy()
+        expected[7, 3] = -1.0
+        expected[9, 9] = np.nan
+
+        result = check(
+            da.from_array(actual, chunks=4), da.from_array(expected, chunks=(5, 3))
+        )
+
+        assert isinstance(result, AssertionError)
+        msg = str(result)
+        assert "Dask arrays are not close" in msg
+        assert "Mismatched elements: 2 / 100" in msg
+        assert "Mismatched blocks: 2 / 9" in msg
+        assert "Max absolute difference among violations: 74.0" in msg
+        assert "Mismatch at index (7, 3): 73.0 != -1.0" in msg
+
+    def test_not_equal(self):
+        value = da.from_array(np.array(["a", "b", "c"]), chunks=2)
+
+        result = check(value, value[::-1])
+
+        assert isinstance(result, AssertionError)
+        msg = str(result)
+        assert "Dask arrays are not equal" in msg
+        assert "Max absolute difference" not in msg
+        assert "Mismatch at index (0,): 'a' != 'c'" in msg
+
+    @pytest.mark.parametrize(
+        ("actual", "expected", "diff"),
+        [
+            (np.array([True, False]), np.array([True, True]), 1.0),
+            (np.array([1], np.uint8), np.array([2], np.uint8), 1.0),
+            (np.array(1.0), np.array(np.nan), np.nan),
+        ],
+    )
+    def test_max_diff(self, actual, expected, diff):
+        result = check(da.from_array(actual), da.from_array(expected))
+
+        assert isinstance(result, AssertionError)
+        assert f"Max absolute difference among violations: {diff}" in str(result)
+
+    def test_tolerances(self):
+        actual = da.from_array(np.array([1.0, 2.0]), chunks=1)
+        expected = da.from_array(np.array([1.0, 2.001]), chunks=1)
+
+        assert isinstance(check(actual, expected), AssertionError)
+        assert check(actual, expected, rtol=1e-2) is True
+        assert check(actual, expected, atol=1e-2) is True
+
+    def test_tolerance_aliases(self):
+        api.assert_equal(
+            da.from_array(np.array([1.0])),
+            da.from_array(np.array([1.001])),
+            unpack_fns=[],
+            equal_fns=[builtin.equal_fns.dask_array],
+            aliases={alias.RELATIVE_TOLERANCE: 1e-2},
+        )
+
+    def test_nan(self):
+        value = da.from_array(np.array([np.nan, 1.0]), chunks=1)
+
+        assert check(value, value) is True
+        assert isinstance(check(value, value, equal_nan=False), AssertionError)
+
+    def test_nat(self):
+        value = da.from_array(np.array(["2020-01-01", "NaT"], "M8[D]"), chunks=1)
+
+        assert check(value, value) is True
+        assert isinstance(check(value, value, equal_nan=False), AssertionError)
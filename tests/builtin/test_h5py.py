@@ -0,0 +1,184 @@
+import itertools
+
+import h5py
+import numpy as np
+import pytest
+
+import compyre
+from compyre import _budget, alias, api, builtin
+from compyre.builtin import _h5py
+
+_FILE_NAMES = (f"file{i}.h5" for i in itertools.count())
+
+
+def file():
+    return h5py.File(next(_FILE_NAMES), "w", driver="core", backing_store=False)
+
+
+def dataset(data, **kwargs):
+    return file().create_dataset("data", data=data, **kwargs)
+
+
+def check(actual, expected, **kwargs):
+    return builtin.equal_fns.h5py_dataset(
+        api.Pair(index=(), actual=actual, expected=expected), **kwargs
+    )
+
+
+class TestH5pyDataset:
+    def test_not_supported(self):
+        assert check(dataset([0.0]), np.zeros(1)) is None
+
+    @pytest.mark.parametrize(
+        "kwargs", [{}, {"compression": "gzip"}], ids=["plain", "compressed"]
+    )
+    def test_equal(self, decoded, kwargs):
+        data = np.arange(100.0).reshape(10, 10)
+
+        assert (
+            check(
+                dataset(data, chunks=(4, 4), **kwargs),
+                dataset(data, chunks=(4, 4), **kwargs),
+            )
+            is True
+        )
+        assert not decoded
+
+    def test_unwritten_chunks(self, decoded):
+        actual, expected = (
+            file().create_dataset("data", shape=(10,), chunks=(4,), dtype="f8")
+            for _ in range(2)
+        )
+
+        assert check(actual, expected) is True
+        assert not decoded
+
+    def test_contiguous(self, monkeypatch, decoded):
+        monkeypatch.setattr(_h5py, "_CHUNK_SIZE", 32)
+        data = np.arange(20.0).reshape(10, 2)
+
+        assert check(dataset(data), dataset(data)) is True
+        assert decoded == [(2, 2)] * 5
+
+    @pytest.mark.parametrize("shape", [(), (0,)])
+    def test_empty(self, shape):
+        assert check(dataset(np.zeros(shape)), dataset(np.zeros(shape))) is True
+
+    def test_encoding_mismatch(self, decoded):
+        data = np.arange(10.0)
+
+        assert (
+            check(
+                dataset(data, chunks=(4,)),
+                dataset(data, chunks=(4,), compression="gzip"),
+            )
+            is True
+        )
+        assert decoded == [(4,), (4,), (2,)]
+
+    def test_shape_mismatch(self):
+        result = check(dataset(np.zeros((2, 3))), dataset(np.zeros((3, 2))))
+
+        assert isinstance(result, AssertionError)
+        assert "HDF5 dataset shapes mismatch: (2, 3) != (3, 2)" in str(result)
+
+    def test_mismatches(self, decoded):
+        actual = np.arange(100.0).reshape(10, 10)
+        expected = actual.copy()
+        expected[7, 3] = -1.0
+        expected[9, 9] = np.nan
+
+        result = check(
+            dataset(actual, chunks=(4, 4), compression="gzip"),
+            dataset(expected, chunks=(4, 4), compression="gzip"),
+        )
+
+        assert isinstance(result, AssertionError)
+        msg = str(result)
+        assert "HDF5 datasets are not close" in msg
+        assert "Mismatched elements: 2 / 100" in msg
+        assert "Mismatched chunks: 2 / 9" in msg
+        assert "Max absolute difference among violations: 74.0" in msg
+        assert "Mismatch at index (7, 3): 73.0 != -1.0" in msg
+        # only the chunks with differing raw bytes are read
+        assert decoded == [(4, 4), (2, 2)]
+
+    def test_not_equal(self):
+        result = check(dataset(["a", "b", "c"]), dataset(["a", "b", "d"]))
+
+        assert isinstance(result, AssertionError)
+        msg = str(result)
+        assert "HDF5 datasets are not equal" in msg
+        assert "Max absolute difference" not in msg
+        assert "Mismatch at index (2,): b'c' != b'd'" in msg
+
+    def test_tolerances(self):
+        actual = dataset([1.0, 2.0], chunks=(1,))
+        expected = dataset([1.0, 2.001], chunks=(1,))
+
+        assert isinstance(check(actual, expected), AssertionError)
+        assert check(actual, expected, rtol=1e-2) is True
+        assert check(actual, expected, atol=1e-2) is True
+
+    def test_tolerance_aliases(self):
+        api.assert_equal(
+            dataset([1.0]),
+            dataset([1.001]),
+            unpack_fns=[],
+            equal_fns=[builtin.equal_fns.h5py_dataset],
+            aliases={alias.RELATIVE_TOLERANCE: 1e-2},
+        )
+
+    def test_nan(self):
+        value = [np.nan, 1.0]
+
+        assert check(dataset(value), dataset(value)) is True
+        assert isinstance(
+            check(dataset(value), dataset(value), equal_nan=False), AssertionError
+        )
+
+    def test_nan_same_encoding(self, decoded):
+        value = [1.0, np.nan, 3.0]
+
+        assert check(dataset(value, chunks=(3,)), dataset(value, chunks=(3,))) is True
+        assert not decoded
+        assert isinstance(
+            check(
+                dataset(value, chunks=(3,)),
+                dataset(value, chunks=(3,)),
+                equal_nan=False,
+            ),
+            AssertionError,
+        )
+        # identical raw bytes are no proof of equality if NaN values are not equal
+        assert decoded == [(3,)]
+
+    def test_workers(self):
+        data = np.arange(10)
+
+        assert check(dataset(data, chunks=(1,)), dataset(data), workers=1) is True
+
+    def test_budget_exceeded(self):
+        budget = _budget.Budget(timeout=60, max_memory=None)
+        budget.reason = "sentinel"
+
+        with _budget.activate(budget):
+            result = check(dataset(np.zeros(2)), dataset(np.zeros(2)))
+
+        assert isinstance(result, api.BudgetExceededError)
+
+    def test_default(self):
+        actual, expected = file(), file()
+        for f, value in [(actual, 1.0), (expected, 1.5)]:
+            f.create_group("foo").create_dataset("bar", data=np.array([0.0, value]))
+            f.create_dataset("baz", data=np.arange(3))
+
+        errors = compyre.api.compare(
+            actual,
+            expected,
+            unpack_fns=compyre.default_unpack_fns(),
+            equal_fns=compyre.default_equal_fns(),
+        )
+
+        assert [e.pair.index for e in errors] == [("foo", "bar")]
+        assert "Mismatch at index (1,): 1.0 != 1.5" in str(errors[0].exception)
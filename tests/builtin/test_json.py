@@ -0,0 +1,325 @@
+import asyncio
+import io
+import json
+import math
+import pathlib
+
+import pytest
+
+import compyre
+from compyre import api, builtin
+from compyre.builtin import _json
+
+from ._utils import summary
+
+
+@pytest.fixture(params=["ijson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(_json, "is_available", lambda fn: False)
+    return request.param
+
+
+def compare(
+    tmp_path, actual, expected, *, suffix=".json", asynchronous=False, **kwargs
+):
+    paths = []
+    for name, document in [("actual", actual), ("expected", expected)]:
+        path = tmp_path / f"{name}{suffix}"
+        path.write_text(document if isinstance(document, str) else json.dumps(document))
+        paths.append(path)
+
+    kwargs.update(
+        unpack_fns=[builtin.unpack_fns.json_file, *compyre.default_unpack_fns()],
+        equal_fns=compyre.default_equal_fns(),
+    )
+    if asynchronous:
+        return asyncio.run(api.acompare(*paths, **kwargs))
+
+    return api.compare(*paths, **kwargs)
+
+
+class TestJsonFile:
+    @pytest.mark.parametrize(
+        ("actual", "expected"),
+        [
+            ("foo.json", "foo.json"),
+            (pathlib.Path("foo.txt"), pathlib.Path("foo.txt")),
+            (pathlib.Path("foo.json"), pathlib.Path("foo.txt")),
+            ({}, {}),
+            ([], []),
+        ],
+    )
+    def test_not_supported(self, actual, expected):
+        assert (
+            builtin.unpack_fns.json_file(
+                api.Pair(index=(), actual=actual, expected=expected)
+            )
+            is None
+        )
+
+    def test_equal(self, tmp_path, backend):
+        document = {
+            "str": "foo",
+            "int": 1,
+            "float": 2.5,
+            "bool": True,
+            "null": None,
+            "nested": {"array": [1, [2, {"foo": "bar"}], {}, []], "empty": {}},
+        }
+
+        assert compare(tmp_path, document, document) == []
+
+    def test_mismatches(self, tmp_path, backend):
+        actual = {"foo": [1, 2.5, "bar"], "bar": {"baz": [None, True]}, "qux": 0}
+        expected = {"foo": [1, 2.6, "baz"], "bar": {"baz": [None, False]}, "qux": 1}
+
+        assert summary(compare(tmp_path, actual, expected)) == [
+            (("foo", 1), AssertionError),
+            (("foo", 2), AssertionError),
+            (("bar", "baz", 1), AssertionError),
+            (("qux",), AssertionError),
+        ]
+
+    def test_tolerances(self, tmp_path, backend):
+        assert (
+            compare(tmp_path, {"foo": [1.0]}, {"foo": [1.0 + 1e-3]}, rel_tol=1e-2) == []
+        )
+
+    def test_scalar_root(self, tmp_path, backend):
+        errors = compare(tmp_path, "1", "2")
+
+        assert summary(errors) == [((), AssertionError)]
+
+    def test_key_order(self, tmp_path, backend):
+        actual = {"foo": 0, "bar": {"baz": [1, 2]}, "qux": 3}
+        expected = {"foo": 0, "qux": 3, "bar": {"baz": [1, -2]}}
+
+        assert summary(compare(tmp_path, actual, expected)) == [
+            (("bar", "baz", 1), AssertionError)
+        ]
+
+    @pytest.mark.parametrize(
+        ("actual", "expected"),
+        [
+            ({"foo": 0, "bar": 1}, {"foo": 0, "baz": 1}),
+            ({"foo": 0, "bar": 1}, {"foo": 0}),
+            ({"foo": 0}, {"foo": 0, "bar": {"baz": [1]}}),
+        ],
+    )
+    def test_keys_mismatch(self, tmp_path, backend, actual, expected):
+        errors = compare(tmp_path, actual, expected)
+
+        assert summary(errors) == [((), ValueError)]
+        assert "mapping keys mismatch" in str(errors[0].exception)
+
+    @pytest.mark.parametrize(
+        ("actual", "expected", "msg"),
+        [
+            ([1, 2], [1, 2, [3, {"foo": 4}], 5], "2 != 4"),
+            ([1, [2], {"foo": 3}], [1], "3 != 1"),
+        ],
+    )
+    def test_length_mismatch(self, tmp_path, backend, actual, expected, msg):
+        errors = compare(tmp_path, {"foo": actual}, {"foo": expected})
+
+        assert summary(errors) == [(("foo",), ValueError)]
+        assert f"sequence length mismatches: {msg}" in str(errors[0].exception)
+
+    @pytest.mark.parametrize(
+        ("actual", "expected", "msg"),
+        [
+            ({"foo": 1}, [1], "object != array"),
+            ([1], "1", "array != number"),
+            ("null", {"foo": 1}, "null != object"),
+        ],
+    )
+    def test_root_kind_mismatch(self, tmp_path, backend, actual, expected, msg):
+        errors = compare(tmp_path, actual, expected)
+
+        assert summary(errors) == [((), ValueError)]
+        assert f"kinds mismatch: {msg}" in str(errors[0].exception)
+
+    def test_kind_mismatch(self, tmp_path, backend):
+        actual = {"foo": {"bar": [1, 2]}, "baz": [[1], "qux"], "quux": [1]}
+        expected = {"foo": [{"bar": 1}], "baz": [{"foo": 1}, {"qux": 1}], "quux": [2]}
+
+        errors = compare(tmp_path, actual, expected)
+
+        assert summary(errors) == [
+            (("foo",), ValueError),
+            (("baz", 0), ValueError),
+            (("baz", 1), ValueError),
+            (("quux", 0), AssertionError),
+        ]
+        assert [str(e.exception) for e in errors[:3]] == [
+            "JSON value kinds mismatch: object != array",
+            "JSON value kinds mismatch: array != object",
+            "JSON value kinds mismatch: string != object",
+        ]
+
+    def test_partially_compared(self, tmp_path, backend):
+        actual = {"foo": [1, [2, 3], {"bar": 4}], "baz": 5}
+        expected = {"foo": [1, [-2, 3], {"bar": 4}], "baz": -5}
+
+        errors = compare(tmp_path, actual, expected, max_errors=1)
+
+        assert summary(errors) == [(("foo", 1, 0), AssertionError)]
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"cost": api.estimate_cost}, {"asynchronous": True}]
+    )
+    def test_not_depth_first(self, tmp_path, backend, kwargs):
+        actual = {"x": {"p": [1, 2]}, "y": {"q": 4, "r": [[1], {"s": 2}]}, "z": 3}
+        expected = {"x": {"p": [1, 2]}, "y": {"q": 5, "r": [[1], {"s": -2}]}, "z": 3}
+
+        assert not compare(tmp_path, actual, actual, **kwargs)
+        assert sorted(summary(compare(tmp_path, actual, expected, **kwargs))) == [
+            (("y", "q"), AssertionError),
+            (("y", "r", 1, "s"), AssertionError),
+        ]
+
+    def test_not_depth_first_parse_error(self, tmp_path, backend):
+        errors = compare(
+            tmp_path,
+            '{"x": {"p": [1, 2]}, "y": [[1], x]}',
+            {"x": {"p": [1, 2]}, "y": [[1], 2]},
+            cost=api.estimate_cost,
+        )
+
+        assert len(errors) == 1
+        assert not isinstance(errors[0].exception, (AssertionError, api.CompyreError))
+
+    @pytest.mark.parametrize(
+        "document", ['{"foo": [1, 2', '{"foo": [1, 2]} {', '{"foo": [1, 2]]']
+    )
+    def test_parse_error(self, tmp_path, backend, document):
+        errors = compare(tmp_path, document, {"foo": [1, 2]})
+
+        assert len(errors) == 1
+        assert not isinstance(errors[0].exception, (AssertionError, api.CompyreError))
+
+    def test_parse_error_nested(self, tmp_path, backend):
+        errors = compare(tmp_path, '{"foo": [[1, x]]}', {"foo": [[1, 2]]})
+
+        assert summary(errors)[0][0] == ("foo", 0)
+        assert len(errors) == 1
+
+    def test_missing_file(self, tmp_path):
+        path = tmp_path / "actual.json"
+        path.write_text("{}")
+
+        items = list(
+            builtin.unpack_fns.json_file(
+                api.Pair(index=(), actual=path, expected=tmp_path / "missing.json")
+            )
+        )
+
+        assert len(items) == 1
+        assert isinstance(items[0], FileNotFoundError)
+
+    def test_json_lines(self, tmp_path, backend):
+        actual = '{"foo": 1}\n\n[1, 2]\n"bar"\n'
+        expected = '{"foo": 1}\n[1, 3]\n"baz"'
+
+        errors = compare(tmp_path, actual, expected, suffix=".jsonl")
+
+        assert summary(errors) == [((1, 1), AssertionError), ((2,), AssertionError)]
+
+    def test_json_lines_length_mismatch(self, tmp_path, backend):
+        errors = compare(tmp_path, "1\n2\n", "1\n", suffix=".ndjson")
+
+        assert summary(errors) == [((), ValueError)]
+        assert "expected is exhausted after 1 item(s)" in str(errors[0].exception)
+
+    def test_json_lines_invalid(self, tmp_path, backend):
+        errors = compare(tmp_path, "1\n{\n", "1\n2\n", suffix=".jsonl")
+
+        assert summary(errors) == [((), ValueError)]
+        assert "line 2 of actual is invalid JSON" in str(errors[0].exception)
+
+
+class TestStdlibEvents:
+    @pytest.fixture(params=[1, 7, 1 << 16], autouse=True)
+    def chunk_size(self, request, monkeypatch):
+        monkeypatch.setattr(_json, "_CHUNK_SIZE", request.param)
+
+    @pytest.mark.parametrize(
+        "document",
+        [
+            {},
+            [],
+            "foo",
+            1234567890123,
+            -1.5e-10,
+            None,
+            {
+                "foo": ["bar", 1, 2.5, True, False, None, {}, []],
+                "bäz": {"q\\u00fcx": "\n"},
+            },
+            [[[1e10, -0.0, 1.25e-3, 0]]],
+        ],
+    )
+    def test_events(self, document):
+        import ijson
+
+        text = json.dumps(document, indent=2)
+
+        assert list(_json._stdlib_events(io.StringIO(text))) == [
+            *ijson.basic_parse(io.BytesIO(text.encode()), use_float=True),
+            ("end", None),
+        ]
+
+    def test_constants(self):
+        events = list(_json._stdlib_events(io.StringIO("[NaN, Infinity, -Infinity]")))
+
+        values = [value for event, value in events if event == "number"]
+        assert math.isnan(values[0])
+        assert values[1:] == [math.inf, -math.inf]
+
+    @pytest.mark.parametrize(
+        ("document", "msg"),
+        [
+            ("", "Expecting value: char 0"),
+            ("[1, ]", "Expecting value: char 4"),
+            ("{1: 2}", "Expecting property name enclosed in double quotes: char 1"),
+            ('{"foo" 1}', "Expecting ':' delimiter: char 7"),
+            ("[1 2]", "Expecting ',' delimiter: char 3"),
+            ('{"foo": 1]', "Expecting ',' delimiter: char 9"),
+            ("[1] 2", "Extra data: char 4"),
+            ('"foo', "Unterminated string starting at: char 0"),
+            ('"foo\\', "Unterminated string starting at: char 0"),
+            ('["foo\nbar"]', "Invalid control character at: char 5"),
+        ],
+    )
+    def test_errors(self, document, msg):
+        with pytest.raises(ValueError, match=f"^{msg}$"):
+            list(_json._stdlib_events(io.StringIO(document)))
+
+    def test_long_string(self, monkeypatch):
+        calls = []
+        scanstring = _json.scanstring
+
+        def spy(*args):
+            calls.append(args)
+            return scanstring(*args)
+
+        monkeypatch.setattr(_json, "scanstring", spy)
+        value = 'foo\\bar"baz' * 100
+
+        assert list(_json._stdlib_events(io.StringIO(json.dumps([value])))) == [
+            ("start_array", None),
+            ("string", value),
+            ("end_array", None),
+            ("end", None),
+        ]
+        # the string is only parsed once it is read completely
+        assert len(calls) == 1
+
+    def test_invalid_string(self):
+        file = io.StringIO('["foo\nbar", ' + "1, " * (1 << 16) + "1]")
+
+        with pytest.raises(ValueError, match="Invalid control character"):
+            list(_json._stdlib_events(file))
+        # the rest of the file is not read
+        assert file.tell() < len(file.getvalue())
@@ -4,7 +4,8 @@ import numpy as np
 import pytest
 import torch
 
-from compyre import alias, api, builtin
+from compyre import _budget, alias, api, builtin
+from compyre.builtin import _numpy
 
 
 class TestNumpyNdarray:
@@ -150,3 +151,61 @@ class TestNumpyNdarray:
             return str(result)
 
         assert len(msg(verbose=True)) > len(msg(verbose=False))
+
+    @pytest.mark.parametrize(
+        ("actual", "expected", "result"),
+        [
+            (np.zeros((8, 2)), np.zeros((8, 2)), True),
+            (np.zeros((8, 2)), np.ones((8, 2)), AssertionError),
+            (np.zeros(16), np.zeros((16, 1)), AssertionError),
+            (np.zeros(1), np.zeros(1), True),
+            (np.array(0.0), np.array(0.0), True),
+        ],
+    )
+    def test_chunked(self, monkeypatch, actual, expected, result):
+        monkeypatch.setattr(_numpy, "_CHUNK_SIZE", 32)
+
+        with _budget.activate(_budget.Budget(timeout=60, max_memory=None)):
+            r = builtin.equal_fns.numpy_ndarray(
+                api.Pair(index=(), actual=actual, expected=expected)
+            )
+
+        if result is True:
+            assert r is True
+        else:
+            assert isinstance(r, result)
+
+    @pytest.mark.parametrize("verbose", [True, False])
+    def test_chunked_mismatches(self, monkeypatch, verbose):
+        monkeypatch.setattr(_numpy, "_CHUNK_SIZE", 32)
+        # the full inputs are not compared again to build the error message
+        monkeypatch.setattr(np.testing, "assert_allclose", None)
+        actual = np.zeros((8, 2))
+        expected = actual.copy()
+        expected[5, 1] = 2.0
+        expected[7, 0] = -3.0
+
+        with _budget.activate(_budget.Budget(timeout=60, max_memory=None)):
+            result = builtin.equal_fns.numpy_ndarray(
+                api.Pair(index=(), actual=actual, expected=expected), verbose=verbose
+            )
+
+        assert isinstance(result, AssertionError)
+        msg = str(result)
+        assert "Arrays are not close" in msg
+        assert "Mismatched elements: 2 / 16" in msg
+        assert "Mismatched chunks: 2 / 4" in msg
+        assert "Max absolute difference among violations: 3.0" in msg
+        assert ("Mismatch at index (5, 1): 0.0 != 2.0" in msg) is verbose
+
+    def test_chunked_budget_exceeded(self, monkeypatch):
+        monkeypatch.setattr(_numpy, "_CHUNK_SIZE", 32)
+        budget = _budget.Budget(timeout=60, max_memory=None)
+        budget.reason = "sentinel"
+
+        with _budget.activate(budget):
+            result = builtin.equal_fns.numpy_ndarray(
+                api.Pair(index=(), actual=np.zeros(16), expected=np.zeros(16))
+            )
+
+        assert isinstance(result, api.BudgetExceededError)
@@ -0,0 +1,75 @@
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+import pytest
+
+from compyre import api, builtin
+
+Point = namedtuple("Point", ["x", "y"])
+
+
+class TestOptreePytree:
+    @pytest.mark.parametrize(
+        ("actual", "expected"),
+        [
+            (1, 1),
+            (np.zeros(2), np.zeros(2)),
+            ({"a": 1}, {"b": 1}),
+            ([1, 2], (1, 2)),
+            ([1], 1),
+            (OrderedDict([("a", 1), ("b", 2)]), OrderedDict([("b", 2), ("a", 1)])),
+        ],
+    )
+    def test_not_supported(self, actual, expected):
+        assert (
+            builtin.unpack_fns.optree_pytree(
+                api.Pair(index=(), actual=actual, expected=expected)
+            )
+            is None
+        )
+
+    def test_pairs(self):
+        index = ("index",)
+        actual = {"b": [1, (2, None)], "a": Point(3, np.zeros(1))}
+        expected = {"a": Point(-3, np.ones(1)), "b": [-1, (-2, None)]}
+
+        pairs = list(
+            builtin.unpack_fns.optree_pytree(
+                api.Pair(index=index, actual=actual, expected=expected)
+            )
+        )
+
+        assert [p.index for p in pairs] == [
+            (*index, "a", 0),
+            (*index, "a", 1),
+            (*index, "b", 0),
+            (*index, "b", 1, 0),
+            (*index, "b", 1, 1),
+        ]
+        assert [p.actual for p in pairs][:1] == [3]
+        assert [p.expected for p in pairs][:1] == [-3]
+        assert pairs[-1].actual is None
+
+    def test_none_is_leaf(self):
+        assert (
+            builtin.unpack_fns.optree_pytree(
+                api.Pair(index=(), actual=[None], expected=[None]), none_is_leaf=False
+            )
+            is not None
+        )
+
+    def test_fallback(self):
+        errors = api.compare(
+            {"a": [1, {"b": 2}]},
+            {"a": [1, {"c": 2}]},
+            unpack_fns=[
+                builtin.unpack_fns.optree_pytree,
+                builtin.unpack_fns.collections_mapping,
+                builtin.unpack_fns.collections_sequence,
+            ],
+            equal_fns=[builtin.equal_fns.builtins_object],
+        )
+
+        assert len(errors) == 1
+        assert errors[0].pair.index == ("a", 1)
+        assert "mapping keys mismatch" in str(errors[0].exception)
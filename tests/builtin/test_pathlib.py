@@ -0,0 +1,283 @@
+import json
+import os
+import pathlib
+
+import numpy as np
+import pytest
+
+import compyre
+from compyre import _budget, api, builtin
+from compyre.builtin import _pathlib
+
+from ._utils import summary
+
+
+def make_tree(root, files):
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(content, np.ndarray):
+            np.save(path, content)
+        elif isinstance(content, str):
+            path.write_text(content)
+        else:
+            path.write_bytes(content)
+    return root
+
+
+def compare(actual, expected, **kwargs):
+    return api.compare(
+        actual,
+        expected,
+        unpack_fns=[builtin.unpack_fns.pathlib_path, *compyre.default_unpack_fns()],
+        equal_fns=compyre.default_equal_fns(),
+        **kwargs,
+    )
+
+
+class TestPathlibPath:
+    @pytest.mark.parametrize(
+        ("actual", "expected"), [("foo", "foo"), (pathlib.Path("foo"), "foo")]
+    )
+    def test_not_supported(self, actual, expected):
+        assert (
+            builtin.unpack_fns.pathlib_path(
+                api.Pair(index=(), actual=actual, expected=expected)
+            )
+            is None
+        )
+
+    def test_equal(self, tmp_path):
+        files = {
+            "foo.txt": "foo",
+            "empty": b"",
+            "nested/bar.bin": bytes(range(256)),
+            "nested/deeper/baz.npy": np.arange(3),
+        }
+        actual = make_tree(tmp_path / "actual", files)
+        expected = make_tree(tmp_path / "expected", files)
+
+        assert compare(actual, expected) == []
+
+    def test_files_mismatch(self, tmp_path):
+        actual = make_tree(tmp_path / "actual", {"foo": b"", "nested/bar": b""})
+        expected = make_tree(tmp_path / "expected", {"foo": b"", "nested/baz": b""})
+
+        errors = compare(actual, expected)
+
+        assert summary(errors) == [((), ValueError)]
+        assert all(
+            s in str(errors[0].exception)
+            for s in ["directory files mismatch", "'nested/bar'", "'nested/baz'"]
+        )
+
+    def test_contents_mismatch(self, tmp_path):
+        actual = make_tree(
+            tmp_path / "actual",
+            {
+                "a.bin": b"\x00\x01\x02",
+                "b.bin": b"\x00",
+                "c.bin": b"",
+                "d/e.bin": b"\x00",
+            },
+        )
+        expected = make_tree(
+            tmp_path / "expected",
+            {
+                "a.bin": b"\x00\xff\x02",
+                "b.bin": b"\x00",
+                "c.bin": b"\x00",
+                "d/e.bin": b"\x00",
+            },
+        )
+
+        errors = compare(actual, expected)
+
+        assert summary(errors) == [
+            (("a.bin",), AssertionError),
+            (("c.bin",), AssertionError),
+        ]
+        assert "First mismatch at byte offset 1" in str(errors[0].exception)
+        assert "lengths mismatch: 0 != 1" in str(errors[1].exception)
+
+    @pytest.mark.parametrize("cost", [None, api.estimate_cost])
+    def test_contents_compared_once(self, tmp_path, monkeypatch, cost):
+        actual = make_tree(
+            tmp_path / "actual", {"foo": b"foo", "bar": b"bar", "baz": b"baz"}
+        )
+        expected = make_tree(
+            tmp_path / "expected", {"foo": b"foo", "bar": b"baz", "baz": b"bar"}
+        )
+        calls = []
+        same_content = _pathlib._same_content
+
+        def spy(actual, expected, **kwargs):
+            calls.append(actual.name)
+            return same_content(actual, expected, **kwargs)
+
+        monkeypatch.setattr(_pathlib, "_same_content", spy)
+
+        errors = compare(actual, expected, cost=cost)
+
+        assert sorted(summary(errors)) == [
+            (("bar",), AssertionError),
+            (("baz",), AssertionError),
+        ]
+        # differing files are not compared bytewise again when they are unpacked
+        assert sorted(calls) == ["bar", "baz", "foo"]
+
+    def test_different_file_repr(self, tmp_path):
+        # the paths of differing files are shown like the paths of the input directories
+        assert repr(_pathlib._DifferentFile(tmp_path)) == repr(tmp_path)
+
+    def test_formats(self, tmp_path):
+        actual = make_tree(
+            tmp_path / "actual",
+            {
+                "array.npy": np.array([1.0, 2.0]),
+                "data.json": json.dumps({"foo": [1.0, "bar"]}),
+                "lines.jsonl": '{"foo": 1}\n{"foo": 2}\n',
+            },
+        )
+        expected = make_tree(
+            tmp_path / "expected",
+            {
+                "array.npy": np.array([1.0, 2.0 + 1e-12]),
+                "data.json": json.dumps({"foo": [1.0, "baz"]}, indent=2),
+                "lines.jsonl": '{"foo": 1}\n{"foo": 3}\n',
+            },
+        )
+
+        errors = compare(actual, expected)
+
+        assert summary(errors) == [
+            (("data.json", "foo", 1), AssertionError),
+            (("lines.jsonl", 1, "foo"), AssertionError),
+        ]
+
+    def test_npy_invalid(self, tmp_path):
+        actual = make_tree(tmp_path / "actual", {"array.npy": b"foo"})
+        expected = make_tree(tmp_path / "expected", {"array.npy": b"bar"})
+
+        errors = compare(actual, expected)
+
+        assert summary(errors) == [(("array.npy",), ValueError)]
+
+    def test_npy_without_numpy(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(_pathlib, "is_available", lambda fn: False)
+        actual = make_tree(tmp_path / "actual", {"array.npy": np.zeros(2)})
+        expected = make_tree(tmp_path / "expected", {"array.npy": np.ones(2)})
+
+        errors = compare(actual, expected)
+
+        assert summary(errors) == [(("array.npy",), AssertionError)]
+        assert "byte offset" in str(errors[0].exception)
+
+    def test_suffix_mismatch(self, tmp_path):
+        actual = make_tree(tmp_path, {"foo.json": "[1]"}) / "foo.json"
+        expected = make_tree(tmp_path, {"foo.txt": "[2]"}) / "foo.txt"
+
+        errors = compare(actual, expected)
+
+        assert summary(errors) == [((), AssertionError)]
+        assert "byte offset 1" in str(errors[0].exception)
+
+    def test_files(self, tmp_path):
+        actual = make_tree(tmp_path, {"actual.json": "[1]"}) / "actual.json"
+        expected = make_tree(tmp_path, {"expected.json": "[1]"}) / "expected.json"
+
+        assert (
+            list(
+                builtin.unpack_fns.pathlib_path(
+                    api.Pair(index=(), actual=actual, expected=expected)
+                )
+            )
+            == []
+        )
+
+    def test_shallow(self, tmp_path):
+        actual = make_tree(tmp_path / "actual", {"foo": b"foo", "bar": b"bar"})
+        expected = make_tree(tmp_path / "expected", {"foo": b"baz", "bar": b"baz"})
+        for name in ["foo", "bar"]:
+            stat = os.stat(actual / name)
+            os.utime(expected / name, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.utime(expected / "bar", ns=(0, 0))
+
+        assert summary(compare(actual, expected)) == [
+            (("bar",), AssertionError),
+            (("foo",), AssertionError),
+        ]
+        assert summary(compare(actual, expected, shallow=True)) == [
+            (("bar",), AssertionError)
+        ]
+
+    def test_kinds_mismatch(self, tmp_path):
+        actual = make_tree(tmp_path / "actual", {"foo": b""})
+        expected = actual / "foo"
+
+        result = builtin.unpack_fns.pathlib_path(
+            api.Pair(index=(), actual=actual, expected=expected)
+        )
+
+        assert isinstance(result, ValueError)
+        assert "path kinds mismatch: directory != file" in str(result)
+
+    def test_missing(self, tmp_path):
+        result = builtin.unpack_fns.pathlib_path(
+            api.Pair(index=(), actual=tmp_path, expected=tmp_path / "missing")
+        )
+
+        assert isinstance(result, FileNotFoundError)
+        assert "missing" in str(result)
+
+    def test_os_error(self, tmp_path, monkeypatch):
+        actual = make_tree(tmp_path / "actual", {"foo": b"foo"})
+        expected = make_tree(tmp_path / "expected", {"foo": b"foo"})
+
+        def open(path, mode):
+            raise PermissionError(path)
+
+        monkeypatch.setattr(_pathlib, "open", open, raising=False)
+
+        assert summary(compare(actual, expected)) == [((), PermissionError)]
+        assert summary(compare(actual / "foo", expected / "foo")) == [
+            ((), PermissionError)
+        ]
+
+    def test_map_error(self, tmp_path, monkeypatch):
+        actual = make_tree(tmp_path / "actual", {"foo": b"foo"})
+        expected = make_tree(tmp_path / "expected", {"foo": b"bar"})
+
+        def map(path):
+            raise PermissionError(path)
+
+        monkeypatch.setattr(_pathlib, "_map", map)
+
+        assert summary(compare(actual, expected)) == [(("foo",), PermissionError)]
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_many_files(self, tmp_path, workers):
+        files = {f"{i:03d}": bytes([i % 256]) * (i * 1_000) for i in range(200)}
+        actual = make_tree(tmp_path / "actual", files)
+        files["150"] = b"\xff"
+        expected = make_tree(tmp_path / "expected", files)
+
+        errors = compare(actual, expected, workers=workers, max_errors=1)
+
+        assert summary(errors) == [(("150",), AssertionError)]
+
+    def test_budget_exceeded(self, tmp_path):
+        actual = make_tree(tmp_path / "actual", {"foo": b"foo"})
+        expected = make_tree(tmp_path / "expected", {"foo": b"foo"})
+        budget = _budget.Budget(timeout=60, max_memory=None)
+        budget.reason = "sentinel"
+
+        with _budget.activate(budget):
+            items = list(
+                builtin.unpack_fns.pathlib_path(
+                    api.Pair(index=(), actual=actual, expected=expected)
+                )
+            )
+
+        assert len(items) == 1
+        assert isinstance(items[0], api.BudgetExceededError)
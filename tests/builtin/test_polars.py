@@ -0,0 +1,129 @@
+import math
+
+import polars as pl
+import pytest
+
+from compyre import alias, api, builtin
+
+
+def check(actual, expected, **kwargs):
+    return builtin.equal_fns.polars_dataframe(
+        api.Pair(index=(), actual=actual, expected=expected), **kwargs
+    )
+
+
+@pytest.fixture(params=["DataFrame", "LazyFrame"])
+def frame(request):
+    return getattr(pl, request.param)
+
+
+class TestPolarsDataframe:
+    @pytest.mark.parametrize(
+        ("actual", "expected"),
+        [
+            (object(), pl.DataFrame()),
+            (pl.DataFrame(), object()),
+            (pl.DataFrame({"foo": [1]}), pl.Series("foo", [1])),
+        ],
+    )
+    def test_not_supported(self, actual, expected):
+        assert check(actual, expected) is None
+
+    def test_equal(self, frame):
+        data = {
+            "int": [1, 2, None],
+            "float": [1.5, math.nan, -math.inf],
+            "str": ["foo", None, "bar"],
+            "bool": [True, False, None],
+            "list": [[1, 2], None, []],
+            "struct": [{"foo": 1}, {"foo": None}, None],
+        }
+
+        assert check(frame(data), frame(data)) is True
+
+    @pytest.mark.parametrize("data", [{}, {"foo": []}], ids=["no_columns", "no_rows"])
+    def test_empty(self, frame, data):
+        assert check(frame(data), frame(data)) is True
+
+    def test_mixed(self):
+        data = {"foo": [1.0, 2.0]}
+
+        assert check(pl.DataFrame(data), pl.LazyFrame(data)) is True
+
+    @pytest.mark.parametrize(
+        "expected",
+        [{"foo": [1], "baz": ["a"]}, {"foo": [1.0], "bar": ["a"]}],
+    )
+    def test_schema_mismatch(self, frame, expected):
+        result = check(frame({"foo": [1], "bar": ["a"]}), frame(expected))
+
+        assert isinstance(result, AssertionError)
+        assert "Polars schemas mismatch" in str(result)
+
+    def test_height_mismatch(self, frame):
+        result = check(frame({"foo": [1, 2]}), frame({"foo": [1, 2, 3]}))
+
+        assert isinstance(result, AssertionError)
+        assert "Polars heights mismatch: 2 != 3" in str(result)
+
+    def test_mismatches(self, frame):
+        actual = frame(
+            {"foo": [1.0, 2.0, None, math.inf], "bar": [[1], [2], ["3"], []]}
+        )
+        expected = frame(
+            {"foo": [1.0, 2.5, 3.0, -math.inf], "bar": [[1], [-2], ["3"], []]}
+        )
+
+        result = check(actual, expected)
+
+        assert isinstance(result, AssertionError)
+        msg = str(result)
+        assert "Polars frames are not close" in msg
+        assert "foo: 3 / 4" in msg
+        assert "bar: 1 / 4" in msg
+        assert "row 0" not in msg
+        assert "row 1: foo: 2.0 != 2.5, bar: [2] != [-2]" in msg
+        assert "row 2: foo: None != 3.0" in msg
+        assert "row 3: foo: inf != -inf" in msg
+
+    def test_not_equal(self, frame):
+        result = check(frame({"foo": ["a", None]}), frame({"foo": ["a", "b"]}))
+
+        assert isinstance(result, AssertionError)
+        assert "Polars frames are not equal" in str(result)
+        assert "row 1: foo: None != 'b'" in str(result)
+
+    def test_many_mismatches(self, frame):
+        result = check(frame({"foo": list(range(8))}), frame({"foo": [-1] * 8}))
+
+        assert isinstance(result, AssertionError)
+        assert "foo: 8 / 8" in str(result)
+        assert "row 4: foo: 4 != -1" in str(result)
+        assert "row 5" not in str(result)
+        assert str(result).endswith("...")
+
+    def test_tolerances(self, frame):
+        actual = frame({"foo": [1.0, 2.0], "bar": [100, 200]})
+        expected = frame({"foo": [1.0, 2.001], "bar": [100, 201]})
+
+        assert isinstance(check(actual, expected), AssertionError)
+        assert check(actual, expected, rtol=1e-2) is True
+        assert check(actual, expected, rtol=0, atol=1) is True
+
+    def test_tolerance_aliases(self, frame):
+        api.assert_equal(
+            frame({"foo": [1.0]}),
+            frame({"foo": [1.001]}),
+            unpack_fns=[],
+            equal_fns=[builtin.equal_fns.polars_dataframe],
+            aliases={alias.RELATIVE_TOLERANCE: 1e-2},
+        )
+
+    def test_nan(self, frame):
+        value = {"foo": [math.nan]}
+
+        assert check(frame(value), frame(value)) is True
+
+        result = check(frame(value), frame(value), equal_nan=False)
+        assert isinstance(result, AssertionError)
+        assert "row 0: foo: nan != nan" in str(result)
@@ -0,0 +1,222 @@
+import math
+
+import pyarrow as pa
+import pytest
+
+import compyre
+from compyre import _budget, alias, api, builtin
+
+
+def check(actual, expected, **kwargs):
+    return builtin.equal_fns.pyarrow_array(
+        api.Pair(index=(), actual=actual, expected=expected), **kwargs
+    )
+
+
+class TestPyarrowTable:
+    @pytest.mark.parametrize(
+        ("actual", "expected"),
+        [
+            (object(), pa.table({"foo": [1]})),
+            (pa.table({"foo": [1]}), object()),
+            (pa.table({"foo": [1]}), {"foo": [1]}),
+        ],
+    )
+    def test_not_supported(self, actual, expected):
+        assert (
+            builtin.unpack_fns.pyarrow_table(
+                api.Pair(index=(), actual=actual, expected=expected)
+            )
+            is None
+        )
+
+    @pytest.mark.parametrize(
+        "cls", [pa.table, pa.record_batch], ids=["table", "record_batch"]
+    )
+    def test_unpack(self, cls):
+        actual = cls({"foo": [1, 2], "bar": ["a", "b"]})
+        expected = cls({"foo": [1, 3], "bar": ["a", "b"]})
+
+        pairs = builtin.unpack_fns.pyarrow_table(
+            api.Pair(index=("baz",), actual=actual, expected=expected)
+        )
+
+        assert [pair.index for pair in pairs] == [("baz", "foo"), ("baz", "bar")]
+        assert pairs[0].actual.equals(actual.column("foo"))
+        assert pairs[0].expected.equals(expected.column("foo"))
+
+    @pytest.mark.parametrize(
+        "expected",
+        [
+            pa.table({"foo": [1], "baz": ["a"]}),
+            pa.table({"foo": [1.0], "bar": ["a"]}),
+            pa.table({"bar": ["a"], "foo": [1]}),
+        ],
+    )
+    def test_schema_mismatch(self, expected):
+        result = builtin.unpack_fns.pyarrow_table(
+            api.Pair(
+                index=(), actual=pa.table({"foo": [1], "bar": ["a"]}), expected=expected
+            )
+        )
+
+        assert isinstance(result, ValueError)
+        assert "Arrow schemas mismatch" in str(result)
+
+    def test_num_rows_mismatch(self):
+        result = builtin.unpack_fns.pyarrow_table(
+            api.Pair(
+                index=(),
+                actual=pa.table({"foo": [1]}),
+                expected=pa.table({"foo": pa.array([], pa.int64())}),
+            )
+        )
+
+        assert isinstance(result, ValueError)
+        assert "Arrow number of rows mismatch: 1 != 0" in str(result)
+
+    def test_compare(self):
+        actual = pa.table({"foo": [1.0, 2.0], "bar": ["a", "b"], "baz": [1, 2]})
+        expected = pa.table({"foo": [1.0, 2.5], "bar": ["a", "c"], "baz": [1, 2]})
+
+        errors = api.compare(
+            actual,
+            expected,
+            unpack_fns=compyre.default_unpack_fns(),
+            equal_fns=compyre.default_equal_fns(),
+        )
+
+        assert [(e.pair.index, type(e.exception)) for e in errors] == [
+            (("foo",), AssertionError),
+            (("bar",), AssertionError),
+        ]
+
+
+class TestPyarrowArray:
+    @pytest.mark.parametrize(
+        ("actual", "expected"),
+        [
+            (object(), pa.array([1])),
+            (pa.array([1]), object()),
+            (pa.array([1]), [1]),
+        ],
+    )
+    def test_not_supported(self, actual, expected):
+        assert check(actual, expected) is None
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            [1, 2, None],
+            [1.5, float("nan"), None, -math.inf],
+            ["foo", None, "bar"],
+            [True, False, None],
+            [[1, 2], None, []],
+            [{"foo": 1}, {"foo": None}],
+        ],
+    )
+    def test_equal(self, values):
+        assert check(pa.array(values), pa.array(values)) is True
+
+    def test_chunk_layouts(self):
+        values = list(range(10))
+        actual = pa.chunked_array([values[:3], [], values[3:7], values[7:]])
+        expected = pa.chunked_array([values[:5], values[5:]])
+
+        assert check(actual, expected) is True
+        assert check(actual, pa.array(values)) is True
+
+        expected = pa.chunked_array([values[:5], [5, 6, -7, 8, 9]])
+        result = check(actual, expected)
+        assert isinstance(result, AssertionError)
+        assert "row 7: 7 != -7" in str(result)
+
+    def test_type_mismatch(self):
+        result = check(pa.array([1], pa.int32()), pa.array([1], pa.int64()))
+
+        assert isinstance(result, AssertionError)
+        assert "Arrow types mismatch: int32 != int64" in str(result)
+
+    def test_length_mismatch(self):
+        result = check(pa.array([1]), pa.array([1, 2]))
+
+        assert isinstance(result, AssertionError)
+        assert "Arrow lengths mismatch: 1 != 2" in str(result)
+
+    @pytest.mark.parametrize("null", [False, True])
+    def test_tolerances(self, null):
+        actual = pa.array([1.0, 2.0, *([None] if null else [])])
+        expected = pa.array([1.0, 2.001, *([None] if null else [])])
+
+        result = check(actual, expected)
+        assert isinstance(result, AssertionError)
+        assert "Arrow values are not close" in str(result)
+        assert "row 1: 2.0 != 2.001" in str(result)
+
+        assert check(actual, expected, rtol=1e-2) is True
+        assert check(actual, expected, atol=1e-2) is True
+
+    def test_tolerance_aliases(self):
+        api.assert_equal(
+            pa.array([1.0, None]),
+            pa.array([1.001, None]),
+            unpack_fns=[],
+            equal_fns=[builtin.equal_fns.pyarrow_array],
+            aliases={alias.RELATIVE_TOLERANCE: 1e-2},
+        )
+
+    @pytest.mark.parametrize("null", [False, True])
+    def test_nan(self, null):
+        value = pa.array([float("nan"), *([None] if null else [])])
+
+        assert check(value, value) is True
+        assert isinstance(check(value, value, equal_nan=False), AssertionError)
+
+    @pytest.mark.parametrize("null", [False, True])
+    @pytest.mark.parametrize(
+        ("actual", "expected"),
+        [(1.0, float("inf")), (float("inf"), float("-inf"))],
+    )
+    def test_inf(self, null, actual, expected):
+        nulls = [None] if null else []
+
+        result = check(pa.array([actual, *nulls]), pa.array([expected, *nulls]))
+
+        assert isinstance(result, AssertionError)
+        assert "row 0" in str(result)
+        assert check(pa.array([expected, *nulls]), pa.array([expected, *nulls])) is True
+
+    @pytest.mark.parametrize(
+        ("actual", "expected", "msg"),
+        [
+            ([1, None, 3], [1, 2, None], ["row 1: None != 2", "row 2: 3 != None"]),
+            (["a", None], [None, "b"], ["row 0: 'a' != None", "row 1: None != 'b'"]),
+            ([[1], None], [[2], None], ["row 0: [1] != [2]"]),
+        ],
+    )
+    def test_nulls(self, actual, expected, msg):
+        result = check(pa.array(actual), pa.array(expected))
+
+        assert isinstance(result, AssertionError)
+        assert all(m in str(result) for m in msg)
+
+    def test_many_mismatches(self):
+        result = check(
+            pa.chunked_array([["a"] * 4, ["b"] * 4]),
+            pa.chunked_array([["c"] * 8]),
+        )
+
+        assert isinstance(result, AssertionError)
+        assert "Mismatched elements: 8 / 8" in str(result)
+        assert "row 4: 'b' != 'c'" in str(result)
+        assert "row 5" not in str(result)
+        assert str(result).endswith("...")
+
+    def test_budget_exceeded(self):
+        budget = _budget.Budget(timeout=60, max_memory=None)
+        budget.reason = "sentinel"
+
+        with _budget.activate(budget):
+            result = check(pa.array([1]), pa.array([1]))
+
+        assert isinstance(result, api.BudgetExceededError)
@@ -42,11 +42,13 @@ class TestPydanticModel:
         simple_model = SimpleModel(foo="foo", bar=[0, 1, 2])
         model = NestedModel(simple_model=simple_model, baz=True)
 
-        pairs = builtin.unpack_fns.pydantic_model(
-            api.Pair(
-                index=index,
-                actual=model.model_copy(deep=True),
-                expected=model.model_copy(deep=True),
+        pairs = list(
+            builtin.unpack_fns.pydantic_model(
+                api.Pair(
+                    index=index,
+                    actual=model.model_copy(deep=True),
+                    expected=model.model_copy(deep=True),
+                )
             )
         )
 
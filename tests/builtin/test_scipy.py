@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+import scipy.sparse
+
+from compyre import alias, api, builtin
+
+
+def check(actual, expected, **kwargs):
+    return builtin.equal_fns.scipy_sparse(
+        api.Pair(index=(), actual=actual, expected=expected), **kwargs
+    )
+
+
+class TestScipySparse:
+    @pytest.mark.parametrize(
+        ("actual", "expected"),
+        [
+            (object(), scipy.sparse.eye(2)),
+            (scipy.sparse.eye(2), object()),
+            (scipy.sparse.eye(2), np.eye(2)),
+        ],
+    )
+    def test_not_supported(self, actual, expected):
+        assert check(actual, expected) is None
+
+    @pytest.mark.parametrize(
+        "format", ["csr", "csc", "coo", "bsr", "dia", "dok", "lil"]
+    )
+    def test_equal_formats(self, format):
+        value = scipy.sparse.random(8, 8, density=0.3, random_state=0)
+
+        assert check(value.asformat(format), value.tocsr()) is True
+
+    def test_sparse_array(self):
+        value = scipy.sparse.random_array((4, 6), density=0.5, random_state=0)
+
+        assert check(scipy.sparse.csr_array(value), value.tocoo()) is True
+
+    def test_canonicalization(self):
+        actual = scipy.sparse.coo_array(
+            ([1.0, 2.0, 0.0, 4.0], ([0, 0, 1, 2], [1, 1, 0, 2])), shape=(3, 3)
+        )
+        expected = scipy.sparse.csr_array(([4.0, 3.0], ([2, 0], [2, 1])), shape=(3, 3))
+
+        assert check(actual, expected) is True
+
+    def test_not_densified(self):
+        shape = (1_000_000, 1_000_000)
+        actual = scipy.sparse.coo_array(([1.0, 2.0], ([0, 999_999], [0, 5])), shape)
+        expected = scipy.sparse.coo_array(([1.0], ([0], [0])), shape)
+
+        result = check(actual, expected)
+
+        assert isinstance(result, AssertionError)
+        assert "Mismatched elements: 1 / 1000000000000" in str(result)
+        assert "(999999, 5): 2.0 != 0.0" in str(result)
+
+    def test_shape_mismatch(self):
+        result = check(scipy.sparse.eye(2), scipy.sparse.eye(3))
+
+        assert isinstance(result, AssertionError)
+        assert "Sparse shapes mismatch: (2, 2) != (3, 3)" in str(result)
+
+    def test_tolerances(self):
+        actual = scipy.sparse.csr_array(np.array([[1.0, 0.0], [0.0, 1e-9]]))
+        expected = scipy.sparse.csr_array(np.array([[1.001, 0.0], [0.0, 0.0]]))
+
+        assert isinstance(check(actual, expected), AssertionError)
+        assert check(actual, expected, rtol=1e-2, atol=1e-8) is True
+
+    def test_tolerance_aliases(self):
+        actual = scipy.sparse.csr_array(np.array([[1.0, 0.0]]))
+        expected = scipy.sparse.csr_array(np.array([[1.001, 0.0]]))
+
+        assert (
+            api.is_equal(
+                actual,
+                expected,
+                unpack_fns=[],
+                equal_fns=[builtin.equal_fns.scipy_sparse],
+                aliases={alias.RELATIVE_TOLERANCE: 1e-2},
+            )
+            is True
+        )
+
+    def test_nan(self):
+        value = scipy.sparse.csr_array(np.array([[np.nan, 1.0]]))
+
+        assert check(value, value.copy()) is True
+        assert isinstance(check(value, value.copy(), equal_nan=False), AssertionError)
+
+    def test_many_mismatches(self):
+        actual = scipy.sparse.csr_array(np.arange(1, 9, dtype=np.int64)[None])
+        expected = scipy.sparse.csr_array(np.zeros((1, 8), dtype=np.uint8))
+
+        result = check(actual, expected)
+
+        assert isinstance(result, AssertionError)
+        assert "Mismatched elements: 8 / 8" in str(result)
+        assert "Max absolute difference among violations: 8.0" in str(result)
+        assert "(0, 4): 5 != 0" in str(result)
+        assert "(0, 5)" not in str(result)
+        assert str(result).endswith("...")
+
+    def test_bool(self):
+        actual = scipy.sparse.csr_array(np.array([[True, False]]))
+        expected = scipy.sparse.csr_array(np.array([[True, True]]))
+
+        assert check(actual, actual.copy()) is True
+
+        result = check(actual, expected)
+        assert isinstance(result, AssertionError)
+        assert "(0, 1): False != True" in str(result)
+        assert "Max absolute difference" not in str(result)
@@ -1,10 +1,18 @@
+import array
+import asyncio
 import dataclasses
+import enum
+import functools
+import io
+import pathlib
 from collections import OrderedDict
+from collections.abc import Iterator
 from copy import deepcopy
 
 import pytest
 
-from compyre import alias, api, builtin
+import compyre
+from compyre import _budget, alias, api, builtin
 
 
 class TestCollectionsMapping:
@@ -28,8 +36,10 @@ class TestCollectionsMapping:
         actual = {"foo": "afoo", "bar": [0, 1, 2], "nested": {"baz": True}}
         expected = {"nested": {"baz": False}, "bar": [0, -1, -2], "foo": "efoo"}
 
-        pairs = builtin.unpack_fns.collections_mapping(
-            api.Pair(index=(), actual=actual, expected=expected)
+        pairs = list(
+            builtin.unpack_fns.collections_mapping(
+                api.Pair(index=(), actual=actual, expected=expected)
+            )
         )
 
         assert len(pairs) == len(actual)
@@ -54,7 +64,15 @@ class TestCollectionsMapping:
 class TestCollectionsSequence:
     @pytest.mark.parametrize(
         ("actual", "expected"),
-        [([], object()), (object(), []), ([], {}), ("abc", ["a", "b", "c"])],
+        [
+            ([], object()),
+            (object(), []),
+            ([], {}),
+            ("abc", ["a", "b", "c"]),
+            (b"abc", bytearray(b"abc")),
+            (array.array("i", [1]), b"\x01"),
+            (range(3), range(3)),
+        ],
     )
     def test_not_supported(self, actual, expected):
         assert (
@@ -69,8 +87,10 @@ class TestCollectionsSequence:
         actual = ["foo", 0, [True]]
         expected = ["bar", 1, [False]]
 
-        pairs = builtin.unpack_fns.collections_sequence(
-            api.Pair(index=index, actual=actual, expected=expected)
+        pairs = list(
+            builtin.unpack_fns.collections_sequence(
+                api.Pair(index=index, actual=actual, expected=expected)
+            )
         )
 
         assert len(pairs) == len(actual)
@@ -78,6 +98,34 @@ class TestCollectionsSequence:
         assert [p.actual for p in pairs] == actual
         assert [p.expected for p in pairs] == expected
 
+    def test_lazy(self):
+        actual = [0, 1, 2]
+        expected = [0, 1, 2]
+
+        pairs = builtin.unpack_fns.collections_sequence(
+            api.Pair(index=(), actual=actual, expected=expected)
+        )
+        assert isinstance(pairs, Iterator)
+        assert next(pairs).index == (0,)
+
+    @pytest.mark.parametrize(
+        ("actual", "expected"),
+        [
+            (range(3), [0, 1, 2]),
+            (b"abc", [97, 98, 99]),
+            (array.array("d", [1.0]), array.array("d", [1.0])),
+        ],
+    )
+    def test_supported(self, actual, expected):
+        pairs = list(
+            builtin.unpack_fns.collections_sequence(
+                api.Pair(index=(), actual=actual, expected=expected)
+            )
+        )
+
+        assert [p.actual for p in pairs] == list(actual)
+        assert [p.expected for p in pairs] == list(expected)
+
     def test_len_mismatch(self):
         actual = ["foo", "bar"]
         expected = ["baz"]
@@ -92,6 +140,319 @@ class TestCollectionsSequence:
         )
 
 
+async def _aiterate(values):
+    for v in values:
+        yield v
+
+
+async def _collect(aiterable):
+    return [item async for item in aiterable]
+
+
+class TestCollectionsRecords:
+    @pytest.mark.parametrize(
+        ("actual", "expected"),
+        [
+            (object(), object()),
+            ("foo", "foo"),
+            (b"foo", b"foo"),
+            ([], []),
+            ([{"foo": 0}], [{"foo": 0}, {"foo": 1}]),
+            ([{"foo": 0}], [OrderedDict(foo=0)]),
+            ([OrderedDict(foo=0)], [OrderedDict(foo=0)]),
+            ([{}], [{}]),
+            ([0], [0]),
+        ],
+    )
+    def test_not_supported(self, actual, expected):
+        assert (
+            builtin.unpack_fns.collections_records(
+                api.Pair(index=(), actual=actual, expected=expected)
+            )
+            is None
+        )
+
+    def test_dicts(self):
+        actual = [{"foo": i, 1: str(i)} for i in range(3)]
+        expected = deepcopy(actual)
+        expected[1][1] = "-1"
+
+        pairs = list(
+            builtin.unpack_fns.collections_records(
+                api.Pair(index=("records",), actual=actual, expected=expected)
+            )
+        )
+
+        assert [(p.index, p.actual, p.expected) for p in pairs] == [
+            (("records", i, k), actual[i][k], expected[i][k])
+            for i in range(3)
+            for k in ["foo", 1]
+        ]
+
+    def test_single_field(self):
+        actual = [{"foo": i} for i in range(3)]
+
+        pairs = list(
+            builtin.unpack_fns.collections_records(
+                api.Pair(index=(), actual=actual, expected=deepcopy(actual))
+            )
+        )
+
+        assert [(p.index, p.actual, p.expected) for p in pairs] == [
+            ((i, "foo"), i, i) for i in range(3)
+        ]
+
+    def test_dataclasses(self):
+        @dataclasses.dataclass
+        class Record:
+            foo: int
+            bar: list[int]
+
+        actual = [Record(i, [i]) for i in range(2)]
+        expected = [Record(i, [-i]) for i in range(2)]
+
+        pairs = list(
+            builtin.unpack_fns.collections_records(
+                api.Pair(index=(), actual=actual, expected=expected)
+            )
+        )
+
+        assert [(p.index, p.actual, p.expected) for p in pairs] == [
+            ((0, "foo"), 0, 0),
+            ((0, "bar"), [0], [0]),
+            ((1, "foo"), 1, 1),
+            ((1, "bar"), [1], [-1]),
+        ]
+
+    def test_dataclass_types(self):
+        @dataclasses.dataclass
+        class Record:
+            foo: int
+
+        assert (
+            builtin.unpack_fns.collections_records(
+                api.Pair(index=(), actual=[Record], expected=[Record])
+            )
+            is None
+        )
+
+    @pytest.mark.parametrize(
+        "deviation",
+        [
+            pytest.param({"foo": 1, "baz": 1}, id="keys"),
+            pytest.param({"foo": 1}, id="missing"),
+            pytest.param({"foo": 1, "bar": 1, "baz": 1}, id="extra"),
+            pytest.param(OrderedDict(foo=1, bar=1), id="type"),
+        ],
+    )
+    def test_deviation(self, deviation):
+        actual = [{"foo": i, "bar": i} for i in range(3)]
+        expected = deepcopy(actual)
+        expected[1] = deviation
+
+        pairs = list(
+            builtin.unpack_fns.collections_records(
+                api.Pair(index=(), actual=actual, expected=expected)
+            )
+        )
+
+        assert [p.index for p in pairs] == [
+            (0, "foo"),
+            (0, "bar"),
+            (1,),
+            (2, "foo"),
+            (2, "bar"),
+        ]
+        assert pairs[2].actual is actual[1]
+        assert pairs[2].expected is deviation
+
+    def test_deleted_field(self):
+        @dataclasses.dataclass
+        class Record:
+            foo: int
+
+        actual = [Record(0), Record(1)]
+        expected = deepcopy(actual)
+        del expected[1].foo
+
+        pairs = list(
+            builtin.unpack_fns.collections_records(
+                api.Pair(index=(), actual=actual, expected=expected)
+            )
+        )
+
+        assert [p.index for p in pairs] == [(0, "foo"), (1,)]
+
+    def test_compare(self):
+        actual = [{"foo": i, "bar": [i, i]} for i in range(4)]
+        expected = deepcopy(actual)
+        expected[1]["bar"][1] = -1
+        expected[2] = {"foo": 2, "baz": [2, 2]}
+
+        unpack_fns = compyre.default_unpack_fns()
+        equal_fns = compyre.default_equal_fns()
+        generic = api.compare(
+            actual, expected, unpack_fns=unpack_fns, equal_fns=equal_fns
+        )
+        specialized = api.compare(
+            actual,
+            expected,
+            unpack_fns=[builtin.unpack_fns.collections_records, *unpack_fns],
+            equal_fns=equal_fns,
+            adaptive=True,
+        )
+
+        assert [e.pair.index for e in specialized] == [(1, "bar", 1), (2,)]
+        assert [(e.pair.index, str(e.exception)) for e in specialized] == [
+            (e.pair.index, str(e.exception)) for e in generic
+        ]
+
+    def test_adaptive(self):
+        records_unpacked = []
+
+        @functools.wraps(builtin.unpack_fns.collections_records)
+        def collections_records(pair, /):
+            result = builtin.unpack_fns.collections_records(pair)
+            if result is not None:
+                records_unpacked.append(pair.index)
+            return result
+
+        value = {"numbers": [0, 1], "records": [{"foo": 0}, {"foo": 1}]}
+
+        errors = api.compare(
+            value,
+            deepcopy(value),
+            unpack_fns=[collections_records, *compyre.default_unpack_fns()],
+            equal_fns=compyre.default_equal_fns(),
+            adaptive=True,
+        )
+
+        assert not errors
+        # the records are unpacked even after a list without records was declined
+        assert records_unpacked == [("records",)]
+
+
+class TestCollectionsAsyncIterable:
+    @pytest.mark.parametrize(
+        ("actual", "expected"),
+        [([], _aiterate([])), (_aiterate([]), object())],
+    )
+    def test_not_supported(self, actual, expected):
+        assert (
+            builtin.unpack_fns.collections_async_iterable(
+                api.Pair(index=(), actual=actual, expected=expected)
+            )
+            is None
+        )
+
+    def test_pairs(self):
+        index = ("index",)
+        actual = ["foo", 0, [True]]
+        expected = ["bar", 1, [False]]
+
+        pairs = asyncio.run(
+            _collect(
+                builtin.unpack_fns.collections_async_iterable(
+                    api.Pair(
+                        index=index,
+                        actual=_aiterate(actual),
+                        expected=_aiterate(expected),
+                    )
+                )
+            )
+        )
+
+        assert [p.index for p in pairs] == [(*index, i) for i in range(len(actual))]
+        assert [p.actual for p in pairs] == actual
+        assert [p.expected for p in pairs] == expected
+
+    @pytest.mark.parametrize(
+        ("actual", "expected", "exhausted"),
+        [([0, 1], [0], "expected"), ([0], [0, 1], "actual")],
+    )
+    def test_len_mismatch(self, actual, expected, exhausted):
+        items = asyncio.run(
+            _collect(
+                builtin.unpack_fns.collections_async_iterable(
+                    api.Pair(
+                        index=(),
+                        actual=_aiterate(actual),
+                        expected=_aiterate(expected),
+                    )
+                )
+            )
+        )
+
+        *pairs, result = items
+        assert len(pairs) == 1
+        assert isinstance(result, ValueError)
+        assert all(
+            s in str(result)
+            for s in ["async iterable length mismatch", f"{exhausted} is exhausted"]
+        )
+
+
+class TestCollectionsIterator:
+    @pytest.mark.parametrize(
+        ("actual", "expected"),
+        [([], iter([])), (iter([]), object()), ([], [])],
+    )
+    def test_not_supported(self, actual, expected):
+        assert (
+            builtin.unpack_fns.collections_iterator(
+                api.Pair(index=(), actual=actual, expected=expected)
+            )
+            is None
+        )
+
+    def test_pairs(self):
+        index = ("index",)
+        actual = ["foo", 0, [True]]
+        expected = ["bar", 1, [False]]
+
+        pairs = list(
+            builtin.unpack_fns.collections_iterator(
+                api.Pair(index=index, actual=iter(actual), expected=iter(expected))
+            )
+        )
+
+        assert [p.index for p in pairs] == [(*index, i) for i in range(len(actual))]
+        assert [p.actual for p in pairs] == actual
+        assert [p.expected for p in pairs] == expected
+
+    def test_lazy(self):
+        consumed = []
+
+        def values():
+            for i in range(3):
+                consumed.append(i)
+                yield i
+
+        pairs = builtin.unpack_fns.collections_iterator(
+            api.Pair(index=(), actual=values(), expected=iter(range(3)))
+        )
+        assert not consumed
+
+        next(pairs)
+        assert consumed == [0]
+
+    @pytest.mark.parametrize(
+        ("actual", "expected", "exhausted"),
+        [([0, 1], [0], "expected"), ([0], [0, 1], "actual")],
+    )
+    def test_len_mismatch(self, actual, expected, exhausted):
+        *pairs, result = builtin.unpack_fns.collections_iterator(
+            api.Pair(index=(), actual=iter(actual), expected=iter(expected))
+        )
+
+        assert len(pairs) == 1
+        assert isinstance(result, ValueError)
+        assert all(
+            s in str(result)
+            for s in ["iterator length mismatch", f"{exhausted} is exhausted"]
+        )
+
+
 class TestCollectionsOrderedDict:
     @pytest.mark.parametrize(
         ("actual", "expected"),
@@ -114,8 +475,10 @@ class TestCollectionsOrderedDict:
             [("foo", "efoo"), ("bar", [0, -1, -2]), ("nested", {"baz": False})]
         )
 
-        pairs = builtin.unpack_fns.collections_ordered_dict(
-            api.Pair(index=index, actual=actual, expected=expected)
+        pairs = list(
+            builtin.unpack_fns.collections_ordered_dict(
+                api.Pair(index=index, actual=actual, expected=expected)
+            )
         )
 
         assert len(pairs) == len(actual)
@@ -256,6 +619,270 @@ class TestBuiltinsNumber:
         )
 
 
+class TestBuiltinsBytes:
+    @pytest.mark.parametrize(
+        ("actual", "expected"),
+        [
+            (object(), b""),
+            (b"", object()),
+            ("abc", b"abc"),
+            (array.array("d", [1.0]), b""),
+            (memoryview(array.array("f", [1.0])), b""),
+        ],
+    )
+    def test_not_supported(self, actual, expected):
+        assert (
+            builtin.equal_fns.builtins_bytes(
+                api.Pair(index=(), actual=actual, expected=expected)
+            )
+            is None
+        )
+
+    @pytest.mark.parametrize(
+        ("actual", "expected"),
+        [
+            (b"abc" * 10, b"abc" * 10),
+            (b"abc" * 10, bytearray(b"abc" * 10)),
+            (memoryview(b"abc"), b"abc"),
+            (array.array("B", b"abc"), b"abc"),
+            (memoryview(bytes(range(10)))[::2], bytes(range(0, 10, 2))),
+            (b"\x01\x02", array.array("i", [1, 2])),
+        ],
+    )
+    def test_equal(self, actual, expected):
+        assert (
+            builtin.equal_fns.builtins_bytes(
+                api.Pair(index=(), actual=actual, expected=expected)
+            )
+            is True
+        )
+
+    @pytest.mark.parametrize("offset", [0, 7, 8, 1_500_000, 2_999_999])
+    def test_mismatch_offset(self, offset):
+        expected = bytes(3_000_000)
+        actual = bytearray(expected)
+        actual[offset] = 0xFF
+
+        result = builtin.equal_fns.builtins_bytes(
+            api.Pair(index=(), actual=actual, expected=expected), bytes_context=2
+        )
+
+        assert isinstance(result, AssertionError)
+        msg = str(result)
+        assert f"offset {offset}" in msg
+        assert "ff" in msg
+        assert len(msg) < 200
+
+    def test_len_mismatch(self):
+        result = builtin.equal_fns.builtins_bytes(
+            api.Pair(index=(), actual=b"abc", expected=b"abcd")
+        )
+
+        assert isinstance(result, AssertionError)
+        assert all(
+            s in str(result) for s in ["lengths mismatch", "3 != 4", "61 62 63 64"]
+        )
+
+    def test_format_mismatch(self):
+        result = builtin.equal_fns.builtins_bytes(
+            api.Pair(index=(), actual=b"\x01", expected=array.array("i", [2]))
+        )
+
+        assert isinstance(result, AssertionError)
+        assert "formats" in str(result)
+
+    def test_shape_mismatch(self):
+        buffer = memoryview(bytes(6))
+
+        result = builtin.equal_fns.builtins_bytes(
+            api.Pair(
+                index=(),
+                actual=buffer.cast("B", (2, 3)),
+                expected=buffer.cast("B", (3, 2)),
+            )
+        )
+
+        assert isinstance(result, AssertionError)
+        assert "Buffer shapes mismatch: (2, 3) != (3, 2)" in str(result)
+
+    @pytest.mark.parametrize("adaptive", [False, True])
+    def test_adaptive(self, adaptive):
+        actual = [array.array("i", [1, 2]), array.array("d", [1.0, 2.0])]
+        expected = [array.array("i", [1, 2]), array.array("d", [1.0, 2.0 + 1e-12])]
+
+        errors = api.compare(
+            actual,
+            expected,
+            unpack_fns=compyre.default_unpack_fns(),
+            equal_fns=compyre.default_equal_fns(),
+            adaptive=adaptive,
+        )
+
+        # floating point arrays are unpacked even after an integer array was declined
+        assert not errors
+
+    def test_budget_exceeded(self):
+        budget = _budget.Budget(timeout=60, max_memory=None)
+        budget.reason = "sentinel"
+
+        with _budget.activate(budget):
+            result = builtin.equal_fns.builtins_bytes(
+                api.Pair(index=(), actual=bytearray(b"abc"), expected=b"abc")
+            )
+
+        assert isinstance(result, api.BudgetExceededError)
+        assert "sentinel" in str(result)
+
+
+class TestBuiltinsStr:
+    @pytest.mark.parametrize(
+        ("actual", "expected"),
+        [
+            (object(), ""),
+            ("", object()),
+            ("abc", b"abc"),
+            (enum.StrEnum("Enum", ["abc"]).abc, "abc"),
+        ],
+    )
+    def test_not_supported(self, actual, expected):
+        assert (
+            builtin.equal_fns.builtins_str(
+                api.Pair(index=(), actual=actual, expected=expected)
+            )
+            is None
+        )
+
+    def test_equal(self):
+        assert (
+            builtin.equal_fns.builtins_str(
+                api.Pair(index=(), actual="abc" * 10, expected="abc" * 10)
+            )
+            is True
+        )
+
+    @pytest.mark.parametrize("offset", [0, 7, 1_500_000, 2_999_999])
+    def test_mismatch_offset(self, offset):
+        expected = "a" * 3_000_000
+        actual = f"{expected[:offset]}b{expected[offset + 1 :]}"
+
+        result = builtin.equal_fns.builtins_str(
+            api.Pair(index=(), actual=actual, expected=expected), str_context=2
+        )
+
+        assert isinstance(result, AssertionError)
+        msg = str(result)
+        assert f"index {offset} (line 1, column {offset + 1})" in msg
+        assert "b" in msg
+        assert len(msg) < 200
+
+    def test_line_column(self):
+        expected = "foo\nbar\nbaz\n"
+        actual = "foo\nbar\nbAz\n"
+
+        result = builtin.equal_fns.builtins_str(
+            api.Pair(index=(), actual=actual, expected=expected)
+        )
+
+        assert isinstance(result, AssertionError)
+        assert "index 9 (line 3, column 2)" in str(result)
+
+    def test_len_mismatch(self):
+        result = builtin.equal_fns.builtins_str(
+            api.Pair(index=(), actual="abc", expected="abcd")
+        )
+
+        assert isinstance(result, AssertionError)
+        assert all(
+            s in str(result)
+            for s in ["lengths mismatch", "3 != 4", "First 3 characters", "'abcd'"]
+        )
+
+    def test_diff(self):
+        expected = "".join(f"line {i}\n" for i in range(100_000))
+        actual = expected.replace("line 50000\n", "line -50000\n")
+
+        result = builtin.equal_fns.builtins_str(
+            api.Pair(index=(), actual=actual, expected=expected), diff_lines=8
+        )
+
+        assert isinstance(result, AssertionError)
+        msg = str(result)
+        assert all(
+            s in msg
+            for s in [
+                "line 50001, column 6",
+                "--- actual",
+                "+++ expected",
+                "@@ -49998,",
+                " line 49997",
+                "-line -50000",
+                "+line 50000",
+            ]
+        )
+        assert msg.endswith("\n...")
+        assert len(msg) < 1_000
+
+    def test_diff_start(self):
+        result = builtin.equal_fns.builtins_str(
+            api.Pair(index=(), actual="foo\nbar", expected="foo\nbaz"),
+            diff_lines=100,
+        )
+
+        assert isinstance(result, AssertionError)
+        msg = str(result)
+        assert all(s in msg for s in ["@@ -1,2 +1,2 @@", "-bar", "+baz"])
+        assert not msg.endswith("...")
+
+    def test_diff_single_line(self):
+        result = builtin.equal_fns.builtins_str(
+            api.Pair(index=(), actual="foo", expected="bar"), diff_lines=10
+        )
+
+        assert isinstance(result, AssertionError)
+        assert "---" not in str(result)
+
+    def test_budget_exceeded(self):
+        budget = _budget.Budget(timeout=60, max_memory=None)
+        budget.reason = "sentinel"
+
+        with _budget.activate(budget):
+            result = builtin.equal_fns.builtins_str(
+                api.Pair(index=(), actual="abc", expected="abd")
+            )
+
+        assert isinstance(result, api.BudgetExceededError)
+        assert "sentinel" in str(result)
+
+
+class TestBuiltinsRange:
+    @pytest.mark.parametrize(
+        ("actual", "expected"), [(range(3), [0, 1, 2]), ([0, 1, 2], range(3))]
+    )
+    def test_not_supported(self, actual, expected):
+        assert (
+            builtin.equal_fns.builtins_range(
+                api.Pair(index=(), actual=actual, expected=expected)
+            )
+            is None
+        )
+
+    def test_equal(self):
+        assert (
+            builtin.equal_fns.builtins_range(
+                api.Pair(index=(), actual=range(0), expected=range(3, 3))
+            )
+            is True
+        )
+
+    def test_not_equal(self):
+        result = builtin.equal_fns.builtins_range(
+            api.Pair(index=(), actual=range(10**12), expected=range(1, 10**12))
+        )
+
+        assert isinstance(result, AssertionError)
+        assert repr(range(10**12)) in str(result)
+
+
 class TestStdlibObject:
     @pytest.mark.parametrize("value", [None, False, True, "abc"])
     def test_equal(self, value):
@@ -334,11 +961,13 @@ class TestPydanticModel:
         simple_object = SimpleObject(foo="foo", bar=[0, 1, 2])
         nested_object = NestedObject(simple_object=simple_object, baz=True)
 
-        pairs = builtin.unpack_fns.dataclasses_dataclass(
-            api.Pair(
-                index=index,
-                actual=deepcopy(nested_object),
-                expected=deepcopy(nested_object),
+        pairs = list(
+            builtin.unpack_fns.dataclasses_dataclass(
+                api.Pair(
+                    index=index,
+                    actual=deepcopy(nested_object),
+                    expected=deepcopy(nested_object),
+                )
             )
         )
 
@@ -351,3 +980,126 @@ class TestPydanticModel:
         pair = pairs[1]
         assert pair.index == (*index, "baz")
         assert pair.actual == pair.expected == True  # noqa: E712
+
+
+class TestIoTextFile:
+    @pytest.mark.parametrize(
+        ("actual", "expected"),
+        [
+            ("foo", "foo"),
+            (pathlib.Path("foo"), "foo"),
+            (pathlib.Path("foo.csv"), pathlib.Path("foo.csv")),
+            (pathlib.Path("foo.txt"), pathlib.Path("foo.json")),
+            (io.StringIO("foo"), io.BytesIO(b"foo")),
+        ],
+    )
+    def test_not_supported(self, actual, expected):
+        assert (
+            builtin.unpack_fns.io_text_file(
+                api.Pair(index=(), actual=actual, expected=expected)
+            )
+            is None
+        )
+
+    def test_paths(self, tmp_path):
+        actual = tmp_path / "actual.txt"
+        actual.write_bytes(b"foo\nbar\r\nbaz")
+        expected = tmp_path / "expected.txt"
+        expected.write_bytes(b"foo\nbar\nbaz\n")
+
+        pairs = list(
+            builtin.unpack_fns.io_text_file(
+                api.Pair(index=("file",), actual=actual, expected=expected),
+                encoding="utf-8",
+            )
+        )
+
+        assert [(p.index, p.actual, p.expected) for p in pairs] == [
+            (("file", 1), "foo\n", "foo\n"),
+            (("file", 2), "bar\r\n", "bar\n"),
+            (("file", 3), "baz", "baz\n"),
+        ]
+
+    @pytest.mark.parametrize("adaptive", [False, True])
+    def test_adaptive(self, tmp_path, adaptive):
+        actual, expected = [], []
+        for name, paths in [("actual", actual), ("expected", expected)]:
+            for suffix in [".csv", ".txt"]:
+                path = tmp_path / f"{name}{suffix}"
+                path.write_text("foo\n")
+                paths.append(path)
+
+        errors = api.compare(
+            actual,
+            expected,
+            unpack_fns=[
+                builtin.unpack_fns.io_text_file,
+                builtin.unpack_fns.csv_file,
+                *compyre.default_unpack_fns(),
+            ],
+            equal_fns=compyre.default_equal_fns(),
+            adaptive=adaptive,
+        )
+
+        # the text file is unpacked even after a path with another suffix was declined
+        assert not errors
+
+    def test_lazy(self, tmp_path):
+        actual = tmp_path / "actual.txt"
+        actual.write_text("foo\nbar\n")
+        expected = tmp_path / "expected.txt"
+        expected.write_text("foo\nbar\n")
+
+        items = builtin.unpack_fns.io_text_file(
+            api.Pair(index=(), actual=actual, expected=expected)
+        )
+        assert isinstance(items, Iterator)
+
+        pair = next(items)
+        assert pair.index == (1,)
+        items.close()
+
+    def test_file_objects(self):
+        actual = io.StringIO("foo\nbar\n")
+        expected = io.StringIO("foo\n")
+
+        items = list(
+            builtin.unpack_fns.io_text_file(
+                api.Pair(index=(), actual=actual, expected=expected)
+            )
+        )
+
+        assert len(items) == 2
+        assert items[0].index == (1,)
+        assert isinstance(items[1], ValueError)
+        assert "expected is exhausted after 1 item(s)" in str(items[1])
+        assert not actual.closed
+
+    def test_missing_file(self, tmp_path):
+        actual = tmp_path / "actual.txt"
+        actual.write_text("foo\n")
+
+        items = list(
+            builtin.unpack_fns.io_text_file(
+                api.Pair(index=(), actual=actual, expected=tmp_path / "missing.txt")
+            )
+        )
+
+        assert len(items) == 1
+        assert isinstance(items[0], FileNotFoundError)
+
+    def test_compare(self, tmp_path):
+        actual = tmp_path / "actual.log"
+        actual.write_text("".join(f"line {i}\n" for i in range(1_000)))
+        expected = tmp_path / "expected.log"
+        expected.write_text("".join(f"line {i % 100}\n" for i in range(1_000)))
+
+        errors = api.compare(
+            actual,
+            expected,
+            unpack_fns=[builtin.unpack_fns.io_text_file],
+            equal_fns=[builtin.equal_fns.builtins_str],
+            max_errors=2,
+        )
+
+        assert [e.pair.index for e in errors] == [(101,), (102,)]
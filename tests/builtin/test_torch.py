@@ -1,10 +1,14 @@
 import contextlib
+from collections import namedtuple
 
 import numpy as np
 import pytest
 import torch
 
 from compyre import alias, api, builtin
+from compyre.builtin import _torch
+
+Point = namedtuple("Point", ["x", "y"])
 
 
 class TestTorchTensor:
@@ -135,3 +139,47 @@ class TestTorchTensor:
                 equal_fns=[builtin.equal_fns.torch_tensor],
                 aliases={alias.NAN_EQUALITY: equal_nan},
             )
+
+
+class TestTorchPytree:
+    @pytest.mark.parametrize(
+        ("actual", "expected"),
+        [
+            (1, 1),
+            (torch.zeros(2), torch.zeros(2)),
+            ({"a": 1}, {"b": 1}),
+            ({"a": 1, "b": 2}, {"b": 2, "a": 1}),
+            ([1, 2], (1, 2)),
+        ],
+    )
+    def test_not_supported(self, actual, expected):
+        assert (
+            builtin.unpack_fns.torch_pytree(
+                api.Pair(index=(), actual=actual, expected=expected)
+            )
+            is None
+        )
+
+    def test_pairs(self):
+        index = ("index",)
+        actual = {"b": [1, (2, None)], "a": Point(3, torch.zeros(1))}
+        expected = {"b": [-1, (-2, None)], "a": Point(-3, torch.ones(1))}
+
+        pairs = list(
+            builtin.unpack_fns.torch_pytree(
+                api.Pair(index=index, actual=actual, expected=expected)
+            )
+        )
+
+        assert [p.index for p in pairs] == [
+            (*index, "b", 0),
+            (*index, "b", 1, 0),
+            (*index, "b", 1, 1),
+            (*index, "a", "x"),
+            (*index, "a", "y"),
+        ]
+        assert [p.actual for p in pairs][:2] == [1, 2]
+        assert [p.expected for p in pairs][:2] == [-1, -2]
+
+    def test_key_entry_fallback(self):
+        assert _torch._key_entry(object()).startswith("<object")
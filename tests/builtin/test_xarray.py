@@ -0,0 +1,219 @@
+import numpy as np
+import pytest
+import xarray as xr
+
+import compyre
+from compyre import alias, api, builtin
+
+
+def dataset():
+    return xr.Dataset(
+        {
+            "temperature": (("x", "y"), np.arange(6.0).reshape(2, 3), {"units": "K"}),
+            "label": ("x", ["a", "b"]),
+        },
+        coords={
+            "x": [10, 20],
+            "time": ("y", np.array(["2020-01-01", "2020-01-02", "NaT"], "M8[ns]")),
+        },
+        attrs={"title": "foo", "fill_value": np.nan, "valid_range": np.array([0, 1])},
+    )
+
+
+def unpack(actual, expected):
+    return builtin.unpack_fns.xarray_dataset(
+        api.Pair(index=(), actual=actual, expected=expected)
+    )
+
+
+def check(actual, expected, **kwargs):
+    return builtin.equal_fns.xarray_dataarray(
+        api.Pair(index=(), actual=actual, expected=expected), **kwargs
+    )
+
+
+class TestXarrayDataset:
+    def test_not_supported(self):
+        assert unpack(dataset(), {}) is None
+
+    def test_unpack(self):
+        actual, expected = dataset(), dataset()
+
+        pairs = unpack(actual, expected)
+
+        assert [p.index for p in pairs] == [
+            ("x",),
+            ("time",),
+            ("temperature",),
+            ("label",),
+        ]
+        assert all(isinstance(p.actual, xr.Variable) for p in pairs)
+
+    def test_lazy(self, tmp_path):
+        path = tmp_path / "data.nc"
+        dataset().to_netcdf(path, engine="scipy")
+
+        with (
+            xr.open_dataset(path, engine="scipy", chunks={}) as actual,
+            xr.open_dataset(path, engine="scipy", chunks={}) as expected,
+        ):
+            pairs = unpack(actual, expected)
+
+            # the data variables are not loaded
+            assert pairs[2].actual.chunks is not None
+            assert check(pairs[2].actual, pairs[2].expected) is True
+
+    def test_dimensions_mismatch(self):
+        result = unpack(dataset(), dataset().isel(y=slice(2)))
+
+        assert isinstance(result, ValueError)
+        assert "Xarray dimensions mismatch" in str(result)
+
+    @pytest.mark.parametrize(
+        ("expected", "kind"),
+        [
+            (dataset().drop_vars("time"), "coordinates"),
+            (dataset().rename_vars(label="name"), "data variables"),
+        ],
+    )
+    def test_names_mismatch(self, expected, kind):
+        result = unpack(dataset(), expected)
+
+        assert isinstance(result, ValueError)
+        assert f"Xarray {kind} mismatch" in str(result)
+
+    def test_attributes_mismatch(self):
+        expected = dataset()
+        expected.attrs["title"] = "bar"
+        expected.attrs["valid_range"] = np.array([0, 2])
+        del expected.attrs["fill_value"]
+
+        result = unpack(dataset(), expected)
+
+        assert isinstance(result, ValueError)
+        assert (
+            "Xarray attributes mismatch: 'fill_value', 'title', 'valid_range'"
+            in str(result)
+        )
+
+    def test_default(self):
+        actual = dataset()
+        expected = dataset()
+        expected["temperature"][1, 2] = -1.0
+
+        errors = api.compare(
+            actual,
+            expected,
+            unpack_fns=compyre.default_unpack_fns(),
+            equal_fns=compyre.default_equal_fns(),
+        )
+
+        assert [e.pair.index for e in errors] == [("temperature",)]
+        assert "5.0 (ACTUAL), -1.0 (DESIRED)" in str(errors[0].exception)
+
+
+class TestXarrayDataarray:
+    @pytest.mark.parametrize(
+        ("actual", "expected"),
+        [
+            (xr.DataArray([0.0]), np.zeros(1)),
+            (xr.DataArray([0.0]), xr.Variable("dim_0", [0.0])),
+        ],
+    )
+    def test_not_supported(self, actual, expected):
+        assert check(actual, expected) is None
+
+    @pytest.mark.parametrize("name", ["temperature", "label", "time"])
+    def test_equal(self, name):
+        assert check(dataset()[name], dataset()[name]) is True
+
+    @pytest.mark.parametrize("chunk", ["actual", "expected", "both"])
+    def test_dask(self, chunk):
+        actual, expected = dataset()["temperature"], dataset()["temperature"]
+        expected[1, 2] = -1.0
+        if chunk in {"actual", "both"}:
+            actual = actual.chunk(1)
+        if chunk in {"expected", "both"}:
+            expected = expected.chunk(1)
+
+        result = check(actual, expected)
+
+        assert isinstance(result, AssertionError)
+        assert "Dask arrays are not close" in str(result)
+        assert "Mismatch at index (1, 2): 5.0 != -1.0" in str(result)
+
+    def test_dimensions_mismatch(self):
+        result = check(xr.DataArray([0.0], dims="x"), xr.DataArray([0.0], dims="y"))
+
+        assert isinstance(result, AssertionError)
+        assert "Xarray dimensions mismatch: ('x',) != ('y',)" in str(result)
+
+    def test_shape_mismatch(self):
+        result = check(xr.Variable("x", [0.0]), xr.Variable("x", [0.0, 1.0]))
+
+        assert isinstance(result, AssertionError)
+        assert "Xarray shapes mismatch: (1,) != (2,)" in str(result)
+
+    def test_attributes_mismatch(self):
+        result = check(
+            xr.Variable("x", [0.0], {"units": "K"}),
+            xr.Variable("x", [0.0], {"units": "C"}),
+        )
+
+        assert isinstance(result, AssertionError)
+        assert "Xarray attributes mismatch: 'units'" in str(result)
+
+    def test_coordinates_mismatch(self):
+        actual = dataset()["temperature"]
+
+        result = check(actual, actual.drop_vars("time"))
+
+        assert isinstance(result, AssertionError)
+        assert "Xarray coordinates mismatch" in str(result)
+
+    def test_coordinate_values_mismatch(self):
+        actual = dataset()["temperature"]
+
+        result = check(actual, actual.assign_coords(x=[10, 21]))
+
+        assert isinstance(result, AssertionError)
+        assert str(result).startswith("Xarray coordinate 'x' mismatch:\n\nNot equal")
+
+    def test_not_equal(self):
+        result = check(xr.Variable("x", ["a", "b"]), xr.Variable("x", ["a", "c"]))
+
+        assert isinstance(result, AssertionError)
+        assert "Arrays are not equal" in str(result)
+        assert "Mismatch at index (1,): 'b' != 'c'" in str(result)
+
+    @pytest.mark.parametrize("chunk", [False, True])
+    def test_nat(self, chunk):
+        value = xr.Variable("x", np.array(["2020-01-01", "NaT"], "M8[ns]"))
+        if chunk:
+            value = value.chunk(1)
+
+        assert check(value, value) is True
+        assert isinstance(check(value, value, equal_nan=False), AssertionError)
+
+    def test_tolerances(self):
+        actual = xr.Variable("x", [1.0, 2.0])
+        expected = xr.Variable("x", [1.0, 2.001])
+
+        assert isinstance(check(actual, expected), AssertionError)
+        assert check(actual, expected, rtol=1e-2) is True
+        assert check(actual, expected, atol=1e-2) is True
+
+    def test_tolerance_aliases(self):
+        api.assert_equal(
+            xr.DataArray([1.0]),
+            xr.DataArray([1.001]),
+            unpack_fns=[],
+            equal_fns=[builtin.equal_fns.xarray_dataarray],
+            aliases={alias.RELATIVE_TOLERANCE: 1e-2},
+        )
+
+    def test_nan(self):
+        value = xr.Variable("x", [np.nan, 1.0])
+
+        assert check(value, value) is True
+        assert isinstance(check(value, value, equal_nan=False), AssertionError)
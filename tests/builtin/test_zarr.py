@@ -0,0 +1,207 @@
+import numpy as np
+import pytest
+import zarr
+
+import compyre
+from compyre import _budget, alias, api, builtin
+
+
+def array(data, **kwargs):
+    data = np.asarray(data)
+    kwargs.setdefault("chunks", data.shape)
+    a = zarr.create_array(store={}, shape=data.shape, dtype=data.dtype, **kwargs)
+    a[...] = data
+    return a
+
+
+def check(actual, expected, **kwargs):
+    result = builtin.unpack_fns.zarr_array(
+        api.Pair(index=(), actual=actual, expected=expected), **kwargs
+    )
+    return True if result == () else result
+
+
+class TestZarrGroup:
+    def test_not_supported(self):
+        assert (
+            builtin.unpack_fns.zarr_group(
+                api.Pair(index=(), actual=zarr.group(), expected={})
+            )
+            is None
+        )
+
+    def test_unpack(self):
+        actual, expected = zarr.group(), zarr.group()
+        for group in (actual, expected):
+            group.create_array("foo", data=np.arange(3))
+            group.create_group("bar").create_array("baz", data=np.ones(2))
+
+        pairs = list(
+            builtin.unpack_fns.zarr_group(
+                api.Pair(index=("root",), actual=actual, expected=expected)
+            )
+        )
+
+        assert [p.index for p in pairs] == [("root", "bar"), ("root", "foo")]
+        assert all(p.actual.path == p.expected.path for p in pairs)
+
+    def test_members_mismatch(self):
+        actual, expected = zarr.group(), zarr.group()
+        actual.create_array("foo", data=np.arange(3))
+        expected.create_group("bar")
+
+        result = builtin.unpack_fns.zarr_group(
+            api.Pair(index=(), actual=actual, expected=expected)
+        )
+
+        assert isinstance(result, ValueError)
+        assert "extra: 'foo'" in str(result)
+        assert "missing: 'bar'" in str(result)
+
+    def test_default(self):
+        actual, expected = zarr.group(), zarr.group()
+        for group, value in [(actual, 1.0), (expected, 1.5)]:
+            group.create_group("foo").create_array("bar", data=np.array([0.0, value]))
+
+        errors = compyre.api.compare(
+            actual,
+            expected,
+            unpack_fns=compyre.default_unpack_fns(),
+            equal_fns=compyre.default_equal_fns(),
+        )
+
+        assert [e.pair.index for e in errors] == [("foo", "bar")]
+        assert "Mismatch at index (1,): 1.0 != 1.5" in str(errors[0].exception)
+
+
+class TestZarrArray:
+    def test_not_supported(self):
+        assert check(array([0.0]), np.zeros(1)) is None
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"chunks": (4, 4)},
+            {"chunks": (2, 2), "shards": (4, 4)},
+            {"chunks": (4, 4), "zarr_format": 2},
+        ],
+        ids=["chunks", "shards", "v2"],
+    )
+    def test_equal(self, decoded, kwargs):
+        data = np.arange(100.0).reshape(10, 10)
+
+        assert check(array(data, **kwargs), array(data, **kwargs)) is True
+        assert not decoded
+
+    def test_unwritten_chunks(self, decoded):
+        actual, expected = (array(np.zeros(0), chunks=(4,)) for _ in range(2))
+        for a in (actual, expected):
+            a.resize((10,))
+
+        assert check(actual, expected) is True
+        assert not decoded
+
+    @pytest.mark.parametrize("shape", [(), (0,)])
+    def test_empty(self, shape):
+        assert check(array(np.zeros(shape)), array(np.zeros(shape))) is True
+
+    def test_encoding_mismatch(self, decoded):
+        data = np.arange(10.0)
+
+        assert (
+            check(
+                array(data, chunks=(4,)),
+                array(data, chunks=(3,), compressors=None),
+            )
+            is True
+        )
+        assert decoded == [(4,), (4,), (2,)]
+
+    def test_shape_mismatch(self):
+        result = check(array(np.zeros((2, 3))), array(np.zeros((3, 2))))
+
+        assert isinstance(result, AssertionError)
+        assert "Zarr array shapes mismatch: (2, 3) != (3, 2)" in str(result)
+
+    def test_mismatches(self, decoded):
+        actual = np.arange(100.0).reshape(10, 10)
+        expected = actual.copy()
+        expected[7, 3] = -1.0
+        expected[9, 9] = np.nan
+
+        result = check(array(actual, chunks=(4, 4)), array(expected, chunks=(4, 4)))
+
+        assert isinstance(result, AssertionError)
+        msg = str(result)
+        assert "Zarr arrays are not close" in msg
+        assert "Mismatched elements: 2 / 100" in msg
+        assert "Mismatched chunks: 2 / 9" in msg
+        assert "Max absolute difference among violations: 74.0" in msg
+        assert "Mismatch at index (7, 3): 73.0 != -1.0" in msg
+        # only the chunks with differing raw bytes are decoded
+        assert decoded == [(4, 4), (2, 2)]
+
+    def test_not_equal(self):
+        actual, expected = (
+            array(np.array(value, dtype=np.dtypes.StringDType()))
+            for value in (["a", "b", "c"], ["a", "b", "d"])
+        )
+
+        result = check(actual, expected)
+
+        assert isinstance(result, AssertionError)
+        msg = str(result)
+        assert "Zarr arrays are not equal" in msg
+        assert "Max absolute difference" not in msg
+        assert "Mismatch at index (2,): 'c' != 'd'" in msg
+
+    def test_tolerances(self):
+        actual = array([1.0, 2.0], chunks=(1,))
+        expected = array([1.0, 2.001], chunks=(1,))
+
+        assert isinstance(check(actual, expected), AssertionError)
+        assert check(actual, expected, rtol=1e-2) is True
+        assert check(actual, expected, atol=1e-2) is True
+
+    def test_tolerance_aliases(self):
+        api.assert_equal(
+            array([1.0]),
+            array([1.001]),
+            unpack_fns=[builtin.unpack_fns.zarr_array],
+            equal_fns=[],
+            aliases={alias.RELATIVE_TOLERANCE: 1e-2},
+        )
+
+    def test_nan(self):
+        value = [np.nan, 1.0]
+
+        assert check(array(value), array(value, compressors=None)) is True
+        assert isinstance(
+            check(array(value), array(value, compressors=None), equal_nan=False),
+            AssertionError,
+        )
+
+    def test_nan_same_encoding(self, decoded):
+        value = [1.0, np.nan, 3.0]
+
+        assert check(array(value), array(value)) is True
+        assert not decoded
+        assert isinstance(
+            check(array(value), array(value), equal_nan=False), AssertionError
+        )
+        # identical raw bytes are no proof of equality if NaN values are not equal
+        assert decoded == [(3,)]
+
+    def test_workers(self):
+        data = np.arange(10)
+
+        assert check(array(data, chunks=(1,)), array(data), workers=1) is True
+
+    def test_budget_exceeded(self):
+        budget = _budget.Budget(timeout=60, max_memory=None)
+        budget.reason = "sentinel"
+
+        with _budget.activate(budget):
+            result = check(array(np.zeros(2)), array(np.zeros(2)))
+
+        assert isinstance(result, api.BudgetExceededError)
@@ -1,10 +1,15 @@
+import asyncio
 import inspect
+import time
+from collections import OrderedDict
 from copy import deepcopy
 from typing import Annotated, Any
 
+import numpy as np
 import pytest
 
-from compyre import alias, api, builtin
+from compyre import _budget, alias, api, builtin, utils
+from compyre.cache import CompareCache
 
 
 class TestParametrizeFns:
@@ -272,6 +277,62 @@ class TestCompare:
         assert not errors
         assert actual == expected
 
+    def test_unpack_lazy(self):
+        events = []
+
+        def unpack_fn(pair, /):
+            if not isinstance(pair.actual, list):
+                return None
+
+            def pairs():
+                for i, (a, e) in enumerate(zip(pair.actual, pair.expected)):
+                    events.append(("unpack", (*pair.index, i)))
+                    yield api.Pair(index=(*pair.index, i), actual=a, expected=e)
+
+            return pairs()
+
+        def equal_fn(pair, /):
+            events.append(("equal", pair.index))
+            return True
+
+        errors = api.compare(
+            [0, [1]], [0, [1]], unpack_fns=[unpack_fn], equal_fns=[equal_fn]
+        )
+
+        assert not errors
+        assert events == [
+            ("unpack", (0,)),
+            ("equal", (0,)),
+            ("unpack", (1,)),
+            ("unpack", (1, 0)),
+            ("equal", (1, 0)),
+        ]
+
+    def test_unpack_yielded_exception(self):
+        exc = Exception()
+
+        def unpack_fn(pair, /):
+            if pair.index:
+                return None
+
+            def items():
+                yield api.Pair(index=(0,), actual=None, expected=None)
+                yield exc
+
+            return items()
+
+        errors = api.compare(
+            None,
+            None,
+            unpack_fns=[unpack_fn],
+            equal_fns=[builtin.equal_fns.builtins_object],
+        )
+
+        assert len(errors) == 1
+        error = errors[0]
+        assert error.pair.index == ()
+        assert error.exception is exc
+
     def test_unhandled(self):
         class Value:
             def __repr__(self):
@@ -319,6 +380,450 @@ class TestCompare:
         assert repr(actual) in str(error.exception)
         assert repr(expected) in str(error.exception)
 
+    @pytest.mark.parametrize("adaptive", [True, False])
+    def test_adaptive_bypass(self, adaptive):
+        calls = []
+
+        def declining_equal_fn(pair, /):
+            calls.append(pair.index)
+            return None
+
+        errors = api.compare(
+            [1, 2, 3],
+            [1, 2, 3],
+            unpack_fns=[builtin.unpack_fns.collections_sequence],
+            equal_fns=[declining_equal_fn, builtin.equal_fns.builtins_number],
+            adaptive=adaptive,
+        )
+
+        assert not errors
+        assert calls == ([(0,)] if adaptive else [(0,), (1,), (2,)])
+
+    @pytest.mark.parametrize("types", [(), (int,), (str,)])
+    def test_adaptive_value_dependent(self, types):
+        calls = []
+
+        @utils.value_dependent(*types)
+        def odd_equal_fn(pair, /):
+            calls.append(pair.index)
+            return True if pair.actual % 2 else None
+
+        errors = api.compare(
+            [1, 2, 3],
+            [1, 2, 3],
+            unpack_fns=[builtin.unpack_fns.collections_sequence],
+            equal_fns=[odd_equal_fn, builtin.equal_fns.builtins_number],
+            adaptive=True,
+        )
+
+        assert not errors
+        # the function is only bypassed for types it does not depend on the values of
+        assert calls == ([(0,), (1,)] if types == (str,) else [(0,), (1,), (2,)])
+
+    def test_adaptive_precedence(self):
+        unpack_fns = [
+            builtin.unpack_fns.collections_ordered_dict,
+            builtin.unpack_fns.collections_mapping,
+            builtin.unpack_fns.collections_sequence,
+        ]
+        actual = [{"foo": 0}, OrderedDict([("bar", 1), ("baz", 2)])]
+        expected = [{"foo": 0}, OrderedDict([("baz", 2), ("bar", 1)])]
+
+        errors = api.compare(
+            actual,
+            expected,
+            unpack_fns=unpack_fns,
+            equal_fns=[builtin.equal_fns.builtins_number],
+            adaptive=True,
+        )
+
+        assert len(errors) == 1
+        error = errors[0]
+        assert error.pair.index == (1,)
+        assert "ordered keys mismatch" in str(error.exception)
+
+    def test_awaitable_unpack_result(self):
+        async def unpack_fn(pair, /):  # pragma: no cover
+            return []
+
+        errors = api.compare(
+            None,
+            None,
+            unpack_fns=[unpack_fn],
+            equal_fns=[builtin.equal_fns.builtins_object],
+        )
+
+        assert len(errors) == 1
+        assert isinstance(errors[0].exception, api.CompyreError)
+        assert "acompare" in str(errors[0].exception)
+
+    def test_awaitable_equal_result(self):
+        async def equal_fn(pair, /):  # pragma: no cover
+            return True
+
+        errors = api.compare(None, None, unpack_fns=[], equal_fns=[equal_fn])
+
+        assert len(errors) == 1
+        assert isinstance(errors[0].exception, api.CompyreError)
+        assert "acompare" in str(errors[0].exception)
+
+    def test_cost_order(self):
+        compared = []
+
+        def equal_fn(pair, /):
+            compared.append(pair.index)
+            return pair.actual == pair.expected
+
+        actual = ["a" * 10, ["b", "c" * 5], "d"]
+        expected = ["a" * 10, ["x", "c" * 5], "y"]
+
+        errors = api.compare(
+            actual,
+            expected,
+            unpack_fns=[builtin.unpack_fns.collections_sequence],
+            equal_fns=[equal_fn],
+            cost=api.estimate_cost,
+        )
+
+        assert compared == [(2,), (1, 0), (1, 1), (0,)]
+        assert [e.pair.index for e in errors] == [(1, 0), (2,)]
+
+    def test_cost_yielded_exception(self):
+        exc = Exception()
+
+        def unpack_fn(pair, /):
+            if pair.index:
+                return None
+
+            def items():
+                yield api.Pair(index=(0,), actual=0, expected=1)
+                yield exc
+
+            return items()
+
+        errors = api.compare(
+            None,
+            None,
+            unpack_fns=[unpack_fn],
+            equal_fns=[builtin.equal_fns.builtins_object],
+            cost=api.estimate_cost,
+        )
+
+        assert [e.pair.index for e in errors] == [(0,), ()]
+        assert errors[1].exception is exc
+
+    @pytest.mark.parametrize("cost", [None, api.estimate_cost])
+    def test_max_errors(self, cost):
+        compared = []
+
+        def equal_fn(pair, /):
+            compared.append(pair.index)
+            return False
+
+        errors = api.compare(
+            [0, 1, 2],
+            [0, 1, 2],
+            unpack_fns=[builtin.unpack_fns.collections_sequence],
+            equal_fns=[equal_fn],
+            cost=cost,
+            max_errors=2,
+        )
+
+        assert [e.pair.index for e in errors] == [(0,), (1,)]
+        assert compared == [(0,), (1,)]
+
+    @pytest.mark.parametrize("name", ["max_errors", "timeout", "max_memory"])
+    def test_invalid_limit(self, name):
+        with pytest.raises(ValueError, match=f"{name} has to be positive"):
+            api.compare(None, None, unpack_fns=[], equal_fns=[], **{name: 0})
+
+    def test_cost_and_cache(self):
+        with pytest.raises(ValueError, match="cannot be used together"):
+            api.compare(
+                None,
+                None,
+                unpack_fns=[],
+                equal_fns=[],
+                cost=api.estimate_cost,
+                cache=CompareCache(),
+            )
+
+    @pytest.mark.parametrize("cost", [None, api.estimate_cost])
+    def test_timeout(self, cost):
+        compared = []
+
+        def equal_fn(pair, /):
+            compared.append(pair.index)
+            if pair.index == (1, 0):
+                time.sleep(0.1)
+            return True
+
+        errors = api.compare(
+            [0, [1, 2], 3],
+            [0, [1, 2], 3],
+            unpack_fns=[builtin.unpack_fns.collections_sequence],
+            equal_fns=[equal_fn],
+            cost=cost,
+            timeout=0.05,
+        )
+
+        assert (1, 0) in compared
+        assert (1, 1) not in compared
+        assert isinstance(errors[0].exception, api.BudgetExceededError)
+        assert "time limit of 0.05 seconds exceeded" in str(errors[0].exception)
+        if cost is None:
+            assert [e.pair.index for e in errors] == [(1,), ()]
+        else:
+            assert [e.pair.index for e in errors] == [(1, 1)]
+
+    def test_max_memory(self, monkeypatch):
+        memory = 0
+        monkeypatch.setattr(_budget, "_peak_memory", lambda: memory)
+        monkeypatch.setattr(_budget, "_MEMORY_CHECK_INTERVAL", 1)
+
+        def equal_fn(pair, /):
+            nonlocal memory
+            memory += 10
+            return True
+
+        errors = api.compare(
+            [0, 1, 2],
+            [0, 1, 2],
+            unpack_fns=[builtin.unpack_fns.collections_sequence],
+            equal_fns=[equal_fn],
+            max_memory=15,
+        )
+
+        assert len(errors) == 1
+        error = errors[0]
+        assert error.pair.index == ()
+        assert isinstance(error.exception, api.BudgetExceededError)
+        assert "memory limit of 15 bytes exceeded" in str(error.exception)
+
+    def test_budget_exceeded_in_equal_fn(self):
+        def equal_fn(pair, /):
+            time.sleep(0.1)
+            return utils.budget_exceeded() or True
+
+        cache = CompareCache()
+        errors = api.compare(
+            np.zeros(1),
+            np.zeros(1),
+            unpack_fns=[],
+            equal_fns=[equal_fn],
+            timeout=0.05,
+            cache=cache,
+        )
+
+        assert len(errors) == 1
+        assert isinstance(errors[0].exception, api.BudgetExceededError)
+        assert not cache
+
+
+@pytest.mark.parametrize(
+    ("actual", "expected", "cost"),
+    [
+        (None, 1, 1.0),
+        ([0, 1, 2], "ab", 3.0),
+        (np.zeros(4, dtype=np.float64), None, 32.0),
+    ],
+)
+def test_estimate_cost(actual, expected, cost):
+    assert (
+        api.estimate_cost(api.Pair(index=(), actual=actual, expected=expected)) == cost
+    )
+
+
+async def _aiterate(values):
+    for v in values:
+        await asyncio.sleep(0)
+        yield v
+
+
+class TestACompare:
+    def test_awaitable_values(self):
+        async def value(v):
+            await asyncio.sleep(0)
+            return v
+
+        errors = asyncio.run(
+            api.acompare(
+                {"foo": value(1), "bar": value([2, value(3)])},
+                {"foo": 1, "bar": value([2, 3])},
+                unpack_fns=[
+                    builtin.unpack_fns.collections_mapping,
+                    builtin.unpack_fns.collections_sequence,
+                ],
+                equal_fns=[builtin.equal_fns.builtins_number],
+            )
+        )
+
+        assert not errors
+
+    @pytest.mark.parametrize("adaptive", [True, False])
+    def test_async_fns(self, adaptive):
+        async def unpack_fn(pair, /):
+            await asyncio.sleep(0)
+            return builtin.unpack_fns.collections_sequence(pair)
+
+        async def declining_equal_fn(pair, /):
+            await asyncio.sleep(0)
+            return None
+
+        async def equal_fn(pair, /):
+            await asyncio.sleep(0)
+            return pair.actual == pair.expected
+
+        errors = asyncio.run(
+            api.acompare(
+                [0, 1, 2],
+                [0, -1, 2],
+                unpack_fns=[unpack_fn],
+                equal_fns=[declining_equal_fn, equal_fn],
+                adaptive=adaptive,
+            )
+        )
+
+        assert [e.pair.index for e in errors] == [(1,)]
+        assert isinstance(errors[0].exception, AssertionError)
+
+    @pytest.mark.parametrize("max_concurrency", [None, 1, 2])
+    def test_order(self, max_concurrency):
+        async def equal_fn(pair, /):
+            # finish the comparisons in reverse order
+            await asyncio.sleep(0.001 * (10 - pair.actual))
+            return False
+
+        errors = asyncio.run(
+            api.acompare(
+                _aiterate(range(5)),
+                _aiterate(range(5)),
+                unpack_fns=[builtin.unpack_fns.collections_async_iterable],
+                equal_fns=[equal_fn],
+                max_concurrency=max_concurrency,
+            )
+        )
+
+        assert [e.pair.index for e in errors] == [(i,) for i in range(5)]
+
+    def test_yielded_exception(self):
+        errors = asyncio.run(
+            api.acompare(
+                _aiterate([0, 1]),
+                _aiterate([0]),
+                unpack_fns=[builtin.unpack_fns.collections_async_iterable],
+                equal_fns=[builtin.equal_fns.builtins_number],
+            )
+        )
+
+        assert len(errors) == 1
+        error = errors[0]
+        assert error.pair.index == ()
+        assert isinstance(error.exception, ValueError)
+
+    def test_max_concurrency(self):
+        active = 0
+        max_active = 0
+
+        async def equal_fn(pair, /):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.001)
+            active -= 1
+            return True
+
+        errors = asyncio.run(
+            api.acompare(
+                list(range(10)),
+                list(range(10)),
+                unpack_fns=[builtin.unpack_fns.collections_sequence],
+                equal_fns=[equal_fn],
+                max_concurrency=3,
+            )
+        )
+
+        assert not errors
+        assert max_active == 3
+
+    def test_invalid_max_concurrency(self):
+        with pytest.raises(ValueError, match="max_concurrency"):
+            asyncio.run(
+                api.acompare(None, None, unpack_fns=[], equal_fns=[], max_concurrency=0)
+            )
+
+    def test_unpack_fn_exception(self):
+        exc = Exception()
+
+        def unpack_fn(pair, /):
+            return exc
+
+        errors = asyncio.run(
+            api.acompare(None, None, unpack_fns=[unpack_fn], equal_fns=[])
+        )
+
+        assert len(errors) == 1
+        assert errors[0].exception is exc
+
+    def test_raised_exception(self):
+        exc = Exception("sentinel")
+
+        async def equal_fn(pair, /):
+            if pair.actual == 0:
+                raise exc
+
+            await asyncio.sleep(0.01)
+            return True  # pragma: no cover
+
+        with pytest.raises(Exception, match="sentinel"):
+            asyncio.run(
+                api.acompare(
+                    [1, 0, 2],
+                    [1, 0, 2],
+                    unpack_fns=[builtin.unpack_fns.collections_sequence],
+                    equal_fns=[equal_fn],
+                )
+            )
+
+
+@pytest.mark.parametrize("equal_fn_result", [True, False, None])
+def test_ais_equal(equal_fn_result):
+    async def equal_fn(pair, /):
+        return equal_fn_result
+
+    if equal_fn_result is None:
+        with pytest.raises(api.CompyreError):
+            asyncio.run(api.ais_equal(None, None, unpack_fns=[], equal_fns=[equal_fn]))
+    else:
+        assert (
+            asyncio.run(api.ais_equal(None, None, unpack_fns=[], equal_fns=[equal_fn]))
+            is equal_fn_result
+        )
+
+
+def test_aassert_equal():
+    async def equal_fn(pair, /):
+        return pair.actual == pair.expected
+
+    asyncio.run(
+        api.aassert_equal(
+            _aiterate([0, 1]),
+            _aiterate([0, 1]),
+            unpack_fns=[builtin.unpack_fns.collections_async_iterable],
+            equal_fns=[equal_fn],
+        )
+    )
+
+    with pytest.raises(AssertionError, match="1 error"):
+        asyncio.run(
+            api.aassert_equal(
+                _aiterate([0, 1]),
+                _aiterate([0, -1]),
+                unpack_fns=[builtin.unpack_fns.collections_async_iterable],
+                equal_fns=[equal_fn],
+            )
+        )
+
 
 @pytest.mark.parametrize("equal_fn_result", [True, False, None])
 def test_is_equal(equal_fn_result):
@@ -1,6 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
-from compyre._availability import available_if, is_available
+from compyre._availability import _Requirement, available_if, is_available
 
 
 def regular_fn():
@@ -42,3 +44,15 @@ def test_if_available_wrapper(fn, available):
 @pytest.mark.parametrize(("fn", "available"), FNS_AND_AVAILABILITY)
 def test_is_available(fn, available):
     assert is_available(fn) is available
+
+
+def test_requirement_threads(monkeypatch):
+    requirement = _Requirement("compyre")
+    calls = []
+    check = requirement._check
+    monkeypatch.setattr(requirement, "_check", lambda: calls.append(None) or check())
+
+    with ThreadPoolExecutor(8) as executor:
+        assert all(executor.map(lambda _: requirement.is_available, range(32)))
+
+    assert len(calls) == 1
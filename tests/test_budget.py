@@ -0,0 +1,51 @@
+import pytest
+
+from compyre import _budget
+
+
+def test_no_limits():
+    budget = _budget.Budget(timeout=None, max_memory=None)
+
+    assert not budget.exceeded()
+    assert budget.reason is None
+
+
+def test_timeout():
+    budget = _budget.Budget(timeout=1e-3, max_memory=None)
+    budget._deadline -= 1
+
+    assert budget.exceeded()
+    assert "time limit" in budget.reason
+
+
+def test_max_memory(monkeypatch):
+    memory = 100
+    monkeypatch.setattr(_budget, "_peak_memory", lambda: memory)
+    monkeypatch.setattr(_budget, "_MEMORY_CHECK_INTERVAL", 2)
+    budget = _budget.Budget(timeout=None, max_memory=10)
+
+    memory = 200
+    assert not budget.exceeded()
+    assert budget.exceeded()
+    assert "memory limit" in budget.reason
+
+
+def test_peak_memory():
+    assert _budget._peak_memory() > 0
+
+
+def test_activate():
+    budget = _budget.Budget(timeout=None, max_memory=None)
+
+    assert _budget.current() is None
+    with _budget.activate(budget):
+        assert _budget.current() is budget
+    assert _budget.current() is None
+
+
+@pytest.mark.parametrize("reason", [None, "sentinel"])
+def test_exceeded_is_sticky(reason):
+    budget = _budget.Budget(timeout=None, max_memory=None)
+    budget.reason = reason
+
+    assert budget.exceeded() is (reason is not None)
@@ -0,0 +1,256 @@
+import weakref
+
+import numpy as np
+import pytest
+
+from compyre import api, builtin
+from compyre.cache import CompareCache
+
+
+class CountingEqualFn:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, pair, /):
+        self.calls.append(pair.index)
+        if isinstance(pair.actual, np.ndarray):
+            return bool((pair.actual == pair.expected).all())
+        return pair.actual == pair.expected
+
+
+UNPACK_FNS = [
+    builtin.unpack_fns.collections_mapping,
+    builtin.unpack_fns.collections_sequence,
+]
+
+
+def make_value():
+    return {
+        "config": {"lr": 0.1, "name": "foo"},
+        "weights": [np.zeros(3), np.ones(3)],
+    }
+
+
+def test_unchanged():
+    cache = CompareCache()
+
+    equal_fn = CountingEqualFn()
+    errors = api.compare(
+        make_value(),
+        make_value(),
+        unpack_fns=UNPACK_FNS,
+        equal_fns=[equal_fn],
+        cache=cache,
+    )
+    assert not errors
+    assert len(equal_fn.calls) == 4
+
+    equal_fn.calls.clear()
+    errors = api.compare(
+        make_value(),
+        make_value(),
+        unpack_fns=UNPACK_FNS,
+        equal_fns=[equal_fn],
+        cache=cache,
+    )
+    assert not errors
+    assert not equal_fn.calls
+    assert cache.cache_info().hits == 1
+
+
+def test_changed():
+    cache = CompareCache()
+    expected = make_value()
+
+    equal_fn = CountingEqualFn()
+    actual = make_value()
+    actual["config"]["lr"] = 0.2
+    errors = api.compare(
+        actual, expected, unpack_fns=UNPACK_FNS, equal_fns=[equal_fn], cache=cache
+    )
+    assert [e.pair.index for e in errors] == [("config", "lr")]
+
+    equal_fn.calls.clear()
+    actual = make_value()
+    actual["config"]["lr"] = 0.2
+    actual["weights"][1][0] = 2.0
+    errors = api.compare(
+        actual, expected, unpack_fns=UNPACK_FNS, equal_fns=[equal_fn], cache=cache
+    )
+    assert [e.pair.index for e in errors] == [("config", "lr"), ("weights", 1)]
+    assert equal_fn.calls == [("weights", 1)]
+
+
+def test_config_changed():
+    cache = CompareCache()
+
+    equal_fn = CountingEqualFn()
+    api.compare(
+        make_value(),
+        make_value(),
+        unpack_fns=UNPACK_FNS,
+        equal_fns=[equal_fn],
+        cache=cache,
+    )
+    assert len(cache) > 0
+
+    other_equal_fn = CountingEqualFn()
+    api.compare(
+        make_value(),
+        make_value(),
+        unpack_fns=UNPACK_FNS,
+        equal_fns=[other_equal_fn],
+        cache=cache,
+    )
+    assert len(other_equal_fn.calls) == 4
+
+
+def test_unsupported():
+    cache = CompareCache()
+    value = [object()]
+
+    for _ in range(2):
+        api.compare(
+            value,
+            value,
+            unpack_fns=UNPACK_FNS,
+            equal_fns=[builtin.equal_fns.builtins_object],
+            cache=cache,
+        )
+
+    assert len(cache) == 0
+
+
+def test_maxsize():
+    cache = CompareCache(maxsize=2)
+
+    api.compare(
+        [[0], [1], [2]],
+        [[0], [1], [2]],
+        unpack_fns=UNPACK_FNS,
+        equal_fns=[builtin.equal_fns.builtins_number],
+        cache=cache,
+    )
+
+    assert len(cache) == 2
+
+
+def test_invalid_maxsize():
+    with pytest.raises(ValueError, match="maxsize"):
+        CompareCache(maxsize=0)
+
+
+def test_clear():
+    cache = CompareCache()
+    api.compare(
+        make_value(),
+        make_value(),
+        unpack_fns=UNPACK_FNS,
+        equal_fns=[CountingEqualFn()],
+        cache=cache,
+    )
+    assert len(cache) > 0
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.cache_info() == (0, 0, cache.maxsize, 0)
+
+
+def test_array_config():
+    cache = CompareCache()
+
+    def equal_fn(pair, /, *, array):
+        return bool((pair.actual == pair.expected).all())
+
+    for array in [np.zeros(2), np.zeros(2), np.ones(2)]:
+        api.compare(
+            np.zeros(2),
+            np.zeros(2),
+            unpack_fns=[],
+            equal_fns=[equal_fn],
+            cache=cache,
+            array=array,
+        )
+
+    # arrays are compared by their digest rather than with ==, which would be ambiguous
+    assert cache.cache_info()[:2] == (1, 2)
+
+
+def test_cached_errors():
+    cache = CompareCache()
+    equal_fn = CountingEqualFn()
+
+    def compare(value):
+        actual = make_value()
+        actual["config"]["lr"] = value
+        actual["weights"][1][0] = 2.0
+        return api.compare(
+            actual,
+            make_value(),
+            unpack_fns=UNPACK_FNS,
+            equal_fns=[equal_fn],
+            cache=cache,
+        )
+
+    errors = compare(0.2)
+    first = weakref.ref(errors[1].pair.actual)
+    del errors
+
+    errors = compare(0.3)
+
+    # only the weights are unchanged
+    assert cache.cache_info().hits == 1
+    # the values of the previous comparison are not kept alive by the cache
+    assert first() is None
+    assert [e.pair.index for e in errors] == [("config", "lr"), ("weights", 1)]
+    assert errors[0].pair.actual == 0.3
+    # the values of cached errors are looked up in the current inputs
+    assert errors[1].pair.actual[0] == 2.0
+
+
+def test_cached_errors_unresolvable_index():
+    cache = CompareCache()
+
+    def unpack_fn(pair, /):
+        if not isinstance(pair.actual, tuple):
+            return None
+        return [
+            api.Pair(index=(*pair.index, f"item{i}"), actual=a, expected=e)
+            for i, (a, e) in enumerate(zip(pair.actual, pair.expected))
+        ]
+
+    for _ in range(2):
+        errors = api.compare(
+            [(1, 2)],
+            [(1, 3)],
+            unpack_fns=[unpack_fn, UNPACK_FNS[1]],
+            equal_fns=[builtin.equal_fns.builtins_number],
+            cache=cache,
+        )
+
+    assert cache.cache_info().hits == 1
+    assert [e.pair.index for e in errors] == [(0, "item1")]
+    # the index cannot be resolved in the current inputs and thus the closest values are used
+    assert errors[0].pair.actual == (1, 2)
+
+
+def test_incomparable_config():
+    cache = CompareCache()
+    value = object()
+
+    def equal_fn(pair, /, *, values):
+        return pair.actual == pair.expected
+
+    for _ in range(2):
+        api.compare(
+            [1, 2],
+            [1, 2],
+            unpack_fns=UNPACK_FNS,
+            equal_fns=[equal_fn],
+            cache=cache,
+            # no digest can be computed and comparing the arrays with == is ambiguous
+            values=[value, np.zeros(2)],
+        )
+
+    assert cache.cache_info().hits == 0
@@ -1,20 +1,42 @@
+import asyncio
 import dataclasses
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 
 import numpy as np
 import pandas as pd
+import polars as pl
+import pyarrow as pa
 import pydantic
 import pytest
+import scipy.sparse
 import torch
+import xarray as xr
+import zarr
 
 import compyre
 
+# builtin fns that are not included in the defaults and have to be passed explicitly
+OPT_IN_UNPACK_FNS = {
+    compyre.builtin.unpack_fns.collections_records,
+    compyre.builtin.unpack_fns.csv_file,
+    compyre.builtin.unpack_fns.io_text_file,
+    compyre.builtin.unpack_fns.json_file,
+    compyre.builtin.unpack_fns.optree_pytree,
+    compyre.builtin.unpack_fns.pathlib_path,
+    compyre.builtin.unpack_fns.torch_pytree,
+}
+
 
 def test_default_unpack_fns():
-    assert set(compyre.default_unpack_fns()) == {
-        getattr(compyre.builtin.unpack_fns, n)
-        for n in compyre.builtin.unpack_fns.__all__
-    }
+    assert (
+        set(compyre.default_unpack_fns())
+        == {
+            getattr(compyre.builtin.unpack_fns, n)
+            for n in compyre.builtin.unpack_fns.__all__
+        }
+        - OPT_IN_UNPACK_FNS
+    )
 
 
 def test_default_equal_fns():
@@ -23,6 +45,37 @@ def test_default_equal_fns():
     }
 
 
+@pytest.mark.parametrize(
+    ("name", "fn"),
+    [
+        ("_DEFAULT_UNPACK_FNS", compyre.default_unpack_fns),
+        ("_DEFAULT_EQUAL_FNS", compyre.default_equal_fns),
+    ],
+)
+def test_default_fns_threads(monkeypatch, name, fn):
+    monkeypatch.setattr(compyre._default, name, None)
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(lambda _: fn(), range(32)))
+
+    assert all(r == results[0] for r in results)
+
+
+def test_threads():
+    values = [
+        {"array": np.full(8, i), "nested": [i, str(i), {"value": float(i)}]}
+        for i in range(64)
+    ]
+
+    def check(i):
+        return compyre.is_equal(deepcopy(values[i]), deepcopy(values[i])) and (
+            not compyre.is_equal(values[i], values[(i + 1) % len(values)])
+        )
+
+    with ThreadPoolExecutor(8) as executor:
+        assert all(executor.map(check, range(len(values))))
+
+
 @dataclasses.dataclass
 class SimpleObject:
     foo: str
@@ -45,6 +98,13 @@ class NestedModel(pydantic.BaseModel):
     baz: bool
 
 
+def zarr_group():
+    group = zarr.group()
+    group.create_array("foo", data=np.array([0.0, 1.0, np.pi]))
+    group.create_group("bar").create_array("baz", data=np.arange(3), chunks=(2,))
+    return group
+
+
 @pytest.fixture
 def value():
     return {
@@ -72,6 +132,17 @@ def value():
         ],
         "torch": [torch.tensor([-1, 314])],
         "pandas": [pd.Series([0.0, 1.0, np.pi]), pd.DataFrame([-1, 314])],
+        "polars": [pl.DataFrame({"foo": [1.0, 2.0], "bar": ["baz", None]})],
+        "pyarrow": [pa.table({"foo": [1.0, 2.0], "bar": ["baz", None]})],
+        "scipy": [scipy.sparse.eye(3, format="csr")],
+        "xarray": [
+            xr.Dataset(
+                {"foo": (("x", "y"), np.ones((2, 3)), {"units": "m"})},
+                coords={"x": [10, 20], "y": ["a", "b", "c"]},
+                attrs={"title": "foo"},
+            )
+        ],
+        "zarr": [zarr_group()],
     }
 
 
@@ -81,3 +152,22 @@ def test_is_equal(value):
 
 def test_assert_equal(value):
     compyre.assert_equal(deepcopy(value), deepcopy(value))
+
+
+def test_assert_equal_generators():
+    def values(n):
+        for i in range(n):
+            yield {"value": float(i)}
+
+    compyre.assert_equal(values(3), values(3))
+
+    with pytest.raises(AssertionError, match="iterator length mismatch"):
+        compyre.assert_equal(values(3), values(2))
+
+
+def test_ais_equal(value):
+    assert asyncio.run(compyre.ais_equal(deepcopy(value), deepcopy(value)))
+
+
+def test_aassert_equal(value):
+    asyncio.run(compyre.aassert_equal(deepcopy(value), deepcopy(value)))
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+import torch
+
+from compyre._digest import digest
+
+
+@pytest.mark.parametrize(
+    ("value", "other"),
+    [
+        (1, 1.0),
+        (1, True),
+        ("1", b"1"),
+        ([1, 2], (1, 2)),
+        ({"a": 1}, {"a": 2}),
+        (np.zeros(2), np.zeros(2, dtype=np.float32)),
+        (np.zeros(2), np.zeros((1, 2))),
+        (torch.zeros(2), torch.ones(2)),
+    ],
+)
+def test_distinct(value, other):
+    assert digest(value) != digest(other)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        3.14,
+        {"a": [1, (2.0, "3")]},
+        np.arange(6).reshape(2, 3)[:, ::2],
+        torch.arange(3),
+    ],
+)
+def test_equal(value):
+    assert digest(value) == digest(value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        object(),
+        [object()],
+        {"a": object()},
+        np.array([object()]),
+        torch.zeros(2, dtype=torch.bfloat16),
+    ],
+)
+def test_unsupported(value):
+    assert digest(value) is None
+
+
+def test_memo():
+    value = [np.zeros(2)]
+    memo = {}
+
+    d = digest(value, memo)
+
+    assert id(value) in memo
+    assert digest(value, memo) == d
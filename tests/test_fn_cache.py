@@ -0,0 +1,169 @@
+import functools
+import gc
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated, Any
+
+import pytest
+
+from compyre._fn_cache import FnCache
+
+
+def make_cache(maxsize=8):
+    calls = []
+
+    def compute(fn):
+        calls.append(fn)
+        return object()
+
+    return FnCache(compute, maxsize=maxsize), calls
+
+
+def make_closure(value):
+    def fn(pair, /, *, param=value):  # pragma: no cover
+        return value
+
+    return fn
+
+
+def test_closures_share_entry():
+    cache, calls = make_cache()
+
+    result = cache(make_closure(0))
+
+    assert cache(make_closure(1)) is result
+    # the values of the defaults do not need to be hashable
+    assert cache(make_closure([])) is result
+    assert len(calls) == 1
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
+
+
+@pytest.mark.parametrize("attr", ["__defaults__", "__kwdefaults__"])
+def test_defaults(attr):
+    cache, calls = make_cache()
+
+    def make():
+        def fn(pair, /, foo=None, *, bar=None):  # pragma: no cover
+            pass
+
+        return fn
+
+    fn = make()
+    setattr(fn, attr, None)
+
+    assert cache(fn) is not cache(make())
+    assert len(calls) == 2
+
+
+def test_annotations():
+    cache, _ = make_cache()
+
+    def fn(pair, /, *, param: Annotated[Any, object()]):  # pragma: no cover
+        pass
+
+    def other(pair, /, *, param: Annotated[Any, object()]):  # pragma: no cover
+        pass
+
+    other.__code__ = fn.__code__
+
+    assert cache(fn) is not cache(other)
+
+
+def test_unhashable_annotations():
+    cache, calls = make_cache()
+
+    def fn(pair, /, *, param: Annotated[Any, {}]):  # pragma: no cover
+        pass
+
+    cache(fn)
+    cache(fn)
+
+    assert len(calls) == 1
+
+
+def test_weak_key():
+    cache, calls = make_cache()
+
+    partial = functools.partial(make_closure(0), param=1)
+    ref = weakref.ref(partial)
+
+    cache(partial)
+    cache(partial)
+    assert len(calls) == 1
+
+    del calls[:], partial
+    gc.collect()
+
+    assert ref() is None
+    assert not cache.cache_info().currsize
+
+
+def test_stale_entry():
+    cache, calls = make_cache()
+
+    def fn(pair, /):  # pragma: no cover
+        pass
+
+    wrapper = functools.wraps(fn)(lambda pair: None)
+    cache(wrapper)
+    # simulate a garbage collected callable with the same id, whose callback has not been run yet
+    cache._refs[id(wrapper)] = weakref.ref(fn)
+
+    cache(wrapper)
+
+    assert len(calls) == 2
+    assert cache.cache_info().currsize == 1
+
+
+def test_not_weakrefable():
+    class Callable:
+        __slots__ = ()
+
+        def __call__(self, pair, /):  # pragma: no cover
+            pass
+
+    cache, calls = make_cache()
+    fn = Callable()
+
+    cache(fn)
+    cache(fn)
+
+    assert len(calls) == 2
+    assert not cache.cache_info().currsize
+
+
+def test_maxsize():
+    cache, calls = make_cache(maxsize=2)
+    fns = [functools.partial(make_closure(i)) for i in range(3)]
+
+    for fn in fns:
+        cache(fn)
+    cache(fns[0])
+
+    assert len(calls) == 4
+    assert cache.cache_info().currsize == 2
+    assert len(cache._refs) == 2
+
+
+def test_cache_clear():
+    cache, _ = make_cache()
+    cache(functools.partial(make_closure(0)))
+
+    cache.cache_clear()
+
+    assert cache.cache_info() == (0, 0, 8, 0)
+    assert not cache._refs
+
+
+def test_threads():
+    cache, _ = make_cache(maxsize=4)
+    fns = [functools.partial(make_closure(i)) for i in range(16)]
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(cache, fns * 16))
+
+    assert len(results) == 256
+    info = cache.cache_info()
+    assert info.hits + info.misses == 256
+    assert info.currsize <= 4
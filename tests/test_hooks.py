@@ -0,0 +1,207 @@
+import numpy as np
+import pytest
+
+from compyre import api, builtin, hooks
+from compyre.cache import CompareCache
+
+
+class RecordingHooks(hooks.Hooks):
+    def __init__(self):
+        self.events = []
+
+    def on_pair(self, pair):
+        self.events.append(("pair", pair.index))
+
+    def on_enter(self, pair):
+        self.events.append(("enter", pair.index))
+
+    def on_exit(self, pair):
+        self.events.append(("exit", pair.index))
+
+    def on_compared(self, pair, nbytes):
+        self.events.append(("compared", pair.index, nbytes))
+
+    def on_error(self, error):
+        self.events.append(("error", error.pair.index))
+
+    def on_finish(self, errors):
+        self.events.append(("finish", len(errors)))
+
+
+UNPACK_FNS = [
+    builtin.unpack_fns.collections_mapping,
+    builtin.unpack_fns.collections_sequence,
+]
+EQUAL_FNS = [builtin.equal_fns.numpy_ndarray, builtin.equal_fns.builtins_object]
+
+
+def test_default_hooks():
+    errors = api.compare(
+        [0], [1], unpack_fns=UNPACK_FNS, equal_fns=EQUAL_FNS, hooks=hooks.Hooks()
+    )
+
+    assert len(errors) == 1
+
+
+def test_events():
+    h = RecordingHooks()
+
+    errors = api.compare(
+        {"a": np.zeros(2), "b": [0, 1]},
+        {"a": np.zeros(2), "b": [0, 2]},
+        unpack_fns=UNPACK_FNS,
+        equal_fns=EQUAL_FNS,
+        hooks=h,
+    )
+
+    assert len(errors) == 1
+    assert h.events == [
+        ("pair", ()),
+        ("enter", ()),
+        ("pair", ("a",)),
+        ("compared", ("a",), 16),
+        ("pair", ("b",)),
+        ("enter", ("b",)),
+        ("pair", ("b", 0)),
+        ("compared", ("b", 0), 0),
+        ("pair", ("b", 1)),
+        ("compared", ("b", 1), 0),
+        ("error", ("b", 1)),
+        ("exit", ("b",)),
+        ("exit", ()),
+        ("finish", 1),
+    ]
+
+
+def test_unpack_errors():
+    def unpack_fn(pair, /):
+        if not pair.index:
+            return iter([api.Pair(index=(0,), actual=None, expected=None), Exception()])
+        return Exception()
+
+    h = RecordingHooks()
+    api.compare(None, None, unpack_fns=[unpack_fn], equal_fns=[], hooks=h)
+
+    assert [e for e in h.events if e[0] == "error"] == [("error", (0,)), ("error", ())]
+
+
+def test_async_results():
+    async def unpack_fn(pair, /):  # pragma: no cover
+        return None
+
+    async def equal_fn(pair, /):  # pragma: no cover
+        return True
+
+    for unpack_fns, equal_fns in [([unpack_fn], []), ([], [equal_fn])]:
+        h = RecordingHooks()
+        errors = api.compare(
+            None, None, unpack_fns=unpack_fns, equal_fns=equal_fns, hooks=h
+        )
+
+        assert isinstance(errors[0].exception, api.CompyreError)
+        assert ("error", ()) in h.events
+
+
+def test_cached_errors():
+    cache = CompareCache()
+    actual = {"a": [0, 1]}
+    expected = {"a": [0, 2]}
+    api.compare(
+        actual, expected, unpack_fns=UNPACK_FNS, equal_fns=EQUAL_FNS, cache=cache
+    )
+
+    h = RecordingHooks()
+    api.compare(
+        actual,
+        expected,
+        unpack_fns=UNPACK_FNS,
+        equal_fns=EQUAL_FNS,
+        cache=cache,
+        hooks=h,
+    )
+
+    assert h.events == [("error", ("a", 1)), ("finish", 1)]
+
+
+def test_cost():
+    h = RecordingHooks()
+
+    api.compare(
+        [0, [1]],
+        [0, [1]],
+        unpack_fns=UNPACK_FNS,
+        equal_fns=EQUAL_FNS,
+        cost=api.estimate_cost,
+        hooks=h,
+    )
+
+    assert {e for e in h.events if e[0] == "exit"} == {("exit", ()), ("exit", (1,))}
+
+
+class TestProgressHooks:
+    def test_final(self):
+        reports = []
+
+        api.compare(
+            [np.zeros(3), 1, b"abcd"],
+            [np.zeros(3), 2, b"abcd"],
+            unpack_fns=UNPACK_FNS,
+            equal_fns=EQUAL_FNS,
+            hooks=hooks.ProgressHooks(reports.append, interval=float("inf")),
+        )
+
+        assert len(reports) == 1
+        report = reports[0]
+        assert report.pairs == 4
+        assert report.nbytes == 28
+        assert report.errors == 1
+        assert report.elapsed >= 0
+        assert report.finished
+
+    def test_throttle(self):
+        reports = []
+
+        api.compare(
+            list(range(5)),
+            list(range(5)),
+            unpack_fns=UNPACK_FNS,
+            equal_fns=EQUAL_FNS,
+            hooks=hooks.ProgressHooks(reports.append, interval=0),
+        )
+
+        assert [r.pairs for r in reports] == [2, 3, 4, 5, 6, 6]
+        assert [r.finished for r in reports] == [False] * 5 + [True]
+
+    def test_not_started(self):
+        reports = []
+        hooks.ProgressHooks(reports.append).on_finish([])
+
+        assert reports[0].elapsed == 0
+
+
+class Bar:
+    def __init__(self):
+        self.n = 0
+        self.postfix = None
+
+    def update(self, n):
+        self.n += n
+
+    def set_postfix(self, **kwargs):
+        self.postfix = kwargs
+
+
+@pytest.mark.parametrize("interval", [0, float("inf")])
+def test_tqdm_hooks(interval):
+    bar = Bar()
+
+    api.compare(
+        [0, 1],
+        [0, 2],
+        unpack_fns=UNPACK_FNS,
+        equal_fns=EQUAL_FNS,
+        hooks=hooks.TqdmHooks(bar, interval=interval),
+    )
+
+    assert bar.n == 3
+    assert bar.postfix == {"nbytes": 0, "errors": 1, "refresh": False}
@@ -0,0 +1,104 @@
+import dataclasses
+import json
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from compyre import api, builtin, snapshot
+
+
+@dataclasses.dataclass
+class Object:
+    foo: str
+
+
+def make_value():
+    return {
+        "config": {"lr": 0.1, "name": "foo", "flags": [True, None], 0: "zero"},
+        "weights": (np.zeros(3), np.arange(4).reshape(2, 2)),
+        "object": Object(foo="bar"),
+        "set": {1, 2},
+    }
+
+
+def test_roundtrip(tmp_path):
+    value = make_value()
+
+    snapshot.save_snapshot(value, tmp_path)
+
+    snapshot.assert_snapshot(value, tmp_path)
+
+
+def test_structure(tmp_path):
+    snapshot.save_snapshot(make_value(), tmp_path)
+
+    loaded = snapshot.load_snapshot(tmp_path)
+
+    assert list(loaded.keys()) == ["config", "weights", "object", "set"]
+    assert loaded["config"][0] == "zero"
+    assert len(loaded["weights"]) == 2
+    assert isinstance(loaded["weights"][0], np.memmap)
+    assert loaded["object"] == Object(foo="bar")
+    assert loaded["config"]["flags"][:] == [True, None]
+    assert "keys" in repr(loaded)
+    assert "len" in repr(loaded["weights"])
+
+
+def test_deduplication(tmp_path):
+    array = np.ones(3)
+    snapshot.save_snapshot([array, array.copy(), "inline", Object(foo="bar")], tmp_path)
+    snapshot.save_snapshot([array, Object(foo="bar")], tmp_path / "other")
+    snapshot.save_snapshot([array, Object(foo="bar")], tmp_path)
+
+    assert len(list((tmp_path / "objects").iterdir())) == 2
+
+
+def test_lazy(tmp_path):
+    snapshot.save_snapshot({"a": np.zeros(3), "b": np.ones(3)}, tmp_path)
+
+    with mock.patch("numpy.load", wraps=np.load) as load:
+        loaded = snapshot.load_snapshot(tmp_path)
+        assert load.call_count == 0
+
+        errors = api.compare(
+            np.zeros(3),
+            loaded["a"],
+            unpack_fns=[],
+            equal_fns=[builtin.equal_fns.numpy_ndarray],
+        )
+        assert not errors
+        assert load.call_count == 1
+
+
+def test_mismatch(tmp_path):
+    snapshot.save_snapshot(make_value(), tmp_path)
+
+    actual = make_value()
+    actual["weights"][0][1] = 1.0
+    actual["config"]["name"] = "baz"
+
+    errors = snapshot.compare_to_snapshot(actual, tmp_path)
+    assert [e.pair.index for e in errors] == [("config", "name"), ("weights", 0)]
+
+    with pytest.raises(AssertionError, match="2 error"):
+        snapshot.assert_snapshot(actual, tmp_path)
+
+
+def test_version(tmp_path):
+    snapshot.save_snapshot(None, tmp_path)
+    file = tmp_path / "tree.json"
+    file.write_text(json.dumps({**json.loads(file.read_text()), "version": -1}))
+
+    with pytest.raises(ValueError, match="version"):
+        snapshot.load_snapshot(tmp_path)
+
+
+def test_failed_write(tmp_path):
+    with mock.patch.object(
+        snapshot.os, "replace", side_effect=RuntimeError("sentinel")
+    ):
+        with pytest.raises(RuntimeError, match="sentinel"):
+            snapshot.save_snapshot(Object(foo="bar"), tmp_path)
+
+    assert not list((tmp_path / "objects").iterdir())